@@ -0,0 +1,89 @@
+"""
+Compare the json codecs on production-shaped payloads...
+    python -m benchmarks.json_codec_benchmark
+"""
+
+# SYSTEM
+import timeit
+from itertools import cycle, islice
+
+# PACKAGE
+from clarifai_python_sdk.utils.json_codec import JSON_CODECS, get_json_codec
+from clarifai_python_sdk.errors import UserError
+
+# TEST DATA
+from tests.data import GetTestData
+
+
+NUMBER_OF_RUNS = 20
+
+
+def _inputs_add_body() -> dict:
+    """Inputs.add body with 128 base64 images, the endpoint limit"""
+    base64_inputs = [input for input in GetTestData('inputs__add__images')() if input.get('image', {}).get('base64')]
+
+    return {
+        'user_app_id': {'user_id': 'me', 'app_id': 'benchmark'},
+        'inputs': [{'data': input} for input in islice(cycle(base64_inputs), 128)]
+    }
+
+
+def _inputs_list_response(number_of_inputs: int = 1000) -> dict:
+    """inputs__list page as returned by the API"""
+    return {
+        'status': {'code': 10000, 'description': 'Ok', 'req_id': 'c3a432aabe3c5'},
+        'inputs': [
+            {
+                'id': f'{idx:032x}',
+                'data': {
+                    'image': {
+                        'url': f'https://images.unsplash.com/photo-{idx}?crop=entropy&cs=tinysrgb&fm=jpg&q=80',
+                        'hosted': {
+                            'prefix': 'https://s3.amazonaws.com/clarifai-api/img3/prod',
+                            'suffix': f'e303707711a3413f950d5d2e61bfccfc/{idx:032x}',
+                            'sizes': ['orig', 'tiny', 'small', 'large']
+                        },
+                        'image_info': {'width': 3329, 'height': 4993, 'format': 'JPEG', 'color_mode': 'YUV'}
+                    },
+                    'concepts': [{'id': 'horse', 'name': 'horse', 'value': 1, 'app_id': 'benchmark'}]
+                },
+                'created_at': '2022-08-15T12:07:02.944342Z',
+                'modified_at': '2022-08-15T12:07:13.769193Z',
+                'status': {'code': 30000, 'description': 'Download complete'}
+            }
+            for idx in range(number_of_inputs)
+        ]
+    }
+
+
+def _time(fn: callable) -> float:
+    """Best of 3, in milliseconds per call"""
+    return min(timeit.repeat(fn, number=NUMBER_OF_RUNS, repeat=3)) / NUMBER_OF_RUNS * 1000
+
+
+def main():
+    request_body  = _inputs_add_body()
+    response_body = _inputs_list_response()
+
+    codecs = []
+    for codec_name in JSON_CODECS:
+        try:
+            codecs.append(get_json_codec(codec_name))
+        except UserError:
+            print(f'{codec_name}: not installed, skipped')
+
+    print(f'{"codec":<8} {"add body dumps":>15} {"list page loads":>16} {"list page .json":>16}   (ms per call)')
+
+    for codec in codecs:
+        encoded_response = codec.dumps(response_body)
+
+        print(
+            f'{codec.name:<8}'
+            f' {_time(lambda: codec.dumps(request_body)):>15.2f}'
+            f' {_time(lambda: codec.loads(encoded_response)):>16.2f}'
+            f' {_time(lambda: codec.dumps_to_str(response_body, pretty=True)):>16.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
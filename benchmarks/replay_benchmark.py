@@ -0,0 +1,74 @@
+"""
+Client-side cost of MakeClarifaiRequest, ResponseWrapper and the Usage aggregators, replaying a cassette
+so that no time is spent waiting on the API...
+    python -m benchmarks.replay_benchmark
+    python -m benchmarks.replay_benchmark --cassette traffic.jsonl.gz --profile
+
+Without --cassette, a session is first recorded against the in-process fake Clarifai API.
+A recorded cassette is replayed with the calls below, which are the ones it has to contain.
+"""
+
+# SYSTEM
+import time, cProfile, pstats, argparse
+
+# PACKAGE
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.fake_server import FakeClarifaiServer
+from clarifai_python_sdk.cassette import Cassette, RecordingTransport, ReplayTransport
+
+
+PREDICT_INPUTS = [{'image': {'url': f'https://samples.clarifai.com/benchmark/{idx}.jpg'}} for idx in range(32)]
+
+
+def _session(clarifai: ClarifaiApi) -> None:
+    clarifai.models.predict(PREDICT_INPUTS, 'general-image-recognition')
+    clarifai.inputs.list_all()
+    clarifai.concepts.list_all()
+    clarifai.usage.historical(start_date='2021-01-01', end_date='2021-12-31')
+    clarifai.usage.historical_by_apps(start_date='2021-01-01', end_date='2021-12-31')
+    clarifai.usage.historical_by_date(start_date='2021-01-01', end_date='2021-12-31')
+
+
+def _record(args: argparse.Namespace) -> Cassette:
+    cassette = Cassette()
+    server   = FakeClarifaiServer({'num_inputs': args.inputs, 'seed': 0})
+
+    with ClarifaiApi('token', app_id='fake-app', transport=RecordingTransport(cassette, server.transport())) as clarifai:
+        _session(clarifai)
+
+    return cassette
+
+
+def _replay(cassette: Cassette, rounds: int) -> float:
+    clarifai = ClarifaiApi('token', app_id='fake-app', transport=ReplayTransport(cassette, repeat=True))
+
+    started_at = time.perf_counter()
+
+    for _ in range(rounds):
+        _session(clarifai)
+
+    return (time.perf_counter() - started_at) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--cassette', help='cassette recorded with RecordingTransport, defaults to a fake API session')
+    parser.add_argument('--rounds', type=int, default=20, help='replays of the whole session')
+    parser.add_argument('--inputs', type=int, default=5000, help='inputs in the fake app, used by list_all')
+    parser.add_argument('--profile', action='store_true', help='print the functions the replays spent the most time in')
+    args = parser.parse_args()
+
+    cassette = Cassette.load(args.cassette) if args.cassette else _record(args)
+
+    print(f'{len(cassette.entries)} recorded requests: {dict(cassette.endpoints())}')
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(_replay, cassette, args.rounds)
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(25)
+    else:
+        print(f'{_replay(cassette, args.rounds) * 1000:.1f} ms per session, client side only')
+
+
+if __name__ == '__main__':
+    main()
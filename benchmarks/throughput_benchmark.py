@@ -0,0 +1,78 @@
+"""
+Requests per second of the sync and async clients against the in-process fake Clarifai API, no network needed...
+    python -m benchmarks.throughput_benchmark
+    python -m benchmarks.throughput_benchmark --latency 0.02 --requests 500
+"""
+
+# SYSTEM
+import time, asyncio, argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# PACKAGE
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.fake_server import FakeClarifaiServer
+
+
+PREDICT_INPUTS = [{'image': {'url': f'https://samples.clarifai.com/benchmark/{idx}.jpg'}} for idx in range(32)]
+
+
+def _fake_server_config(args: argparse.Namespace) -> dict:
+    return {'latency': args.latency, 'num_inputs': args.inputs, 'seed': 0}
+
+
+def _sync_predicts(args: argparse.Namespace) -> float:
+    clarifai = ClarifaiApi('token', app_id='fake-app', transport=FakeClarifaiServer(_fake_server_config(args)).transport())
+
+    started_at = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(lambda _: clarifai.models.predict(PREDICT_INPUTS, 'general-image-recognition'), range(args.requests)))
+
+    return args.requests / (time.perf_counter() - started_at)
+
+
+def _async_predicts(args: argparse.Namespace) -> float:
+    async def run() -> float:
+        transport = FakeClarifaiServer(_fake_server_config(args)).async_transport()
+
+        async with AsyncClarifaiApi('token', app_id='fake-app', transport=transport) as clarifai:
+            semaphore = asyncio.Semaphore(args.concurrency)
+
+            async def predict():
+                async with semaphore:
+                    await clarifai.models.predict(PREDICT_INPUTS, 'general-image-recognition')
+
+            started_at = time.perf_counter()
+            await asyncio.gather(*[predict() for _ in range(args.requests)])
+
+            return args.requests / (time.perf_counter() - started_at)
+
+    return asyncio.run(run())
+
+
+def _sync_list_all(args: argparse.Namespace) -> float:
+    clarifai = ClarifaiApi('token', app_id='fake-app', transport=FakeClarifaiServer(_fake_server_config(args)).transport())
+
+    started_at = time.perf_counter()
+    clarifai.inputs.list_all()
+
+    return args.inputs / (time.perf_counter() - started_at)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added by the fake API to every response')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--inputs', type=int, default=5000, help='inputs in the fake app, used by list_all')
+    args = parser.parse_args()
+
+    print(f'{"scenario":<28} {"throughput":>12}')
+    print(f'{"sync predict (32 inputs)":<28} {_sync_predicts(args):>8.0f} rq/s')
+    print(f'{"async predict (32 inputs)":<28} {_async_predicts(args):>8.0f} rq/s')
+    print(f'{"sync inputs.list_all":<28} {_sync_list_all(args):>8.0f} inputs/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Per-call cost of building endpoint urls with UrlHandler...
+    python -m benchmarks.url_benchmark
+    python -m benchmarks.url_benchmark --calls 1000000
+"""
+
+# SYSTEM
+import timeit, argparse
+
+# UTILS
+from clarifai_python_sdk.utils.url_handler import UrlHandler
+
+
+SCENARIOS = (
+    (
+        'models__predict',
+        {'model_id': 'general-image-recognition', 'model_version_id': 'aa7f35c01e0642fda5cf400f543e7c40'},
+        None
+    ),
+    (
+        'inputs__list',
+        {'user_id': 'me', 'app_id': 'my-app'},
+        {'page': 2, 'per_page': 100}
+    ),
+    (
+        'inputs__list',
+        {'user_id': 'me', 'app_id': 'my app/with spaces'}, # percent-encoded
+        {'page': None, 'per_page': 100}
+    )
+)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=200000)
+    args = parser.parse_args()
+
+    print(f'{"endpoint":<18} {"per call":>10}  url')
+
+    for endpoint_name, path_variables, query_params in SCENARIOS:
+        seconds = min(timeit.repeat(
+            lambda: UrlHandler.build(endpoint_name, path_variables, query_params),
+            number=args.calls,
+            repeat=3
+        ))
+
+        url = UrlHandler.build(endpoint_name, path_variables, query_params)
+
+        print(f'{endpoint_name:<18} {seconds / args.calls * 1e9:>7.0f} ns  {url}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+# SYSTEM 
+
+# PACKAGE
+from clarifai_python_sdk.response import ResponseWrapper
+from clarifai_python_sdk.make_clarifai_request import AsyncMakeClarifaiRequest
+from clarifai_python_sdk.async_http_client import AsyncHttpClient
+from clarifai_python_sdk.transport import AsyncTransport
+from clarifai_python_sdk.rate_limiter import RateLimiter
+from clarifai_python_sdk.hedging import RequestHedger
+from clarifai_python_sdk.coalescing import RequestCoalescer
+from clarifai_python_sdk.cache import ResponseCache, PredictCache
+from clarifai_python_sdk.circuit_breaker import CircuitBreakerRegistry
+from clarifai_python_sdk.hooks import RequestHooks
+from clarifai_python_sdk.metrics import MetricsRegistry
+from clarifai_python_sdk.batch_predict import BatchPredictor
+from clarifai_python_sdk.image_preprocessing import ImagePreprocessor
+from clarifai_python_sdk.predict_batcher import AsyncPredictBatcher
+
+# MODULES
+from clarifai_python_sdk.async_modules.apps     import AsyncApps
+from clarifai_python_sdk.async_modules.models   import AsyncModels
+from clarifai_python_sdk.async_modules.inputs   import AsyncInputs
+from clarifai_python_sdk.async_modules.concepts import AsyncConcepts
+from clarifai_python_sdk.async_modules.usage    import AsyncUsage
+from clarifai_python_sdk.async_modules.transfer import AsyncTransfer
+
+# UTILS
+from clarifai_python_sdk.utils.json_codec import get_json_codec
+
+# CONSTANTS
+from clarifai_python_sdk.constants import API_BASE_URL
+from clarifai_python_sdk.endpoints import ENDPOINTS
+
+
+class AsyncClarifaiApi:
+    """
+    asyncio counterpart of ClarifaiApi, every module method has to be awaited...
+        async with AsyncClarifaiApi(token=...) as clarifai:
+            response = await clarifai.models.predict(inputs, model_id)
+    """
+
+    def __init__(
+        self,
+        token: str,
+        user_id: str = None,
+        app_id: str = None,
+        base_url: str = None,
+        http_config: dict = None,
+        retry_config: dict = None,
+        rate_limit_config: dict = None,
+        json_codec: str = 'auto',
+        response_config: dict = None,
+        compression_config: dict = None,
+        hedge_config: dict = None,
+        circuit_breaker_config: dict = None,
+        coalesce_config: dict = None,
+        cache_config: dict = None,
+        timeout: float = None,
+        transport: AsyncTransport = None,
+        hooks: list = None,
+        metrics_config: dict = None,
+        batch_predict_config: dict = None,
+        preprocess_config: dict = None,
+        predict_cache_config: dict = None,
+        predict_batcher_config: dict = None,
+        **kwargs
+    ) -> None:
+        """
+        Args:
+            See ClarifaiApi
+        """
+
+        self._token    = token
+        self._user_id  = user_id or 'me'
+        self._app_id   = app_id
+        self._base_url = base_url or API_BASE_URL
+
+        self._json_codec        = get_json_codec(json_codec)
+        self._request_hedger    = RequestHedger(hedge_config)
+        self._request_coalescer = RequestCoalescer(coalesce_config)
+        self._batch_predictor   = BatchPredictor(batch_predict_config)
+        self.image_preprocessor = ImagePreprocessor(preprocess_config) if preprocess_config is not None else None
+        self.predict_cache      = PredictCache(predict_cache_config) if predict_cache_config is not None else None
+        self.cache              = ResponseCache(cache_config) if cache_config is not None else None
+        self._circuit_breakers  = CircuitBreakerRegistry(circuit_breaker_config) if circuit_breaker_config is not None else None
+        self._hooks             = RequestHooks(hooks)
+        self.metrics            = MetricsRegistry(metrics_config, app_id) if metrics_config is not None else None
+        self._rate_limiter      = RateLimiter(rate_limit_config) if rate_limit_config is not None else None
+        self._http_client       = AsyncHttpClient(
+            base_url=self._base_url,
+            http_config=http_config,
+            retry_config=retry_config,
+            json_codec=self._json_codec,
+            compression_config=compression_config,
+            rate_limiter=self._rate_limiter,
+            transport=transport
+        )
+
+        if self.metrics is not None:
+            self._hooks.add(self.metrics)
+
+        params = { 
+            'base_url': self._base_url,
+            'http_client': self._http_client,
+            'json_codec': self._json_codec,
+            'response_config': response_config or {},
+            'request_hedger': self._request_hedger,
+            'request_coalescer': self._request_coalescer,
+            'batch_predictor': self._batch_predictor,
+            'image_preprocessor': self.image_preprocessor,
+            'predict_cache': self.predict_cache,
+            'response_cache': self.cache,
+            'circuit_breakers': self._circuit_breakers,
+            'timeout': timeout,
+            'hooks': self._hooks,
+            'token': self._token,
+            'user_id': self._user_id,
+            'app_id': self._app_id,
+            'endpoints': ENDPOINTS,
+        }
+
+        params['user_app_id'] = {
+            **({'user_id': self._user_id} if self._user_id else {}),
+            **({'app_id': self._app_id} if self._app_id else {})
+        }
+        
+        self.params = params
+ 
+        self.apps     = AsyncApps(params)
+        self.models   = AsyncModels(params)
+        self.inputs   = AsyncInputs(params)
+        self.concepts = AsyncConcepts(params)
+        self.usage    = AsyncUsage(params)
+        self.transfer = AsyncTransfer(
+            params, 
+            other_modules={'module_models': self.models, 'module_inputs': self.inputs, 'module_concepts': self.concepts}
+        )
+
+        self.predict_batcher = AsyncPredictBatcher(self.models, predict_batcher_config)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close every pooled connection
+        """
+        await self.predict_batcher.close()
+        await self._http_client.close()
+        self._request_hedger.close()
+        self._batch_predictor.close()
+
+        if self.image_preprocessor is not None:
+            self.image_preprocessor.close()
+
+        if self.cache is not None:
+            self.cache.close()
+
+        if self.predict_cache is not None:
+            self.predict_cache.close()
+
+    def circuit_breaker_states(self) -> dict:
+        """
+        State of every endpoint circuit breaker used so far
+
+        Returns:
+            (dict): {'models__predict': {'state': 'closed', 'consecutive_failures': 0, 'error_rate': 0.0, ...}, ...}
+        """
+        return self._circuit_breakers.states() if self._circuit_breakers else {}
+
+    def add_hook(self, hook: callable) -> callable:
+        """
+        Call `hook` with a hooks.RequestEvent after every request (endpoint, phase timings, bytes, statuses,
+        retries...). Hooks run inline, on the thread or event loop that made the request, keep them cheap.
+        Can be used as a decorator.
+
+        Returns:
+            (callable): hook
+        """
+        return self._hooks.add(hook)
+
+    def remove_hook(self, hook: callable) -> None:
+        self._hooks.remove(hook)
+
+    async def me(self, auth_object: dict = {}, timeout: float = None) -> ResponseWrapper:
+        """
+        Who am I? 
+
+        Args:
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object): ResponseWrapper
+        """
+
+        response_object = await AsyncMakeClarifaiRequest(
+            endpoint_index_name="me",
+            method="GET",
+            auth_object=auth_object,
+            package_params=self.params,
+            timeout=timeout
+        )
+
+        return ResponseWrapper(self.params, response_object=response_object)
@@ -0,0 +1,193 @@
+# SYSTEM IMPORTS
+import json, time, asyncio
+
+# PACKAGES
+try:
+    import aiohttp
+except ImportError: # only required by AsyncClarifaiApi
+    aiohttp = None
+
+# PACKAGE
+from clarifai_python_sdk.http_client import BaseHttpClient
+from clarifai_python_sdk.deadline import Deadline
+from clarifai_python_sdk.transport import AsyncTransport, TransportResponse
+
+# ERRORS
+from clarifai_python_sdk.errors import UserError, DeadlineExceededError
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_HTTP_CONFIG
+
+
+class AiohttpTransport(AsyncTransport):
+    """
+    Default asyncio transport, keeps one aiohttp.ClientSession for every request made through it
+    """
+
+    def __init__(self, http_config: dict = None):
+        if aiohttp is None:
+            raise UserError('AsyncClarifaiApi requires the "aiohttp" package, install it with `pip install aiohttp`')
+
+        self.http_config = {**DEFAULT_HTTP_CONFIG, **(http_config or {})}
+
+        self._session = None
+
+    @property
+    def retryable_exceptions(self) -> tuple:
+        return (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        # aiohttp sessions have to be created from within a running event loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.http_config['pool_connections'] * self.http_config['pool_maxsize'],
+                limit_per_host=self.http_config['pool_maxsize']
+            )
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.http_config['connect_timeout'],
+                sock_read=self.http_config['read_timeout']
+            )
+
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+        return self._session
+
+    def _get_timeout(self, timeout: float = None) -> dict:
+        # the session timeout applies when no total timeout is given
+        if timeout is None:
+            return {}
+
+        return {'timeout': aiohttp.ClientTimeout(
+            total=timeout,
+            sock_connect=self.http_config['connect_timeout'],
+            sock_read=self.http_config['read_timeout']
+        )}
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        data: bytes = None,
+        timeout: float = None,
+        request_info: dict = None
+        ) -> TransportResponse:
+
+        async with self._get_session().request(method, url, headers=headers, data=data, **self._get_timeout(timeout)) as r:
+            return TransportResponse(r.status, r.headers, await r.read())
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+
+class AsyncHttpClient(BaseHttpClient):
+    """
+    asyncio counterpart of HttpClient, sends every request through one AsyncTransport (AiohttpTransport by default).
+    A single instance is owned by AsyncClarifaiApi and shared by all async modules.
+    """
+
+    def __init__(self, base_url: str, transport: AsyncTransport = None, **kwargs):
+        super().__init__(base_url, **kwargs)
+
+        self.transport = transport or AiohttpTransport(self.http_config)
+
+    async def close(self) -> None:
+        await self.transport.close()
+
+    async def download(self, url: str, deadline: Deadline = None) -> bytes:
+        r = await self.transport.send('GET', url, {}, timeout=deadline.cap() if deadline else None)
+
+        return r.content
+
+    async def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        token: str,
+        body: dict = None,
+        idempotent: bool = None,
+        accept_compressed: bool = False,
+        request_info: dict = None,
+        deadline: Deadline = None,
+        headers: dict = None
+        ) -> json:
+        """
+        Args:
+            See HttpClient.make_request
+        """
+
+        method       = method.lower()
+        request_info = request_info if request_info is not None else {}
+        args         = self._build_request_args(method, token, body, accept_compressed, request_info)
+
+        if headers:
+            args['headers'].update(headers)
+
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            if deadline:
+                deadline.check(endpoint)
+
+            if self.rate_limiter:
+                waited = await self.rate_limiter.acquire_async(token, request_info.get('endpoint_index_name'), deadline)
+                self._add_timing(request_info, 'rate_limit_wait', waited)
+
+            sent_at = time.perf_counter()
+
+            try:
+                r = await self.transport.send(
+                    method.upper(),
+                    self.base_url + endpoint,
+                    timeout=deadline.cap() if deadline else None,
+                    request_info=request_info,
+                    **args
+                )
+            except self.transport.retryable_exceptions as e:
+                self._add_timing(request_info, 'network', time.perf_counter() - sent_at)
+
+                if deadline and deadline.expired:
+                    raise DeadlineExceededError(deadline.timeout, endpoint) from e
+
+                backoff = self.retry_policy.get_backoff(attempt)
+
+                if not self.retry_policy.should_retry(attempt, method, idempotent, exception=e) \
+                    or not self._can_wait(backoff, deadline):
+                    raise
+
+                await asyncio.sleep(backoff)
+                self._add_timing(request_info, 'retry_wait', backoff)
+                continue
+
+            self._add_timing(request_info, 'network', time.perf_counter() - sent_at)
+
+            if r.status == 304: # conditional request, the caller holds the body
+                self._record_response_info(request_info, attempt, r.status, r.headers, 0)
+
+                return None
+
+            decode_started_at = time.perf_counter()
+
+            try:
+                response = self.json_codec.loads(r.content)
+            except ValueError:
+                response = None
+
+            self._add_timing(request_info, 'decode', time.perf_counter() - decode_started_at)
+
+            clarifai_status = response.get('status', {}).get('code') if isinstance(response, dict) else None
+
+            if self.retry_policy.should_retry(attempt, method, idempotent, r.status, clarifai_status):
+                backoff = self.retry_policy.get_backoff(attempt, r.headers.get('Retry-After'))
+
+                if self._can_wait(backoff, deadline):
+                    await asyncio.sleep(backoff)
+                    self._add_timing(request_info, 'retry_wait', backoff)
+                    continue
+
+            self._record_response_info(request_info, attempt, r.status, r.headers, len(r.content))
+
+            return response if response is not None else self.json_codec.loads(r.content)
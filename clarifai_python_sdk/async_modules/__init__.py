@@ -0,0 +1,6 @@
+from .apps     import AsyncApps
+from .concepts import AsyncConcepts
+from .inputs   import AsyncInputs
+from .models   import AsyncModels
+from .transfer import AsyncTransfer
+from .usage    import AsyncUsage
@@ -0,0 +1,95 @@
+# SYSTEM 
+from clarifai_python_sdk.make_clarifai_request import AsyncMakeClarifaiRequest
+from clarifai_python_sdk.response              import ResponseWrapper 
+from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
+from clarifai_python_sdk.deadline              import Deadline
+
+# ERRORS
+from clarifai_python_sdk.errors import DeadlineExceededError
+
+
+class AsyncConcepts:
+    def __init__(self, params: dict):
+        self.params = params
+    
+    async def list(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        auth_object: dict = {},
+        timeout: float = None
+    ) -> ResponseWrapper:
+        """
+        List concepts in app
+
+        Args:
+            page (str, optional): Defaults to 1.
+            per_page (str, optional): Defaults to 100.
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+
+        response_object = await AsyncMakeClarifaiRequest(
+            endpoint_index_name="concepts__list",
+            method="GET",
+            path_variables={**(auth_object.get('user_app_id', {}) or self.params['user_app_id'])},
+            query_params={
+                'page': page,
+                'per_page': per_page
+            },
+            auth_object=auth_object,
+            package_params=self.params,
+            timeout=timeout
+        )
+
+        return ResponseWrapper(self.params, response_object=response_object)
+
+    async def list_all(self, timeout: float = None) -> ResponseWrapper:
+        """
+        List all concepts in app
+
+        Args:
+            timeout (float, optional): Budget in seconds for the whole listing, pages fetched before it
+                runs out are returned with 'deadline_exceeded': True. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+        BATCH_SIZE = 100
+
+        current_page      = 1
+        concepts          = []
+        last_batch        = []
+        deadline          = Deadline.from_timeout(timeout if timeout is not None else self.params.get('timeout'))
+        deadline_exceeded = False
+
+        async def get_new_batch(page, per_page):
+            get_page = (await self.list(page=page, per_page=per_page, timeout=deadline)).response.dict
+
+            return get_page['concepts']
+        
+        try:
+            first_batch = await get_new_batch(current_page, BATCH_SIZE)
+            concepts.extend(first_batch)
+            last_batch = first_batch
+
+            while len(last_batch) == BATCH_SIZE:
+                current_page +=1
+                new_batch = await get_new_batch(current_page, BATCH_SIZE)
+                concepts.extend(new_batch)
+                last_batch = new_batch
+        except DeadlineExceededError:
+            deadline_exceeded = True
+
+        response_schema = {
+            'status': {
+                'code': ClarifaiStatusCodes.SUCCESS,
+                'description': 'Deadline exceeded, partial results' if deadline_exceeded else 'Ok'
+            },
+            **({'concepts': concepts} if concepts else {}),
+            **({'deadline_exceeded': True} if deadline_exceeded else {})
+        }
+
+        return ResponseWrapper(self.params, response_dict=response_schema)
@@ -0,0 +1,472 @@
+# SYSTEM IMPORTS
+import base64
+
+# PACKAGE
+from clarifai_python_sdk.make_clarifai_request import AsyncMakeClarifaiRequest
+from clarifai_python_sdk.response              import ResponseWrapper
+from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
+from clarifai_python_sdk.deadline              import Deadline
+
+# ERRORS
+from clarifai_python_sdk.errors import DeadlineExceededError
+
+# UTILS
+from clarifai_python_sdk.utils.filters     import Filters
+from clarifai_python_sdk.utils.url_handler import UrlHandler
+from clarifai_python_sdk.utils.decorators  import set_limits, handle_exception
+
+
+class AsyncSearch:
+    def __init__(self, params: dict):
+        self.params = params
+    
+    async def _ranks_request(
+        self,
+        ranks: list,
+        threshold: float or int,
+        page: str,
+        per_page: str,
+        auth_object: dict = {},
+        timeout: float = None
+        ) -> ResponseWrapper:
+
+        additional_params = {}
+
+        if threshold:
+            additional_params['min_value'] = threshold
+
+        body = { 
+            **UrlHandler.optional_pagination_object(page, per_page),
+            'searches': [{
+                'query': {
+                    'ranks': ranks
+                },
+                **additional_params
+            }]
+        }
+
+        response_object = await AsyncMakeClarifaiRequest(
+            endpoint_index_name="inputs__searches",
+            method="POST",
+            path_variables={**(auth_object.get('user_app_id', {}) or self.params['user_app_id']),},
+            body=body,
+            idempotent=True,
+            auth_object=auth_object,
+            package_params=self.params,
+            timeout=timeout
+        )
+
+        return ResponseWrapper(self.params, response_object=response_object)        
+
+    async def _filters_request(
+        self,
+        filters: list,
+        page: int,
+        per_page: int,
+        auth_object: dict = {},
+        timeout: float = None
+    ) -> ResponseWrapper:
+
+        body = { 
+            **UrlHandler.optional_pagination_object(page, per_page),
+            'searches': [{
+                'query': {
+                    'filters': filters
+                }
+            }]
+        }
+
+        response_object = await AsyncMakeClarifaiRequest(
+            endpoint_index_name="inputs__searches",
+            method="POST",
+            path_variables={**(auth_object.get('user_app_id', {}) or self.params['user_app_id']),},
+            body=body,
+            idempotent=True,
+            auth_object=auth_object,
+            package_params=self.params,
+            timeout=timeout
+        )
+
+        return ResponseWrapper(self.params, response_object=response_object)        
+
+    async def filter_by_custom_concept(
+        self,
+        concepts: list,
+        page: int = None, 
+        per_page: int = None,
+        auth_object: dict = {},
+        timeout: float = None
+    ) -> ResponseWrapper:
+        """
+        Search inputs annotated with given concept name and value
+
+        Args:
+            concepts (list): Should look like:
+                - [{"name": "sky", "value": 1}, ...] for positive annotations
+                - [{"name": "sky", "value": O}, ...] for negative annotations
+                - [{"name": "sky"}, ...] or without value
+            page (int, optional)
+            per_page (int, optional)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+
+        param_args = (page, per_page, auth_object, timeout)
+        
+        filters = [{
+            'annotation': {
+                'data': {
+                    'concepts': concepts
+                }
+            }
+        }]
+
+        return await self._filters_request(filters, *param_args)
+
+    async def rank_by_image(
+        self,
+        image_object: dict,
+        threshold: float or int = None,
+        page: int = None,
+        per_page: int = None,
+        auth_object: dict = {},
+        timeout: float = None
+    ) -> ResponseWrapper:
+        """
+        Rank by image based on visual similarity 
+
+        Args:
+            image_object (dict): Should look like...
+                - { 'url': {URL_STRING} } ...with urls
+                - { 'base64': {BASE64_STRING} } ...with base64
+            page (int, optional)
+            per_page (int, optional)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+ 
+        param_args = (threshold, page, per_page, auth_object, timeout)
+
+        ranks = [{
+            'annotation': {
+                'data': {
+                    'image': image_object
+                },
+            }
+        }]
+
+        return await self._ranks_request(ranks, *param_args)
+
+    async def rank_by_input_id(
+        self,
+        input_id: str,
+        threshold: float or int = None,
+        page: int = None,
+        per_page: int = None,
+        auth_object: dict = {},
+        timeout: float = None
+    ) -> ResponseWrapper:
+        """
+        Rank by input id based on visual similarity
+
+        Args:
+            input_id (str)
+            threshold (float or int, optional)
+            page (int, optional)
+            per_page (int, optional)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+
+        param_args = (threshold, page, per_page, auth_object, timeout)
+
+        ranks = [{
+            'annotation': {
+                'input_id': input_id
+            }
+        }]
+
+        return await self._ranks_request(ranks, *param_args)
+
+
+class AsyncInputs:
+    def __init__(self, params: dict):
+        self.params = params
+        self.search = AsyncSearch(params)
+
+    @handle_exception
+    @set_limits({ 'inputs': (128, 1) })
+    async def add(
+        self,
+        inputs: list,
+        auth_object: dict = {},
+        timeout: float = None
+        ) -> ResponseWrapper:
+        """Add inputs to Clarifai App
+
+        Args:
+            inputs (list): List of input objects
+                            - See example of input objects in data/inputs/add_mock.py
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) ResponseWrapper
+        """
+
+        # downloads and the request share the same budget
+        deadline = Deadline.from_timeout(timeout if timeout is not None else self.params.get('timeout'))
+
+        for input in inputs:
+            input_type = 'image' if input.get('image') else 'video'
+            if input.get('convert_src_to_base64'):
+                content = await self.params['http_client'].download(input[input_type]['url'], deadline=deadline)
+                input[input_type]['base64'] = base64.b64encode(content).decode('ascii')
+                del input[input_type]['url']
+                del input['convert_src_to_base64']
+
+        if self.params.get('image_preprocessor') is not None:
+            inputs = await self.params['image_preprocessor'].process_inputs_async(inputs)
+        
+        clarifai_api_final_formatting = list(map(lambda input: {'data': input}, inputs))
+
+        body = { 
+            'user_app_id': auth_object.get('user_app_id', self.params['user_app_id']),
+            'inputs': clarifai_api_final_formatting
+        }
+
+        response_object = await AsyncMakeClarifaiRequest(
+            endpoint_index_name="inputs__post",
+            method="POST",
+            body=body,
+            auth_object=auth_object,
+            package_params=self.params,
+            timeout=deadline
+        )
+
+        return ResponseWrapper(self.params, response_object=response_object)
+    
+    async def list(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        auth_object: dict = {},
+        timeout: float = None
+    ) -> ResponseWrapper:
+        """
+        List Inputs
+
+        Args:
+            page (int, optional): Defaults to 1.
+            per_page (int, optional): Defaults to 100.
+            auth_object (dict, optional):  Defaults to {}.
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+        response_object = await AsyncMakeClarifaiRequest(
+            endpoint_index_name="inputs__list",
+            method="GET",
+            path_variables={**(auth_object.get('user_app_id', {}) or self.params['user_app_id'])},
+            query_params={
+                'page': page,
+                'per_page': per_page
+            },
+            auth_object=auth_object,
+            package_params=self.params,
+            timeout=timeout
+        )
+
+        return ResponseWrapper(self.params, response_object=response_object)
+
+    async def stream(
+        self,
+        per_page: int = 128,
+        last_id: int = None,
+        auth_object: dict = {},
+        timeout: float = None
+        ) -> ResponseWrapper:
+        """Streaming (paginating) inputs in given Clarifai app
+
+        Args:
+            per_page (int, optional): Defaults to 128.
+            last_id (int, optional): Defaults to None.
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+        response_object = await AsyncMakeClarifaiRequest(
+            endpoint_index_name="inputs__stream",
+            method="GET",
+            path_variables={**(auth_object.get('user_app_id', {}) or self.params['user_app_id'])},
+            query_params={
+                'per_page': per_page,
+                'last_id': last_id
+            },
+            auth_object=auth_object,
+            package_params=self.params,
+            timeout=timeout
+        )
+
+        return ResponseWrapper(self.params, response_object=response_object)
+
+    async def list_all(self, timeout: float = None) -> ResponseWrapper:
+        """Lists all inputs objects in app
+
+        - Not recommended for large apps as output would be potentially too big
+
+        Args:
+            timeout (float, optional): Budget in seconds for the whole listing, inputs streamed before it
+                runs out are returned with 'deadline_exceeded': True. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+        PER_PAGE                   = 100  
+        LAST_BATCH_COUNT_SHOULD_BE = PER_PAGE
+
+        inputs                    = []
+        last_batch                = []
+        is_listing_success        = True
+        deadline                  = Deadline.from_timeout(timeout if timeout is not None else self.params.get('timeout'))
+        deadline_exceeded         = False
+
+        async def request_new_batch(**kwargs):
+            nonlocal last_batch, is_listing_success
+
+            stream_inputs_response = (await self.stream(per_page=PER_PAGE, timeout=deadline, **kwargs)).response
+            # a failed page ends the listing, flag it instead of returning partial data as a success
+            is_listing_success     = stream_inputs_response.status_code == ClarifaiStatusCodes.SUCCESS
+            last_batch             = stream_inputs_response.dict.get('inputs', [])
+            inputs.extend(last_batch)
+
+        try:
+            await request_new_batch()
+
+            while len(last_batch) == LAST_BATCH_COUNT_SHOULD_BE:        
+                last_id = last_batch[-1]['id']
+                last_batch.clear()
+
+                # Provide last_id to get the next set of inputs.
+                await request_new_batch(last_id=last_id)
+        except DeadlineExceededError:
+            deadline_exceeded = True
+
+        response_schema = {
+             'status': {
+                'code': 10000 if is_listing_success else 10020,
+                **({'description': 'Deadline exceeded, partial results'} if deadline_exceeded else {})
+            },
+            **({'inputs': inputs} if inputs else {}),
+            **({'deadline_exceeded': True} if deadline_exceeded else {})
+        }
+
+        return ResponseWrapper(self.params, response_dict=response_schema)
+
+    @handle_exception
+    @set_limits({ 'inputs_ids': (128, 1) })
+    async def delete_by_ids(
+        self,
+        inputs_ids: list,
+        auth_object: dict = {},
+        timeout: float = None
+        ) -> ResponseWrapper:
+        """Delete a list of inputs by input_ids
+
+        Args:
+            inputs_ids (list)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+
+        body = { 
+            'user_app_id': auth_object.get('user_app_id', {}) or self.params['user_app_id'],
+            'ids': inputs_ids
+        }
+
+        response_object = await AsyncMakeClarifaiRequest(
+            endpoint_index_name="inputs__post",
+            method="DELETE",
+            path_variables={**(auth_object.get('user_app_id', {}) or self.params['user_app_id'])},
+            body=body,
+            auth_object=auth_object,
+            package_params=self.params,
+            timeout=timeout
+        )
+
+        return ResponseWrapper(self.params, response_object=response_object)
+
+    async def delete_all(self, timeout: float = None) -> ResponseWrapper:
+        """Deletes all app inputs by streaming
+
+        Args:
+            timeout (float, optional): Budget in seconds for the whole deletion, when it runs out the
+                number of inputs deleted so far is returned with 'deadline_exceeded': True. Defaults to the client timeout.
+                A failed deletion stops there too, its status is returned with the number of inputs deleted so far.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+        per_page                  = 100
+        last_batch_count_sould_be = per_page
+        last_batch                = []
+        number_of_deleted_inputs  = 0
+        deadline                  = Deadline.from_timeout(timeout if timeout is not None else self.params.get('timeout'))
+        deadline_exceeded         = False
+        failed_status             = None
+
+        async def request_new_batch(**kwargs):
+            nonlocal number_of_deleted_inputs, last_batch, failed_status
+
+            stream_inputs_response = (await self.stream(per_page=per_page, timeout=deadline, **kwargs)).response.dict
+            last_batch             = stream_inputs_response['inputs']
+            delete_response        = await self.delete_by_ids(Filters(last_batch).ids_from_input_objects(), timeout=deadline)
+
+            # delete_by_ids returns the error message instead of raising, see handle_exception
+            if isinstance(delete_response, str):
+                if deadline:
+                    deadline.check('inputs__post')
+
+                failed_status = {'code': ClarifaiStatusCodes.FAILURE, 'description': delete_response}
+            elif delete_response.response.status_code != ClarifaiStatusCodes.SUCCESS:
+                failed_status = delete_response.response.dict['status']
+
+            if failed_status:
+                last_batch = [] # nothing more is requested
+                return
+
+            number_of_deleted_inputs = number_of_deleted_inputs + len(last_batch) 
+
+        try:
+            await request_new_batch()
+
+            while len(last_batch) == last_batch_count_sould_be:        
+                last_id = last_batch[-1]['id']
+                last_batch.clear()
+
+                await request_new_batch(last_id=last_id)
+        except DeadlineExceededError:
+            deadline_exceeded = True
+
+        response_schema = {
+            'status': failed_status or {
+                'code': ClarifaiStatusCodes.SUCCESS,
+                **({'description': 'Deadline exceeded, partial results'} if deadline_exceeded else {})
+            },
+            'number_of_delete_inputs': number_of_deleted_inputs,
+            **({'deadline_exceeded': True} if deadline_exceeded else {})
+        }
+        
+        return ResponseWrapper(
+            self.params,
+            response_dict=response_schema
+        )
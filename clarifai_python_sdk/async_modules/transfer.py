@@ -0,0 +1,161 @@
+# SYSTEM
+
+# PACKAGE
+from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
+from clarifai_python_sdk.deadline import Deadline
+
+# ERRORS
+from clarifai_python_sdk.errors import UserError, DeadlineExceededError
+
+# MODULES
+from clarifai_python_sdk.modules.transfer import Transfer
+from clarifai_python_sdk.async_modules import AsyncModels, AsyncConcepts, AsyncInputs
+
+
+class AsyncTransfer:
+    def __init__(
+        self, 
+        params: dict,
+        other_modules: dict
+        ):
+        self.params = params
+
+        self.origin_auth_object = {}
+        self.to_auth_object     = {}
+
+        # following modules should not be instanciated, they only serve as representation
+        self.module_models   = AsyncModels   
+        self.module_concepts = AsyncConcepts
+        self.module_inputs   = AsyncInputs
+
+        for other_module in other_modules.items():
+            setattr(self, other_module[0], other_module[1])
+
+    def __call__(
+        self,
+        origin: dict,
+        to: dict
+        ):
+        """
+
+        Args:
+            origin (dict): From which user/app
+            to (dict): To which user/app
+
+        Returns:
+            self
+        """
+
+        self.origin_auth_object = {
+            'user_app_id': {
+                'user_id': origin['user_id'], 
+                'app_id': origin['app_id']
+            },
+            'token': origin['token']
+        }
+        self.to_auth_object = {
+            'user_app_id': {
+                'user_id': to['user_id'], 
+                'app_id': to['app_id']
+            },
+            'token': to['token']
+        }
+
+        return self
+
+    async def _list_inputs(
+        self,
+        page: int = 1,
+        per_page = 128,
+        auth_object: dict = {},
+        timeout: float = None
+    ) -> list:
+        kwargs = locals()
+        kwargs.pop('self')
+
+        response_list_inputs = (await self.module_inputs.list(**kwargs)).response.dict
+
+        return response_list_inputs.get('inputs', [])
+    
+    async def _upload_inputs(
+        self,
+        inputs: list,
+        auth_object: dict = {},
+        timeout: float = None
+    ) -> list:
+
+        response_upload_inputs = await self.module_inputs.add(inputs, auth_object, timeout=timeout)
+
+        # add returns the error message instead of raising, see handle_exception
+        if isinstance(response_upload_inputs, str):
+            if isinstance(timeout, Deadline):
+                timeout.check('inputs__post')
+
+            raise UserError(response_upload_inputs)
+
+        return response_upload_inputs.response.dict
+
+    async def inputs_all(
+        self,
+        keep_annotations: bool = True,
+        keep_metadata: bool = True,
+        timeout: float = None
+    ):
+        """
+        Copy every input of origin to the other app, page by page
+
+        Args:
+            keep_annotations (bool, optional): Defaults to True.
+            keep_metadata (bool, optional): Defaults to True.
+            timeout (float, optional): Budget in seconds for the whole transfer, when it runs out the pages
+                uploaded so far are returned followed by a {'deadline_exceeded': True} status object. Defaults to the client timeout.
+
+        Returns:
+            (list): Upload response of every page
+        """
+        PER_PAGE = 128
+
+        responses_stack = []
+        current_page = 1
+        last_batch   = []
+        deadline     = Deadline.from_timeout(timeout if timeout is not None else self.params.get('timeout'))
+
+        async def request_new_batch():
+            list_orgin_inputs_response = await self._list_inputs(
+                page=current_page,
+                per_page=PER_PAGE, 
+                auth_object=self.origin_auth_object,
+                timeout=deadline
+            )
+            
+            return list_orgin_inputs_response or []
+        
+        try:
+            last_batch = await request_new_batch()
+            current_page += 1
+            response = await self._upload_inputs(
+                Transfer._filter_input_objects(last_batch, keep_annotations, keep_metadata),
+                auth_object=self.to_auth_object,
+                timeout=deadline
+            )
+            responses_stack.append(response)
+
+            while len(last_batch) == PER_PAGE:
+                last_batch = await request_new_batch()
+                current_page += 1
+                response = await self._upload_inputs(
+                    Transfer._filter_input_objects(last_batch, keep_annotations, keep_metadata),
+                    auth_object=self.to_auth_object,
+                    timeout=deadline
+                )
+                responses_stack.append(response)
+        except DeadlineExceededError as e:
+            responses_stack.append({
+                'status': {
+                    'code': ClarifaiStatusCodes.FAILURE,
+                    'description': e.message
+                },
+                'deadline_exceeded': True
+            })
+
+        return responses_stack
@@ -0,0 +1,221 @@
+# PACKAGE
+from clarifai_python_sdk.response import ResponseWrapper
+from clarifai_python_sdk.make_clarifai_request import AsyncMakeClarifaiRequest
+
+# MODULES
+from clarifai_python_sdk.modules.usage import Usage, DEFAULT_TEMPLATE
+
+
+class AsyncUsage:
+    """
+    asyncio counterpart of Usage, aggregations are shared with the synchronous module
+    """
+
+    def __init__(self, params: dict):
+        self.params = params
+
+    async def _request_historical_usage(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        template: str = DEFAULT_TEMPLATE,
+        broken_down_per_app: bool = None,
+        auth_object: dict = {},
+        timeout: float = None,
+        **kwargs
+    ) -> ResponseWrapper:
+        template: dict = Usage._get_templates(template)
+
+        response_object = await AsyncMakeClarifaiRequest(
+            endpoint_index_name="usage__historical",
+            method="GET",
+            path_variables={**(auth_object.get('user_app_id', {}) or self.params['user_app_id'])},
+            query_params={
+                'start_date': start_date if start_date is not None else template['start_date'],
+                'end_date': end_date if end_date is not None else template['end_date'],
+                'broken_down_per_app': broken_down_per_app
+            },
+            auth_object=auth_object,
+            package_params=self.params,
+            timeout=timeout
+        )
+
+        return ResponseWrapper(self.params, response_object=response_object)
+
+    async def historical(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        template: str = DEFAULT_TEMPLATE,
+        timeout: float = None
+    ) -> ResponseWrapper:
+        """
+        Get historical usage (organized data) for specified timeframe, see Usage.historical
+
+        Args:
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+        kwargs: dict = locals()
+        kwargs.pop('self')
+
+        response_object = (await self._request_historical_usage(**kwargs)).response
+
+        return ResponseWrapper(
+            self.params,
+            response_dict=Usage._build_historical_schema(response_object, start_date, end_date, template)
+        )
+
+    async def historical_feed(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        template: str = DEFAULT_TEMPLATE,
+        broken_down_per_app: bool = None,
+        timeout: float = None
+    ) -> ResponseWrapper:
+        """
+        Get historical feed (unorganized data) usage for specified timeframe, see Usage.historical_feed
+
+        Args:
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+        kwargs: dict = locals()
+        kwargs.pop('self')
+
+        return await self._request_historical_usage(**kwargs)
+
+    async def historical_by_apps(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        template: str = DEFAULT_TEMPLATE,
+        timeout: float = None
+    ) -> ResponseWrapper:
+        """
+        Get historical usage broken down per app, see Usage.historical_by_apps
+
+        Args:
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+        kwargs = locals()
+        kwargs.pop('self')
+
+        response_object = (await self._request_historical_usage(broken_down_per_app=True, **kwargs)).response
+
+        return ResponseWrapper(
+            self.params,
+            response_dict=Usage._build_historical_by_apps_schema(response_object, start_date, end_date, template)
+        )
+
+    async def historical_by_apps_and_dates(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        template: str = None,
+        timeout: float = None
+    ) -> ResponseWrapper:
+        """
+        Get historical usage broken down apps then date, see Usage.historical_by_apps_and_dates
+
+        Args:
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+        kwargs = locals()
+        kwargs.pop('self')
+
+        response_object = (await self._request_historical_usage(broken_down_per_app=True, **kwargs)).response
+
+        return ResponseWrapper(
+            self.params,
+            response_dict=Usage._build_historical_by_apps_and_dates_schema(response_object, start_date, end_date, template)
+        )
+
+    async def historical_by_date(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        template: str = None,
+        timeout: float = None
+    ) -> ResponseWrapper:
+        """
+        Get historical usage broken down by date, see Usage.historical_by_date
+
+        Args:
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+        kwargs: dict = locals()
+        kwargs.pop('self')
+
+        response_object = (await self._request_historical_usage(**kwargs)).response
+
+        return ResponseWrapper(
+            self.params,
+            response_dict=Usage._build_historical_by_date_schema(response_object, start_date, end_date, template)
+        )
+
+    async def historical_by_date_and_apps(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        template: str = None,
+        timeout: float = None
+    ) -> ResponseWrapper:
+        """
+        Get historical usage broken down by date then app, see Usage.historical_by_date_and_apps
+
+        Args:
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+        kwargs: dict = locals()
+        kwargs.pop('self')
+
+        response_object = (await self._request_historical_usage(broken_down_per_app=True, **kwargs)).response
+
+        return ResponseWrapper(
+            self.params,
+            response_dict=Usage._build_historical_by_date_and_apps_schema(response_object, start_date, end_date, template)
+        )
+
+    async def total_ops(
+        self,
+        start_date: str = None,
+        end_date: str = None,
+        template: str = None,
+        timeout: float = None
+    ) -> ResponseWrapper:
+        """
+        Return the total number of operations used for time period provided, see Usage.total_ops
+
+        Args:
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
+        Returns:
+            (Object) - ResponseWrapper
+        """
+        kwargs = locals()
+        kwargs.pop('self')
+
+        response_object = (await self._request_historical_usage(broken_down_per_app=True, **kwargs)).response
+
+        return ResponseWrapper(
+            self.params,
+            response_dict=Usage._build_total_ops_schema(response_object, start_date, end_date, template)
+        )
@@ -0,0 +1,267 @@
+# SYSTEM
+import asyncio, threading
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# PACKAGE
+from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
+
+# ERRORS
+from clarifai_python_sdk.errors import UserError, PredictError
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_BATCH_PREDICT_CONFIG
+
+
+class PredictResult:
+    """
+    Outcome of one input of a batched predict: its output, or the error that prevented it
+    """
+
+    __slots__ = ('index', 'input', 'output', 'error')
+
+    def __init__(self, index: int, input: dict, output: dict = None, error: Exception = None):
+        self.index  = index # position in the inputs given
+        self.input  = input
+        self.output = output
+        self.error  = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return f'PredictResult(index={self.index}, ok={self.ok})'
+
+
+def iter_batches(inputs: iter, batch_size: int) -> iter:
+    """
+    Yields:
+        (tuple): (index of the first input, list of at most batch_size inputs), inputs are consumed lazily
+    """
+    inputs = iter(inputs)
+    start  = 0
+
+    while True:
+        batch = list(islice(inputs, batch_size))
+
+        if not batch:
+            return
+
+        yield start, batch
+
+        start += len(batch)
+
+
+def split_predict_response(start: int, batch: list, response: dict) -> list:
+    """
+    Outputs come back in the order of the inputs. A failed request fails each of its inputs, a mixed
+    status one only those whose output status is not SUCCESS.
+
+    Returns:
+        (list): One PredictResult per input of the batch
+    """
+    status  = response.get('status', {})
+    outputs = response.get('outputs') or []
+
+    if status.get('code') not in (ClarifaiStatusCodes.SUCCESS, ClarifaiStatusCodes.MIXED_STATUS) and not outputs:
+        error = PredictError(status)
+        return [PredictResult(start + idx, input, error=error) for idx, input in enumerate(batch)]
+
+    results = []
+
+    for idx, input in enumerate(batch):
+        output = outputs[idx] if idx < len(outputs) else None
+
+        if output is None:
+            error = PredictError({'code': ClarifaiStatusCodes.FAILURE, 'description': 'Output missing from the response'})
+        elif output.get('status', {}).get('code', ClarifaiStatusCodes.SUCCESS) != ClarifaiStatusCodes.SUCCESS:
+            error = PredictError(output['status'])
+        else:
+            error = None
+
+        results.append(PredictResult(start + idx, input, output, error))
+
+    return results
+
+
+class BatchPredictor:
+    """
+    Runs predict over any number of inputs: they are split into API-sized batches, sent concurrently
+    (threads of a pool shared by every call of the client, or tasks of the event loop) and gathered back
+    in input order (run) or streamed as they complete (iter_results). A failed batch fails its own inputs
+    only, see PredictResult.
+    """
+
+    def __init__(self, batch_predict_config: dict = None):
+        self.batch_predict_config = {**DEFAULT_BATCH_PREDICT_CONFIG, **(batch_predict_config or {})}
+
+        self._executor = None
+        self._lock     = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.batch_predict_config['max_workers'],
+                    thread_name_prefix='clarifai-predict'
+                )
+
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_limits(self, batch_size: int = None, max_workers: int = None) -> tuple:
+        batch_size  = batch_size or self.batch_predict_config['batch_size']
+        max_workers = max_workers or self.batch_predict_config['max_workers']
+
+        if batch_size < 1 or max_workers < 1:
+            raise UserError('batch_size and max_workers must be at least 1')
+
+        return batch_size, max_workers
+
+    @staticmethod
+    def _get_results(start: int, batch: list, future: 'Future or Task') -> list:
+        if future.exception() is not None:
+            return [PredictResult(start + idx, input, error=future.exception()) for idx, input in enumerate(batch)]
+
+        return split_predict_response(start, batch, future.result())
+
+    def iter_results(
+        self,
+        send: callable,
+        inputs: iter,
+        batch_size: int = None,
+        max_workers: int = None,
+        ordered: bool = True,
+        reorder_buffer: int = None
+        ) -> iter:
+        """
+        Args:
+            send (callable): Predicts one batch (list of inputs), returns the response dict
+            inputs (iterable): Any size, consumed lazily as workers free up
+            batch_size (int, optional): Inputs per request. Defaults to batch_predict_config['batch_size'].
+            max_workers (int, optional): Batches in flight, bounded by the pool size. Defaults to batch_predict_config['max_workers'].
+            ordered (bool, optional): Yield in input order, otherwise as batches complete. Defaults to True.
+            reorder_buffer (int, optional): When ordered, completed batches held back for an earlier one
+                that is still in flight, no batch is sent while it is full. Defaults to None (unbounded).
+
+        Yields:
+            (PredictResult): One per input. Nothing is read nor sent while the consumer does not ask for more
+                results than the batches in flight and buffered hold, memory does not grow with the inputs.
+        """
+        batch_size, max_workers = self._get_limits(batch_size, max_workers)
+
+        executor   = self._get_executor()
+        batches    = iter_batches(inputs, batch_size)
+        in_flight  = {}
+        buffered   = {} # start -> results of completed batches waiting for an earlier one
+        next_start = 0
+        exhausted  = False
+
+        try:
+            while True:
+                while not exhausted and len(in_flight) < max_workers \
+                    and (reorder_buffer is None or len(buffered) < reorder_buffer):
+
+                    start, batch = next(batches, (None, None))
+
+                    if batch is None:
+                        exhausted = True
+                    else:
+                        in_flight[executor.submit(send, batch)] = (start, batch)
+
+                if not in_flight:
+                    return
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                for future in sorted(done, key=lambda future: in_flight[future][0]):
+                    start, batch = in_flight.pop(future)
+                    results      = self._get_results(start, batch, future)
+
+                    if ordered:
+                        buffered[start] = results
+                    else:
+                        yield from results
+
+                while next_start in buffered:
+                    results     = buffered.pop(next_start)
+                    next_start += len(results)
+
+                    yield from results
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    async def iter_results_async(
+        self,
+        send: callable,
+        inputs: iter,
+        batch_size: int = None,
+        max_workers: int = None,
+        ordered: bool = True,
+        reorder_buffer: int = None
+        ) -> iter:
+        """
+        Same as iter_results, send being a coroutine function. Batches run as tasks of the event loop.
+        """
+        batch_size, max_workers = self._get_limits(batch_size, max_workers)
+
+        batches    = iter_batches(inputs, batch_size)
+        in_flight  = {}
+        buffered   = {}
+        next_start = 0
+        exhausted  = False
+
+        try:
+            while True:
+                while not exhausted and len(in_flight) < max_workers \
+                    and (reorder_buffer is None or len(buffered) < reorder_buffer):
+
+                    start, batch = next(batches, (None, None))
+
+                    if batch is None:
+                        exhausted = True
+                    else:
+                        in_flight[asyncio.ensure_future(send(batch))] = (start, batch)
+
+                if not in_flight:
+                    return
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in sorted(done, key=lambda task: in_flight[task][0]):
+                    start, batch = in_flight.pop(task)
+                    results      = self._get_results(start, batch, task)
+
+                    if ordered:
+                        buffered[start] = results
+                    else:
+                        for result in results:
+                            yield result
+
+                while next_start in buffered:
+                    results     = buffered.pop(next_start)
+                    next_start += len(results)
+
+                    for result in results:
+                        yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    def run(self, send: callable, inputs: iter, batch_size: int = None, max_workers: int = None) -> list:
+        """
+        Returns:
+            (list): One PredictResult per input, in input order, see iter_results
+        """
+        return list(self.iter_results(send, inputs, batch_size, max_workers))
+
+    async def run_async(self, send: callable, inputs: iter, batch_size: int = None, max_workers: int = None) -> list:
+        """
+        Same as run, send being a coroutine function
+        """
+        return [result async for result in self.iter_results_async(send, inputs, batch_size, max_workers)]
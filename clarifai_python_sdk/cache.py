@@ -0,0 +1,637 @@
+# SYSTEM
+import os, copy, json, time, sqlite3, hashlib, threading
+from collections import OrderedDict
+
+# PACKAGE
+from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
+
+# UTILS
+from clarifai_python_sdk.utils.json_codec import get_json_codec
+
+# ERRORS
+from clarifai_python_sdk.errors import UserError
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_CACHE_CONFIG, DEFAULT_PREDICT_CACHE_CONFIG
+
+
+class CacheEntry:
+    __slots__ = ('endpoint_index_name', 'app_id', 'response', 'expires_at', 'etag', 'last_modified')
+
+    def __init__(
+        self,
+        endpoint_index_name: str,
+        app_id: str,
+        response: dict,
+        expires_at: float,
+        etag: str = None,
+        last_modified: str = None
+        ):
+
+        self.endpoint_index_name = endpoint_index_name
+        self.app_id              = app_id
+        self.response            = response
+        self.expires_at          = expires_at # time.time(), comparable across processes
+        self.etag                = etag
+        self.last_modified       = last_modified
+
+
+class MemoryCacheBackend:
+    """
+    Entries of this process only, at most max_entries of them, least recently used evicted first
+    """
+
+    def __init__(self, cache_config: dict):
+        self.max_entries = cache_config['max_entries']
+
+        self._entries = OrderedDict()
+        self._lock    = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        pass
+
+    def get(self, key: str) -> CacheEntry or None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> int:
+        """
+        Returns:
+            (int): Number of entries evicted to make room
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            evicted = 0
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+
+            return evicted
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self, endpoint_index_names: tuple = None, app_id: str = None) -> int:
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items()
+                if (endpoint_index_names is None or entry.endpoint_index_name in endpoint_index_names)
+                and (app_id is None or entry.app_id == app_id)
+            ]
+
+            for key in keys:
+                del self._entries[key]
+
+            return len(keys)
+
+
+class SqliteCacheBackend:
+    """
+    Entries persisted in a SQLite database under `directory`, shared by every process of the host using it.
+    Concurrent access relies on SQLite locking (WAL journal, busy timeout). Once the stored responses exceed
+    max_bytes, the least recently used ones are evicted.
+    """
+
+    FILENAME = 'responses.sqlite3'
+
+    def __init__(self, cache_config: dict):
+        self.directory = cache_config['directory'] or os.path.join(os.path.expanduser('~'), '.cache', 'clarifai_python_sdk')
+        self.max_bytes = cache_config['max_bytes']
+        self.path      = os.path.join(self.directory, cache_config.get('filename') or self.FILENAME)
+
+        self._json_codec = get_json_codec()
+        self._lock       = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        # autocommit, write transactions are opened explicitly
+        self._connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint_index_name TEXT NOT NULL,
+                app_id TEXT,
+                response BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT
+            )
+        """)
+        self._connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def get(self, key: str) -> CacheEntry or None:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT endpoint_index_name, app_id, response, expires_at, etag, last_modified FROM responses WHERE key = ?',
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            self._connection.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (time.time(), key))
+
+        endpoint_index_name, app_id, response, expires_at, etag, last_modified = row
+
+        return CacheEntry(endpoint_index_name, app_id, self._json_codec.loads(response), expires_at, etag, last_modified)
+
+    def set(self, key: str, entry: CacheEntry) -> int:
+        response = self._json_codec.dumps(entry.response)
+
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+
+            try:
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (
+                        key, entry.endpoint_index_name, entry.app_id, response, len(response),
+                        entry.expires_at, time.time(), entry.etag, entry.last_modified
+                    )
+                )
+
+                evicted = self._evict()
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+
+            self._connection.execute('COMMIT')
+
+        return evicted
+
+    def _evict(self) -> int:
+        excess = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0] - self.max_bytes
+
+        if excess <= 0:
+            return 0
+
+        keys = []
+
+        for key, size in self._connection.execute('SELECT key, size FROM responses ORDER BY accessed_at'):
+            keys.append((key,))
+            excess -= size
+
+            if excess <= 0:
+                break
+
+        self._connection.executemany('DELETE FROM responses WHERE key = ?', keys)
+
+        return len(keys)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+
+    def invalidate(self, endpoint_index_names: tuple = None, app_id: str = None) -> int:
+        conditions, values = [], []
+
+        if endpoint_index_names is not None:
+            conditions.append(f'endpoint_index_name IN ({", ".join("?" * len(endpoint_index_names))})')
+            values.extend(endpoint_index_names)
+
+        if app_id is not None:
+            conditions.append('app_id = ?')
+            values.append(app_id)
+
+        with self._lock:
+            cursor = self._connection.execute(
+                'DELETE FROM responses' + (' WHERE ' + ' AND '.join(conditions) if conditions else ''),
+                values
+            )
+
+            return cursor.rowcount
+
+
+CACHE_BACKENDS = {
+    'memory': MemoryCacheBackend,
+    'sqlite': SqliteCacheBackend
+}
+
+
+class ResponseCache:
+    """
+    Cache of successful GET responses of read-mostly endpoints, one TTL per endpoint name, kept in memory
+    or in SQLite (see CACHE_BACKENDS).
+
+    Expired entries holding an ETag or Last-Modified are revalidated: the request is sent with
+    If-None-Match/If-Modified-Since and a 304 Not Modified renews the stored response.
+
+    Entries are keyed by a hash of token and url. Non-GET requests to the endpoints of invalidate_on drop the
+    entries of the same app (Apps.delete, Models.train...). Responses are copied in and out of the cache, a caller
+    modifying its response does not change what the next one gets.
+    """
+
+    def __init__(self, cache_config: dict = None):
+        self.cache_config = {**DEFAULT_CACHE_CONFIG, **(cache_config or {})}
+
+        if self.cache_config['backend'] not in CACHE_BACKENDS:
+            raise UserError(f'Unknown cache backend "{self.cache_config["backend"]}", options are: {", ".join(CACHE_BACKENDS)}')
+
+        self.backend = CACHE_BACKENDS[self.cache_config['backend']](self.cache_config)
+
+        self.hits          = 0
+        self.misses        = 0
+        self.revalidations = 0
+        self.not_modified  = 0
+        self.evictions     = 0
+        self.expirations   = 0
+        self.invalidations = 0
+
+        # counters are shared by every thread of the client, the backends having their own locks
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _hash_key(key: tuple) -> str:
+        # tokens never reach the backend, the sqlite one being a file on disk
+        return hashlib.sha256('\0'.join(key).encode('utf-8')).hexdigest()
+
+    def is_cacheable(self, endpoint_index_name: str, method: str) -> bool:
+        return method.upper() == 'GET' and endpoint_index_name in self.cache_config['ttls']
+
+    def get(self, key: tuple) -> tuple:
+        """
+        Returns:
+            (tuple): (response, conditional_headers)...
+                - (response, None) for a fresh entry
+                - (None, {'If-None-Match': ...}) for an expired entry to revalidate, see revalidated
+                - (None, None) when there is nothing usable
+        """
+        hashed_key = self._hash_key(key)
+        entry      = self.backend.get(hashed_key)
+
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+
+            return None, None
+
+        if entry.expires_at > time.time():
+            with self._lock:
+                self.hits += 1
+
+            return copy.deepcopy(entry.response), None
+
+        if entry.etag or entry.last_modified:
+            with self._lock:
+                self.revalidations += 1
+
+            return None, {
+                **({'If-None-Match': entry.etag} if entry.etag else {}),
+                **({'If-Modified-Since': entry.last_modified} if entry.last_modified else {})
+            }
+
+        self.backend.delete(hashed_key)
+
+        with self._lock:
+            self.expirations += 1
+            self.misses      += 1
+
+        return None, None
+
+    def set(
+        self,
+        key: tuple,
+        endpoint_index_name: str,
+        app_id: str,
+        response: dict,
+        etag: str = None,
+        last_modified: str = None
+        ) -> None:
+
+        entry = CacheEntry(
+            endpoint_index_name, app_id, copy.deepcopy(response), time.time() + self.cache_config['ttls'][endpoint_index_name],
+            etag, last_modified
+        )
+
+        evicted = self.backend.set(self._hash_key(key), entry)
+
+        with self._lock:
+            self.evictions += evicted
+
+    def revalidated(self, key: tuple) -> dict or None:
+        """
+        Renew an entry after a 304 Not Modified
+
+        Returns:
+            (dict or None): The stored response, None when it was evicted or invalidated in the meantime
+        """
+        hashed_key = self._hash_key(key)
+        entry      = self.backend.get(hashed_key)
+
+        if entry is None:
+            return None
+
+        entry.expires_at = time.time() + self.cache_config['ttls'][entry.endpoint_index_name]
+
+        evicted = self.backend.set(hashed_key, entry)
+
+        with self._lock:
+            self.evictions    += evicted
+            self.not_modified += 1
+
+        return copy.deepcopy(entry.response)
+
+    def invalidate(self, endpoint_index_names: tuple = None, app_id: str = None) -> int:
+        """
+        Drop cached responses, all of them when no argument is given
+
+        Args:
+            endpoint_index_names (tuple, optional): Only the responses of these endpoints
+            app_id (str, optional): Only the responses of this app
+
+        Returns:
+            (int): Number of responses dropped
+        """
+        invalidated = self.backend.invalidate(endpoint_index_names, app_id)
+
+        with self._lock:
+            self.invalidations += invalidated
+
+        return invalidated
+
+    def invalidate_after(self, endpoint_index_name: str, method: str, app_id: str = None) -> None:
+        """
+        Called after every request, drops what a mutating request may have changed
+        """
+        invalidate_on = self.cache_config['invalidate_on']
+
+        if method.upper() == 'GET' or endpoint_index_name not in invalidate_on:
+            return
+
+        # None stands for every endpoint of the app
+        self.invalidate(invalidate_on[endpoint_index_name], app_id)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def close(self) -> None:
+        self.backend.close()
+
+    def stats(self) -> dict:
+        """
+        Hit and miss counters are those of this process, size is the backend's
+
+        Returns:
+            (dict): {'size': 12, 'hits': 40, 'misses': 12, 'hit_rate': 0.769, 'revalidations': 3, ...}
+        """
+        size = len(self.backend)
+
+        with self._lock:
+            lookups = self.hits + self.misses + self.revalidations
+
+            return {
+                'backend': self.cache_config['backend'],
+                'size': size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else None,
+                'revalidations': self.revalidations,
+                'not_modified': self.not_modified,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
+
+
+class PredictCache:
+    """
+    Outputs of Models.predict keyed by credentials (token and user_app_id), model id, model version, input
+    content (base64 or url) and output config. Hits are served without any request, a predict whose inputs are partly cached only sends the
+    others and merges the outputs back in input order.
+
+    Outputs are kept in memory (LRU), with an optional sqlite tier behind it (disk=True) shared by the
+    processes of a host. Predictions without model_version_id are not cached unless cache_unpinned is set,
+    the model behind them may be retrained.
+    """
+
+    FILENAME = 'predictions.sqlite3'
+
+    # input fields the output depends on, metadata and concepts do not change a prediction
+    MEDIA_TYPES = ('image', 'video', 'audio', 'text')
+
+    def __init__(self, predict_cache_config: dict = None):
+        self.predict_cache_config = {**DEFAULT_PREDICT_CACHE_CONFIG, **(predict_cache_config or {})}
+
+        self.memory = MemoryCacheBackend(self.predict_cache_config)
+        self.disk   = SqliteCacheBackend({**self.predict_cache_config, 'filename': self.FILENAME}) \
+            if self.predict_cache_config['disk'] else None
+
+        self.hits      = 0
+        self.disk_hits = 0
+        self.misses    = 0
+        self._lock     = threading.Lock()
+
+    def is_enabled(self, model_version_id: str = None) -> bool:
+        return model_version_id is not None or self.predict_cache_config['cache_unpinned']
+
+    @classmethod
+    def get_key(
+        cls,
+        model_id: str,
+        model_version_id: str,
+        input: dict,
+        output_config: dict = None,
+        token: str = None,
+        user_app_id: dict = None
+        ) -> str or None:
+        """
+        Args:
+            token (str, optional): Of the request
+            user_app_id (dict, optional): Of the request, two apps may each have a model of the same id
+
+        Returns:
+            (str or None): sha256 of what the output depends on, None for an input without media
+        """
+        # tokens never reach the backends, only the digest does
+        digest = hashlib.sha256(f'{token or ""}\0{model_id}\0{model_version_id or ""}\0'.encode('utf-8'))
+        digest.update(json.dumps([user_app_id or {}, output_config], sort_keys=True).encode('utf-8'))
+
+        has_media = False
+
+        for media_type in cls.MEDIA_TYPES:
+            media = input.get(media_type)
+
+            if not media:
+                continue
+
+            has_media = True
+            digest.update(f'\0{media_type}'.encode('utf-8'))
+
+            for field, value in sorted(media.items()):
+                # base64 strings are hashed as they are, not copied through json
+                value = value if isinstance(value, bytes) else value.encode('utf-8') if isinstance(value, str) \
+                    else json.dumps(value, sort_keys=True).encode('utf-8')
+
+                digest.update(f'\0{field}\0'.encode('utf-8'))
+                digest.update(value)
+
+        return digest.hexdigest() if has_media else None
+
+    def _get(self, key: str) -> dict or None:
+        entry = self.memory.get(key)
+
+        if entry is None and self.disk is not None:
+            entry = self.disk.get(key)
+
+            if entry is not None:
+                self.memory.set(key, entry)
+
+                with self._lock:
+                    self.disk_hits += 1
+
+        if entry is not None and entry.expires_at <= time.time():
+            self.memory.delete(key)
+
+            if self.disk is not None:
+                self.disk.delete(key)
+
+            entry = None
+
+        return entry.response if entry is not None else None
+
+    def lookup(
+        self,
+        model_id: str,
+        model_version_id: str,
+        inputs: list,
+        output_config: dict = None,
+        token: str = None,
+        user_app_id: dict = None
+        ) -> tuple:
+        """
+        Returns:
+            (tuple): (keys, outputs, misses)...
+                - keys: one per input, None for those that cannot be cached
+                - outputs: the cached output of each input, None when missing
+                - misses: indexes of the inputs to send
+        """
+        keys    = [self.get_key(model_id, model_version_id, input, output_config, token, user_app_id) for input in inputs]
+        outputs = []
+
+        for key, input in zip(keys, inputs):
+            output = self._get(key) if key is not None else None
+
+            # stored without the echoed input, that holds the whole base64 image
+            outputs.append({**output, 'input': {'data': input}} if output is not None else None)
+
+        misses = [idx for idx, output in enumerate(outputs) if output is None]
+
+        with self._lock:
+            self.hits   += len(inputs) - len(misses)
+            self.misses += len(misses)
+
+        return keys, outputs, misses
+
+    def merge(
+        self,
+        model_id: str,
+        model_version_id: str,
+        keys: list,
+        outputs: list,
+        misses: list,
+        response: dict
+        ) -> dict:
+        """
+        Store the successful outputs of the request sent for the misses and merge them with the cached ones
+
+        Returns:
+            (dict): The predict response of every input, response itself when the request failed as a whole
+        """
+        sent_outputs = response.get('outputs')
+
+        if not sent_outputs:
+            return response
+
+        ttl                 = self.predict_cache_config['ttl']
+        expires_at          = time.time() + ttl if ttl is not None else float('inf')
+        endpoint_index_name = 'models__predict' if model_version_id else 'models__predict_without_version_id'
+        outputs             = list(outputs)
+
+        for idx, output in zip(misses, sent_outputs):
+            outputs[idx] = output
+
+            if keys[idx] is None or output.get('status', {}).get('code') != ClarifaiStatusCodes.SUCCESS:
+                continue
+
+            # filed under the model_id in place of an app_id, see invalidate_model
+            entry = CacheEntry(
+                endpoint_index_name, model_id, {key: value for key, value in output.items() if key != 'input'}, expires_at
+            )
+
+            self.memory.set(keys[idx], entry)
+
+            if self.disk is not None:
+                self.disk.set(keys[idx], entry)
+
+        return {**response, 'outputs': outputs}
+
+    @staticmethod
+    def build_response(outputs: list) -> dict:
+        return {'status': {'code': ClarifaiStatusCodes.SUCCESS, 'description': 'Ok'}, 'outputs': outputs}
+
+    def invalidate_model(self, model_id: str) -> int:
+        """
+        Drop the outputs cached without model_version_id for model_id, called after Models.train
+
+        Returns:
+            (int): Number of outputs dropped
+        """
+        endpoint_index_names = ('models__predict_without_version_id',)
+        invalidated          = self.memory.invalidate(endpoint_index_names, model_id)
+
+        if self.disk is not None:
+            invalidated += self.disk.invalidate(endpoint_index_names, model_id)
+
+        return invalidated
+
+    def clear(self) -> None:
+        self.memory.invalidate()
+
+        if self.disk is not None:
+            self.disk.invalidate()
+
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
+
+    def stats(self) -> dict:
+        """
+        Counters are per input, those of this process
+
+        Returns:
+            (dict): {'size': 800, 'hits': 1200, 'disk_hits': 40, 'misses': 800, 'hit_rate': 0.6, ...}
+        """
+        lookups = self.hits + self.misses
+
+        return {
+            'size': len(self.memory),
+            'disk_size': len(self.disk) if self.disk is not None else None,
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else None
+        }
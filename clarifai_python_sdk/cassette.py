@@ -0,0 +1,340 @@
+# SYSTEM
+import gzip, time, base64, hashlib, asyncio, threading
+from collections import Counter, defaultdict
+from urllib.parse import urlsplit
+
+# PACKAGES
+from requests.structures import CaseInsensitiveDict
+
+# PACKAGE
+from clarifai_python_sdk.transport import Transport, AsyncTransport, TransportResponse, RequestsTransport
+from clarifai_python_sdk.utils.json_codec import get_json_codec
+from clarifai_python_sdk.utils.compression import decompress_body
+
+# ERRORS
+from clarifai_python_sdk.errors import UserError
+
+
+class Cassette:
+    """
+    Recorded HTTP traffic: one entry per request sent (retries included), kept in memory and saved as json lines,
+    gzipped when the path ends with ".gz". An entry looks like...
+        {
+            'method': 'POST',
+            'endpoint': 'models__predict_without_version_id',
+            'path_variables': {'model_id': 'general-image-recognition'},
+            'url': '/v2/models/general-image-recognition/outputs',
+            'body_sha1': '5d41402abc4b2a76b9719d911017c592...',
+            'status': 200,
+            'headers': {'Content-Type': 'application/json', ...},
+            'content': '{"status": {"code": 10000, ...}, ...}',
+            'elapsed': 0.1832
+        }
+    ...or holds an 'error' message instead of status/headers/content when the connection failed.
+
+    Request bodies are only kept as a hash of their uncompressed bytes, which is what replays match on
+    along with the method and url.
+    """
+
+    def __init__(self, path: str = None, entries: list = None):
+        self.path    = path
+        self.entries = entries if entries is not None else []
+
+        self._lock       = threading.Lock()
+        self._json_codec = get_json_codec()
+        self._index      = None # entries by (method, url, body_sha1), built on the first replay
+        self._positions  = defaultdict(int)
+
+    @classmethod
+    def load(cls, path: str) -> 'Cassette':
+        opener = gzip.open if path.endswith('.gz') else open
+
+        with opener(path, 'rb') as f:
+            codec   = get_json_codec()
+            entries = [codec.loads(line) for line in f if line.strip()]
+
+        return cls(path, entries)
+
+    def save(self, path: str = None) -> None:
+        path = path or self.path
+
+        if not path:
+            raise UserError('Cassette has no path to be saved to')
+
+        opener = gzip.open if path.endswith('.gz') else open
+
+        with self._lock, opener(path, 'wb') as f:
+            for entry in self.entries:
+                f.write(self._json_codec.dumps(entry) + b'\n')
+
+    def endpoints(self) -> Counter:
+        """
+        Returns:
+            (Counter): Number of recorded requests per endpoint name
+        """
+        return Counter(entry.get('endpoint') for entry in self.entries)
+
+    @staticmethod
+    def _request_key(method: str, url: str, headers: dict, data: bytes = None) -> tuple:
+        url = urlsplit(url)
+        url = url.path + (f'?{url.query}' if url.query else '')
+
+        if not data:
+            return method, url, None
+
+        # compressed bodies are hashed uncompressed, gzip output changes with its timestamp
+        encoding = CaseInsensitiveDict(headers).get('Content-Encoding')
+
+        return method, url, hashlib.sha1(decompress_body(data, encoding)).hexdigest()
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        data: bytes = None,
+        request_info: dict = None,
+        elapsed: float = 0.0,
+        response: TransportResponse = None,
+        error: Exception = None
+        ) -> None:
+
+        request_info           = request_info or {}
+        method, url, body_sha1 = self._request_key(method, url, headers, data)
+
+        entry = {
+            'method': method,
+            'endpoint': request_info.get('endpoint_index_name'),
+            'path_variables': request_info.get('path_variables') or {},
+            'url': url,
+            'body_sha1': body_sha1,
+            'elapsed': round(elapsed, 4)
+        }
+
+        if error is not None:
+            entry['error'] = str(error) or type(error).__name__
+        else:
+            entry.update({'status': response.status, 'headers': dict(response.headers), **self._encode_content(response.content)})
+
+        with self._lock:
+            self.entries.append(entry)
+
+    @staticmethod
+    def _encode_content(content: bytes) -> dict:
+        try:
+            return {'content': content.decode('utf-8')}
+        except UnicodeDecodeError:
+            return {'content_base64': base64.b64encode(content).decode('ascii')}
+
+    def play(self, method: str, url: str, headers: dict, data: bytes = None, repeat: bool = False) -> dict:
+        """
+        Next recorded entry for a request, entries of identical requests are played in their recorded order
+
+        Args:
+            method (str)
+            url (str)
+            headers (dict)
+            data (bytes, optional)
+            repeat (bool, optional): Start over once every entry of a request was played instead of raising
+
+        Raises:
+            UserError: When the request was never recorded, or all its entries were played
+
+        Returns:
+            (dict): Entry, see Cassette
+        """
+        key = self._request_key(method, url, headers, data)
+
+        with self._lock:
+            if self._index is None:
+                self._index = defaultdict(list)
+
+                for entry in self.entries:
+                    self._index[(entry['method'], entry['url'], entry['body_sha1'])].append(entry)
+
+            entries  = self._index.get(key)
+            position = self._positions[key]
+
+            if entries and position >= len(entries) and repeat:
+                position = 0
+
+            if not entries or position >= len(entries):
+                raise UserError(f'No recorded response left for {method} {key[1]} (body sha1: {key[2]})')
+
+            self._positions[key] = position + 1
+
+        return entries[position]
+
+    def rewind(self) -> None:
+        with self._lock:
+            self._positions.clear()
+
+    @staticmethod
+    def to_response(entry: dict) -> TransportResponse:
+        if 'error' in entry:
+            raise ConnectionError(entry['error'])
+
+        content = entry['content'].encode('utf-8') if 'content' in entry else base64.b64decode(entry['content_base64'])
+
+        return TransportResponse(entry['status'], CaseInsensitiveDict(entry['headers']), content)
+
+
+class RecordingTransport(Transport):
+    """
+    Sends requests through another transport and records them to a cassette, saved when the client is closed...
+        cassette = Cassette('traffic.jsonl.gz')
+
+        with ClarifaiApi(token, app_id='app', transport=RecordingTransport(cassette)) as clarifai:
+            clarifai.inputs.list_all()
+    """
+
+    def __init__(self, cassette: Cassette, transport: Transport = None):
+        self.cassette  = cassette
+        self.transport = transport or RequestsTransport()
+
+    @property
+    def retryable_exceptions(self) -> tuple:
+        return self.transport.retryable_exceptions
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        data: bytes = None,
+        timeout: tuple = None,
+        request_info: dict = None
+        ) -> TransportResponse:
+
+        started_at = time.perf_counter()
+
+        try:
+            response = self.transport.send(method, url, headers, data, timeout, request_info)
+        except self.transport.retryable_exceptions as e:
+            self.cassette.record(method, url, headers, data, request_info, time.perf_counter() - started_at, error=e)
+            raise
+
+        self.cassette.record(method, url, headers, data, request_info, time.perf_counter() - started_at, response)
+
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+        if self.cassette.path:
+            self.cassette.save()
+
+
+class ReplayTransport(Transport):
+    """
+    Answers requests from a cassette without any network, e.g. to profile the client offline...
+        clarifai = ClarifaiApi(token, app_id='app', transport=ReplayTransport(Cassette.load('traffic.jsonl.gz')))
+
+    speed=None replays at full speed, speed=1.0 waits as long as the recorded request took, 2.0 half as long...
+    """
+
+    def __init__(self, cassette: Cassette, speed: float = None, repeat: bool = False):
+        self.cassette = cassette
+        self.speed    = speed
+        self.repeat   = repeat
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        data: bytes = None,
+        timeout: tuple = None,
+        request_info: dict = None
+        ) -> TransportResponse:
+
+        entry        = self.cassette.play(method, url, headers, data, self.repeat)
+        delay        = entry['elapsed'] / self.speed if self.speed else 0.0
+        read_timeout = timeout[1] if timeout else None
+
+        if read_timeout is not None and delay > read_timeout:
+            time.sleep(read_timeout)
+            raise TimeoutError(f'Read timed out after {read_timeout}s')
+
+        if delay:
+            time.sleep(delay)
+
+        return self.cassette.to_response(entry)
+
+
+class AsyncRecordingTransport(AsyncTransport):
+    """
+    asyncio counterpart of RecordingTransport, sends through an AiohttpTransport by default
+    """
+
+    def __init__(self, cassette: Cassette, transport: AsyncTransport = None):
+        # aiohttp is optional, only imported when the default transport is needed
+        from clarifai_python_sdk.async_http_client import AiohttpTransport
+
+        self.cassette  = cassette
+        self.transport = transport or AiohttpTransport()
+
+    @property
+    def retryable_exceptions(self) -> tuple:
+        return self.transport.retryable_exceptions
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        data: bytes = None,
+        timeout: float = None,
+        request_info: dict = None
+        ) -> TransportResponse:
+
+        started_at = time.perf_counter()
+
+        try:
+            response = await self.transport.send(method, url, headers, data, timeout, request_info)
+        except self.transport.retryable_exceptions as e:
+            self.cassette.record(method, url, headers, data, request_info, time.perf_counter() - started_at, error=e)
+            raise
+
+        self.cassette.record(method, url, headers, data, request_info, time.perf_counter() - started_at, response)
+
+        return response
+
+    async def close(self) -> None:
+        await self.transport.close()
+
+        if self.cassette.path:
+            self.cassette.save()
+
+
+class AsyncReplayTransport(AsyncTransport):
+    """
+    asyncio counterpart of ReplayTransport
+    """
+
+    def __init__(self, cassette: Cassette, speed: float = None, repeat: bool = False):
+        self.cassette = cassette
+        self.speed    = speed
+        self.repeat   = repeat
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        data: bytes = None,
+        timeout: float = None,
+        request_info: dict = None
+        ) -> TransportResponse:
+
+        entry = self.cassette.play(method, url, headers, data, self.repeat)
+        delay = entry['elapsed'] / self.speed if self.speed else 0.0
+
+        if timeout is not None and delay > timeout:
+            await asyncio.sleep(timeout)
+            raise asyncio.TimeoutError()
+
+        if delay:
+            await asyncio.sleep(delay)
+
+        return self.cassette.to_response(entry)
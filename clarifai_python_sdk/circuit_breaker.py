@@ -0,0 +1,150 @@
+# SYSTEM
+import time, threading
+from collections import deque
+
+# ERRORS
+from clarifai_python_sdk.errors import CircuitOpenError
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_CIRCUIT_BREAKER_CONFIG
+
+
+class CircuitBreaker:
+    """
+    closed:    requests go through, outcomes are recorded
+    open:      requests fail fast with CircuitOpenError until reset_timeout has elapsed
+    half_open: up to half_open_max_calls probe requests go through, a success closes the circuit,
+               a failure opens it again
+    """
+
+    CLOSED    = 'closed'
+    OPEN      = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, endpoint_index_name: str, circuit_breaker_config: dict):
+        self.endpoint_index_name    = endpoint_index_name
+        self.circuit_breaker_config = circuit_breaker_config
+
+        self._state                = self.CLOSED
+        self._opened_at            = None
+        self._consecutive_failures = 0
+        self._outcomes             = deque(maxlen=circuit_breaker_config['window_size']) # True for failures
+        self._half_open_calls      = 0
+        self._lock                 = threading.Lock()
+
+    def _refresh_state(self) -> None:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.circuit_breaker_config['reset_timeout']:
+            self._state           = self.HALF_OPEN
+            self._half_open_calls = 0
+
+    def _open(self) -> None:
+        self._state     = self.OPEN
+        self._opened_at = time.monotonic()
+
+    def _close(self) -> None:
+        self._state                = self.CLOSED
+        self._consecutive_failures = 0
+        self._outcomes.clear()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh_state()
+
+            return self._state
+
+    def before_request(self) -> None:
+        """
+        Raises:
+            CircuitOpenError: When the request is not allowed through
+        """
+        with self._lock:
+            self._refresh_state()
+
+            if self._state == self.CLOSED:
+                return
+
+            if self._state == self.HALF_OPEN and self._half_open_calls < self.circuit_breaker_config['half_open_max_calls']:
+                self._half_open_calls += 1
+                return
+
+            retry_in = self.circuit_breaker_config['reset_timeout'] - (time.monotonic() - self._opened_at) \
+                if self._state == self.OPEN else 0.0
+
+            raise CircuitOpenError(self.endpoint_index_name, max(0.0, retry_in))
+
+    def release(self) -> None:
+        """
+        Give back the slot taken by before_request for a request that ended without an outcome (cancelled,
+        interrupted), so that a half-open circuit can still be probed
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._half_open_calls = max(0, self._half_open_calls - 1)
+
+    def is_failure(self, http_status: int = None, exception: Exception = None) -> bool:
+        return exception is not None or http_status in self.circuit_breaker_config['failure_http_status']
+
+    def record(self, http_status: int = None, exception: Exception = None) -> None:
+        failed = self.is_failure(http_status, exception)
+
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._half_open_calls = max(0, self._half_open_calls - 1)
+
+                if failed:
+                    self._open()
+                else:
+                    self._close()
+
+                return
+
+            self._outcomes.append(failed)
+            self._consecutive_failures = self._consecutive_failures + 1 if failed else 0
+
+            error_rate = sum(self._outcomes) / len(self._outcomes)
+
+            if self._consecutive_failures >= self.circuit_breaker_config['consecutive_failures'] \
+                or (len(self._outcomes) >= self.circuit_breaker_config['min_calls'] and error_rate >= self.circuit_breaker_config['error_rate']):
+                self._open()
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            self._refresh_state()
+
+            return {
+                'state': self._state,
+                'consecutive_failures': self._consecutive_failures,
+                'error_rate': round(sum(self._outcomes) / len(self._outcomes), 3) if self._outcomes else 0.0,
+                'calls_in_window': len(self._outcomes)
+            }
+
+
+class CircuitBreakerRegistry:
+    """
+    One CircuitBreaker per endpoint name of ENDPOINTS, created on first use
+    """
+
+    def __init__(self, circuit_breaker_config: dict = None):
+        self.circuit_breaker_config = {**DEFAULT_CIRCUIT_BREAKER_CONFIG, **(circuit_breaker_config or {})}
+
+        self._circuit_breakers = {}
+        self._lock             = threading.Lock()
+
+    def get(self, endpoint_index_name: str) -> CircuitBreaker:
+        circuit_breaker = self._circuit_breakers.get(endpoint_index_name)
+
+        if circuit_breaker is None:
+            with self._lock:
+                circuit_breaker = self._circuit_breakers.setdefault(
+                    endpoint_index_name,
+                    CircuitBreaker(endpoint_index_name, self.circuit_breaker_config)
+                )
+
+        return circuit_breaker
+
+    def states(self) -> dict:
+        return {
+            endpoint_index_name: circuit_breaker.to_dict()
+            for endpoint_index_name, circuit_breaker in list(self._circuit_breakers.items())
+        }
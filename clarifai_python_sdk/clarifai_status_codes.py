@@ -1,4 +1,7 @@
 class ClarifaiStatusCodes:
 
-    SUCCESS = 10000
-    FAILURE = 10020
\ No newline at end of file
+    SUCCESS        = 10000
+    MIXED_STATUS   = 10010
+    FAILURE        = 10020
+    TRY_AGAIN      = 10030
+    CONN_THROTTLED = 11005
@@ -3,6 +3,18 @@
 # PACKAGE
 from clarifai_python_sdk.response import ResponseWrapper
 from clarifai_python_sdk.make_clarifai_request import MakeClarifaiRequest
+from clarifai_python_sdk.http_client import HttpClient
+from clarifai_python_sdk.transport import Transport
+from clarifai_python_sdk.rate_limiter import RateLimiter
+from clarifai_python_sdk.hedging import RequestHedger
+from clarifai_python_sdk.coalescing import RequestCoalescer
+from clarifai_python_sdk.cache import ResponseCache, PredictCache
+from clarifai_python_sdk.circuit_breaker import CircuitBreakerRegistry
+from clarifai_python_sdk.hooks import RequestHooks
+from clarifai_python_sdk.metrics import MetricsRegistry
+from clarifai_python_sdk.batch_predict import BatchPredictor
+from clarifai_python_sdk.image_preprocessing import ImagePreprocessor
+from clarifai_python_sdk.predict_batcher import PredictBatcher
 
 # MODULES
 from clarifai_python_sdk.modules.apps     import Apps
@@ -14,6 +26,7 @@ from clarifai_python_sdk.modules.transfer import Transfer
 
 # UTILS
 from clarifai_python_sdk.utils.url_handler import UrlHandler
+from clarifai_python_sdk.utils.json_codec import get_json_codec
 
 # CONSTANTS
 from clarifai_python_sdk.constants import API_BASE_URL
@@ -27,16 +40,150 @@ class ClarifaiApi:
         user_id: str = None,
         app_id: str = None,
         base_url: str = None,
+        http_config: dict = None,
+        retry_config: dict = None,
+        rate_limit_config: dict = None,
+        json_codec: str = 'auto',
+        response_config: dict = None,
+        compression_config: dict = None,
+        hedge_config: dict = None,
+        circuit_breaker_config: dict = None,
+        coalesce_config: dict = None,
+        cache_config: dict = None,
+        timeout: float = None,
+        transport: Transport = None,
+        hooks: list = None,
+        metrics_config: dict = None,
+        batch_predict_config: dict = None,
+        preprocess_config: dict = None,
+        predict_cache_config: dict = None,
+        predict_batcher_config: dict = None,
         **kwargs
     ) -> None:
+        """
+        Args:
+            token (str)
+            user_id (str, optional): Defaults to 'me'.
+            app_id (str, optional)
+            base_url (str, optional): Defaults to API_BASE_URL.
+            http_config (dict, optional): Connection pool settings shared by every module...
+                - pool_connections (int): number of per-host pools to cache
+                - pool_maxsize (int): max keep-alive connections per host
+                - pool_block (bool)
+                - connect_timeout (float)
+                - read_timeout (float)
+            retry_config (dict, optional): Overrides DEFAULT_RETRY_CONFIG...
+                - max_attempts (int)
+                - backoff_factor, max_backoff (float), jitter (bool)
+                - retry_on_http_status, retry_on_clarifai_status (tuple)
+                - retry_on_connection_errors, respect_retry_after (bool), max_retry_after (float)
+                - retry_non_idempotent (bool): also retry POST/PATCH requests that are not flagged as read-only
+            rate_limit_config (dict, optional): Enables the client-side rate limiter, one bucket per token ({} for defaults)...
+                - requests_per_second (float)
+                - burst (int)
+                - endpoint_weights (dict): e.g. {'models__predict': 2}
+            json_codec (str, optional): 'auto' (orjson when installed), 'orjson', 'json' or a JsonCodec instance.
+                Used for request bodies, responses and ResponseWrapper.json. Defaults to 'auto'.
+            response_config (dict, optional): Overrides DEFAULT_RESPONSE_CONFIG...
+                - pretty_print_if_json (bool): indent ResponseWrapper.response.json
+                - render_json (bool): False to never render ResponseWrapper.response.json
+            compression_config (dict, optional): Overrides DEFAULT_COMPRESSION_CONFIG...
+                - request_encoding (str): 'gzip' or 'deflate' to compress request bodies, off by default
+                - min_request_size (int): bodies smaller than this are sent uncompressed
+                - compress_level (int)
+                - compressed_response_endpoints (tuple): endpoints always negotiating a compressed response
+            hedge_config (dict, optional): Overrides DEFAULT_HEDGE_CONFIG, used by calls made with hedge=True...
+                - percentile (float): latency percentile after which a duplicate is sent
+                - min_delay (float), min_samples (int), window_size (int)
+                - max_hedge_ratio (float): max fraction of hedge-enabled requests that get a duplicate
+            circuit_breaker_config (dict, optional): Enables one circuit breaker per endpoint ({} for defaults), see DEFAULT_CIRCUIT_BREAKER_CONFIG...
+                - consecutive_failures (int), error_rate (float), window_size (int), min_calls (int)
+                - reset_timeout (float), half_open_max_calls (int), failure_http_status (tuple)
+            coalesce_config (dict, optional): Overrides DEFAULT_COALESCE_CONFIG. Concurrent identical GET requests
+                (same url, query and token) share one in-flight HTTP call...
+                - enabled (bool): False by default, coalesce_config={'enabled': True} turns it on
+                - methods (tuple), excluded_endpoints (tuple)
+            cache_config (dict, optional): Enables `self.cache`, a cache.ResponseCache of read-mostly endpoints
+                ({} for defaults), see DEFAULT_CACHE_CONFIG...
+                - backend (str): 'memory' or 'sqlite' (persistent, shared by the processes of a host)
+                - max_entries (int), max_bytes (int): LRU bound of the memory and sqlite backends
+                - directory (str): where the sqlite backend keeps its database
+                - ttls (dict): seconds per cached endpoint name, replaces the default dict
+                - invalidate_on (dict): mutating endpoint name -> cached endpoint names of the same app to drop
+            timeout (float, optional): Default timeout in seconds of every call, retries included.
+                Each method also takes its own `timeout`. Defaults to None (no limit).
+            transport (Transport, optional): What actually sends the requests, defaults to a pooled
+                requests.Session (aiohttp with AsyncClarifaiApi). See fake_server.FakeClarifaiServer for
+                running without network access.
+            hooks (list, optional): Callables receiving a hooks.RequestEvent after every request, see add_hook.
+            metrics_config (dict, optional): Enables `self.metrics`, a metrics.MetricsRegistry with counters and
+                latency histograms per endpoint and app ({} for defaults), see DEFAULT_METRICS_CONFIG...
+                - namespace (str): prefix of the prometheus metric names
+                - min_latency, max_latency (float), buckets_per_doubling (int): latency buckets
+            batch_predict_config (dict, optional): Overrides DEFAULT_BATCH_PREDICT_CONFIG, used by Models.predict_all...
+                - batch_size (int): inputs per predict request
+                - max_workers (int): size of the thread pool shared by every predict_all call, default
+                  concurrent batches of a call (tasks of the event loop with AsyncClarifaiApi)
+            preprocess_config (dict, optional): Enables `self.image_preprocessor`, downscaling the images sent as base64
+                by Inputs.add and Models.predict ({} for defaults, needs Pillow), see DEFAULT_PREPROCESS_CONFIG...
+                - max_side (int): px, longest side once resized
+                - format (str): 'JPEG' or 'WEBP', quality (int)
+                - strip_exif (bool), max_workers (int): threads processing images
+            predict_cache_config (dict, optional): Enables `self.predict_cache`, a cache.PredictCache of predict outputs
+                by model version and input content ({} for defaults), see DEFAULT_PREDICT_CACHE_CONFIG...
+                - max_entries (int): memory tier size
+                - disk (bool), directory (str), max_bytes (int): sqlite tier
+                - ttl (float): seconds, None for no expiry
+                - cache_unpinned (bool): also cache predictions made without model_version_id
+            predict_batcher_config (dict, optional): Overrides DEFAULT_PREDICT_BATCHER_CONFIG of `self.predict_batcher`, a
+                predict_batcher.PredictBatcher merging single-input predicts into batch requests...
+                - max_batch_size (int), max_wait (float): a batch is sent when full or max_wait seconds after its first input
+                - max_concurrency (int): batch requests in flight
+        """
         
         self._token    = token
         self._user_id  = user_id or 'me'
         self._app_id   = app_id
         self._base_url = base_url or API_BASE_URL
 
+        self._json_codec        = get_json_codec(json_codec)
+        self._request_hedger    = RequestHedger(hedge_config)
+        self._request_coalescer = RequestCoalescer(coalesce_config)
+        self._batch_predictor   = BatchPredictor(batch_predict_config)
+        self.image_preprocessor = ImagePreprocessor(preprocess_config) if preprocess_config is not None else None
+        self.predict_cache      = PredictCache(predict_cache_config) if predict_cache_config is not None else None
+        self.cache              = ResponseCache(cache_config) if cache_config is not None else None
+        self._circuit_breakers  = CircuitBreakerRegistry(circuit_breaker_config) if circuit_breaker_config is not None else None
+        self._hooks             = RequestHooks(hooks)
+        self.metrics            = MetricsRegistry(metrics_config, app_id) if metrics_config is not None else None
+        self._rate_limiter      = RateLimiter(rate_limit_config) if rate_limit_config is not None else None
+        self._http_client       = HttpClient(
+            base_url=self._base_url,
+            http_config=http_config,
+            retry_config=retry_config,
+            json_codec=self._json_codec,
+            compression_config=compression_config,
+            rate_limiter=self._rate_limiter,
+            transport=transport
+        )
+
+        if self.metrics is not None:
+            self._hooks.add(self.metrics)
+
         params = { 
             'base_url': self._base_url,
+            'http_client': self._http_client,
+            'json_codec': self._json_codec,
+            'response_config': response_config or {},
+            'request_hedger': self._request_hedger,
+            'request_coalescer': self._request_coalescer,
+            'batch_predictor': self._batch_predictor,
+            'image_preprocessor': self.image_preprocessor,
+            'predict_cache': self.predict_cache,
+            'response_cache': self.cache,
+            'circuit_breakers': self._circuit_breakers,
+            'timeout': timeout,
+            'hooks': self._hooks,
             'token': self._token,
             'user_id': self._user_id,
             'app_id': self._app_id,
@@ -60,11 +207,63 @@ class ClarifaiApi:
             params, 
             other_modules={'module_models': self.models, 'module_inputs': self.inputs, 'module_concepts': self.concepts}
         )
+
+        self.predict_batcher = PredictBatcher(self.models, predict_batcher_config)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close every pooled connection
+        """
+        self.predict_batcher.close()
+        self._http_client.close()
+        self._request_hedger.close()
+        self._batch_predictor.close()
+
+        if self.image_preprocessor is not None:
+            self.image_preprocessor.close()
+
+        if self.cache is not None:
+            self.cache.close()
+
+        if self.predict_cache is not None:
+            self.predict_cache.close()
     
-    def me(self, auth_object: dict = {}) -> ResponseWrapper:
+    def circuit_breaker_states(self) -> dict:
+        """
+        State of every endpoint circuit breaker used so far
+
+        Returns:
+            (dict): {'models__predict': {'state': 'closed', 'consecutive_failures': 0, 'error_rate': 0.0, ...}, ...}
+        """
+        return self._circuit_breakers.states() if self._circuit_breakers else {}
+
+    def add_hook(self, hook: callable) -> callable:
+        """
+        Call `hook` with a hooks.RequestEvent after every request (endpoint, phase timings, bytes, statuses,
+        retries...). Hooks run inline, on the thread or event loop that made the request, keep them cheap.
+        Can be used as a decorator.
+
+        Returns:
+            (callable): hook
+        """
+        return self._hooks.add(hook)
+
+    def remove_hook(self, hook: callable) -> None:
+        self._hooks.remove(hook)
+
+    def me(self, auth_object: dict = {}, timeout: float = None) -> ResponseWrapper:
         """
         Who am I? 
 
+        Args:
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+
         Returns:
             (Object): ResponseWrapper
         """
@@ -73,7 +272,8 @@ class ClarifaiApi:
             endpoint_index_name="me",
             method="GET",
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)
\ No newline at end of file
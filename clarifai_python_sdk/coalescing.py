@@ -0,0 +1,162 @@
+# SYSTEM
+import asyncio, threading
+
+# PACKAGE
+from clarifai_python_sdk.deadline import Deadline
+
+# ERRORS
+from clarifai_python_sdk.errors import DeadlineExceededError
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_COALESCE_CONFIG
+
+
+# outcome of a leader cancelled or interrupted before its request completed, its waiters send their own
+_ABANDONED = object()
+
+
+class _InFlightCall:
+    def __init__(self):
+        self.done   = threading.Event()
+        self.result = None
+        self.error  = None
+
+
+class RequestCoalescer:
+    """
+    Singleflight for read requests: while a request is in flight, identical ones (same endpoint url, query and
+    token) wait for it instead of being sent, and all get its result (or its exception).
+
+    Only concurrent requests are merged, nothing is cached once the leader is done. Waiters share the
+    response of the leader, which like every response of the package has to be treated as read-only.
+    When the leader is cancelled or interrupted, one of its waiters takes over and sends the request.
+    """
+
+    def __init__(self, coalesce_config: dict = None):
+        self.coalesce_config = {**DEFAULT_COALESCE_CONFIG, **(coalesce_config or {})}
+
+        self.number_of_requests  = 0
+        self.number_of_coalesced = 0
+
+        self._in_flight       = {}
+        self._in_flight_async = {}
+        self._lock            = threading.Lock()
+
+    def should_coalesce(self, endpoint_index_name: str, method: str) -> bool:
+        return self.coalesce_config['enabled'] \
+            and method.upper() in self.coalesce_config['methods'] \
+            and endpoint_index_name not in self.coalesce_config['excluded_endpoints']
+
+    def run(self, key: tuple, send: callable, deadline: Deadline = None) -> tuple:
+        """
+        Args:
+            key (tuple): Identifies identical requests
+            send (callable): Sends the request, only called by the first caller of a key
+            deadline (Deadline, optional): Of the caller, bounds the wait for another caller's request
+
+        Raises:
+            DeadlineExceededError: When the deadline runs out while waiting
+
+        Returns:
+            (tuple): (what send returned, True when it was another caller's request)
+        """
+        with self._lock:
+            self.number_of_requests += 1
+
+        while True:
+            with self._lock:
+                call   = self._in_flight.get(key)
+                leader = call is None
+
+                if leader:
+                    call = self._in_flight[key] = _InFlightCall()
+
+            if leader:
+                break
+
+            if not call.done.wait(deadline.remaining() if deadline else None):
+                raise DeadlineExceededError(deadline.timeout, key[0])
+
+            if call.result is _ABANDONED:
+                continue
+
+            with self._lock:
+                self.number_of_coalesced += 1
+
+            if call.error is not None:
+                raise call.error
+
+            return call.result, True
+
+        try:
+            call.result = send()
+        except Exception as e:
+            call.error = e
+            raise
+        except BaseException:
+            call.result = _ABANDONED
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+            call.done.set()
+
+        return call.result, False
+
+    async def run_async(self, key: tuple, send: callable, deadline: Deadline = None) -> tuple:
+        """
+        Same as run, send being a coroutine function
+        """
+        with self._lock:
+            self.number_of_requests += 1
+
+        while True:
+            with self._lock:
+                future = self._in_flight_async.get(key)
+                leader = future is None
+
+                if leader:
+                    future = self._in_flight_async[key] = asyncio.get_running_loop().create_future()
+
+            if leader:
+                break
+
+            try:
+                # shielded, a waiter giving up must not cancel the request of the others
+                result = await asyncio.wait_for(asyncio.shield(future), deadline.remaining() if deadline else None)
+            except asyncio.TimeoutError:
+                if deadline is None or future.done(): # raised by the request itself
+                    raise
+
+                raise DeadlineExceededError(deadline.timeout, key[0]) from None
+            except Exception:
+                with self._lock:
+                    self.number_of_coalesced += 1
+                raise
+
+            if result is _ABANDONED:
+                continue
+
+            with self._lock:
+                self.number_of_coalesced += 1
+
+            return result, True
+
+        try:
+            result = await send()
+        except asyncio.CancelledError:
+            # only this caller gave up, the next waiter becomes the leader
+            future.set_result(_ABANDONED)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception() # marks it retrieved, no warning when nobody was waiting
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._in_flight_async[key]
+
+        return result, False
@@ -0,0 +1,192 @@
+# SYSTEM
+from array import array
+
+# PACKAGES
+try:
+    import numpy as np
+except ImportError: # optional, only needed by ConceptScores
+    np = None
+
+# PACKAGE
+from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
+from clarifai_python_sdk.batch_predict import PredictResult
+
+# ERRORS
+from clarifai_python_sdk.errors import UserError
+
+
+class ConceptScores:
+    """
+    Predict outputs as a dense (inputs x concepts) score matrix, for vectorized post-processing...
+        scores = ConceptScores.from_response(clarifai.models.predict(inputs, 'general-image-recognition'))
+        scores.top_k(5)            # (concept indexes, values), one row per input
+        scores.threshold(0.9)      # boolean mask
+        scores.concept_ids[idx]    # column -> concept id
+
+    A concept an output did not return scores 0. Rows of failed outputs are all 0 and False in `valid`.
+    Pass concept_ids of a previous ConceptScores to get the same columns across several predicts.
+    """
+
+    def __init__(self, scores: 'np.ndarray', concept_ids: list, valid: 'np.ndarray' = None, input_ids: list = None):
+        self.scores        = scores
+        self.concept_ids   = list(concept_ids)
+        self.concept_index = {concept_id: idx for idx, concept_id in enumerate(self.concept_ids)}
+        self.valid         = valid if valid is not None else np.ones(scores.shape[0], dtype=bool)
+        self.input_ids     = input_ids
+
+    def __len__(self) -> int:
+        return self.scores.shape[0]
+
+    @staticmethod
+    def _get_output(output: 'dict or PredictResult') -> dict or None:
+        if isinstance(output, PredictResult):
+            return output.output if output.ok else None
+
+        if output.get('status', {}).get('code', ClarifaiStatusCodes.SUCCESS) != ClarifaiStatusCodes.SUCCESS:
+            return None
+
+        return output
+
+    @classmethod
+    def from_outputs(cls, outputs: iter, concept_ids: list = None, dtype: str = 'float32') -> 'ConceptScores':
+        """
+        Args:
+            outputs (iterable): Output dicts of predict responses, or PredictResult of predict_all/predict_stream
+            concept_ids (list, optional): Columns to use, concepts outside of them are dropped.
+                Defaults to every concept returned, in the order they are met.
+            dtype (str, optional): Of the score matrix. Defaults to 'float32'.
+
+        Returns:
+            (ConceptScores)
+        """
+        if np is None:
+            raise UserError('ConceptScores needs NumPy: pip install numpy')
+
+        concept_index = {concept_id: idx for idx, concept_id in enumerate(concept_ids or ())}
+        grow          = concept_ids is None
+
+        # (row, column, value) triplets in compact arrays, never a matrix of python floats
+        rows, columns, values = array('I'), array('I'), array('f')
+        valid, input_ids      = array('b'), []
+
+        for row, output in enumerate(outputs):
+            output = cls._get_output(output)
+
+            valid.append(output is not None)
+            input_ids.append(output.get('input', {}).get('id') if output is not None else None)
+
+            if output is None:
+                continue
+
+            for concept in output.get('data', {}).get('concepts', ()):
+                column = concept_index.get(concept['id'])
+
+                if column is None:
+                    if not grow:
+                        continue
+
+                    column = concept_index[concept['id']] = len(concept_index)
+
+                rows.append(row)
+                columns.append(column)
+                values.append(concept['value'])
+
+        scores = np.zeros((len(valid), len(concept_index)), dtype=dtype)
+        scores[np.frombuffer(rows, dtype=np.uint32), np.frombuffer(columns, dtype=np.uint32)] = np.frombuffer(values, dtype=np.float32)
+
+        return cls(scores, list(concept_index), np.frombuffer(valid, dtype=bool).copy(), input_ids)
+
+    @classmethod
+    def from_response(cls, response_wrapper: 'ResponseWrapper', concept_ids: list = None, dtype: str = 'float32') -> 'ConceptScores':
+        """
+        Args:
+            response_wrapper (ResponseWrapper): Of Models.predict
+
+        Returns:
+            (ConceptScores)
+        """
+        return cls.from_outputs(response_wrapper.response.dict.get('outputs', ()), concept_ids, dtype)
+
+    def column(self, concept_id: str) -> 'np.ndarray':
+        """
+        Returns:
+            (np.ndarray): Scores of one concept, a view
+        """
+        return self.scores[:, self.concept_index[concept_id]]
+
+    def threshold(self, threshold: float) -> 'np.ndarray':
+        """
+        Returns:
+            (np.ndarray): (inputs x concepts) booleans, True where the score is at least threshold
+        """
+        return self.scores >= threshold
+
+    def argmax(self) -> tuple:
+        """
+        Returns:
+            (tuple): (concept index, score) arrays of the best concept of each input
+        """
+        indexes = self.scores.argmax(axis=1)
+
+        return indexes, self.scores[np.arange(len(indexes)), indexes]
+
+    def top_k(self, k: int) -> tuple:
+        """
+        Returns:
+            (tuple): (concept indexes, scores) arrays of shape (inputs x k), best first
+        """
+        if k < 1:
+            raise UserError('k must be at least 1')
+
+        k = min(k, self.scores.shape[1])
+
+        # partial selection of the k best, only those get sorted
+        indexes = np.argpartition(self.scores, -k, axis=1)[:, -k:] if k < self.scores.shape[1] \
+            else np.broadcast_to(np.arange(k), (len(self), k))
+        values  = np.take_along_axis(self.scores, indexes, axis=1)
+        order   = np.argsort(-values, axis=1, kind='stable')
+
+        return np.take_along_axis(indexes, order, axis=1), np.take_along_axis(values, order, axis=1)
+
+    def top_k_ids(self, k: int) -> list:
+        """
+        Returns:
+            (list): Concept ids of top_k, one list per input
+        """
+        indexes, _ = self.top_k(k)
+
+        return [[self.concept_ids[idx] for idx in row] for row in indexes.tolist()]
+
+    def _ground_truth_matrix(self, ground_truth: 'np.ndarray or list') -> 'np.ndarray':
+        if isinstance(ground_truth, np.ndarray):
+            if ground_truth.shape != self.scores.shape:
+                raise UserError(f'Ground truth of shape {ground_truth.shape} does not match the scores {self.scores.shape}')
+
+            return ground_truth.astype(bool, copy=False)
+
+        if len(ground_truth) != len(self):
+            raise UserError(f'{len(ground_truth)} ground truth rows for {len(self)} inputs')
+
+        matrix = np.zeros(self.scores.shape, dtype=bool)
+
+        for row, concept_ids in enumerate(ground_truth):
+            columns = [self.concept_index[concept_id] for concept_id in concept_ids if concept_id in self.concept_index]
+            matrix[row, columns] = True
+
+        return matrix
+
+    def precision_at(self, ground_truth: 'np.ndarray or list', threshold: float) -> 'np.ndarray':
+        """
+        Args:
+            ground_truth (np.ndarray or list): (inputs x concepts) booleans, or the concept ids of each input
+            threshold (float): Scores at least this high count as predicted
+
+        Returns:
+            (np.ndarray): Precision of each concept, NaN for a concept never predicted. Failed outputs are left out.
+        """
+        predicted = self.threshold(threshold) & self.valid[:, None]
+        positives = predicted.sum(axis=0)
+        true      = (predicted & self._ground_truth_matrix(ground_truth)).sum(axis=0)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(positives > 0, true / positives, np.nan)
@@ -1 +1,157 @@
-API_BASE_URL = 'https://api.clarifai.com'
\ No newline at end of file
+API_BASE_URL = 'https://api.clarifai.com'
+
+# Connection pool shared by every module of a ClarifaiApi instance
+DEFAULT_HTTP_CONFIG = {
+    'pool_connections': 10,  # number of per-host pools to cache
+    'pool_maxsize': 10,      # max keep-alive connections per host
+    'pool_block': False,     # block instead of opening extra connections once pool_maxsize is reached
+    'connect_timeout': 10,
+    'read_timeout': 60       # seconds without a byte from the server, None for no limit
+}
+
+# Retries happen in HttpClient, only for idempotent methods unless 'retry_non_idempotent' is set
+DEFAULT_RETRY_CONFIG = {
+    'max_attempts': 3,                               # first attempt included
+    'backoff_factor': 0.5,                           # sleep = backoff_factor * 2 ** (attempt - 1)
+    'max_backoff': 30,
+    'jitter': True,                                  # "full jitter", sleep is drawn from [0, backoff]
+    'retry_on_http_status': (429, 500, 502, 503, 504),
+    'retry_on_clarifai_status': (10030, 11005),      # TRY_AGAIN, CONN_THROTTLED
+    'retry_on_connection_errors': True,
+    'respect_retry_after': True,
+    'max_retry_after': 120,
+    'retry_non_idempotent': False
+}
+
+# Client-side token bucket, one bucket per API key. Disabled unless rate_limit_config is given
+DEFAULT_RATE_LIMIT_CONFIG = {
+    'requests_per_second': 10,
+    'burst': 10,
+    'endpoint_weights': {}   # e.g. {'models__predict': 2}, endpoints not listed weigh 1
+}
+
+# ResponseWrapper rendering, .json is only built when accessed
+DEFAULT_RESPONSE_CONFIG = {
+    'pretty_print_if_json': True,
+    'render_json': True      # False: .json is never rendered and returns None
+}
+
+# Request bodies are only compressed when 'request_encoding' is set (opt-in)
+DEFAULT_COMPRESSION_CONFIG = {
+    'request_encoding': None,    # 'gzip' or 'deflate'
+    'min_request_size': 1024,    # bytes, smaller bodies are sent as is
+    'compress_level': 6,
+    'accept_encoding': 'gzip, deflate',
+    'compressed_response_endpoints': ('inputs__list', 'inputs__stream', 'usage__historical')
+}
+
+# Hedged requests, only used by calls made with hedge=True (Models.predict)
+DEFAULT_HEDGE_CONFIG = {
+    'percentile': 95,          # a duplicate is sent once the request is slower than this latency percentile
+    'min_delay': 0.05,         # seconds, lower bound of the hedging delay
+    'min_samples': 20,         # no hedging until the endpoint has this many latency samples
+    'window_size': 1000,       # latency samples kept per endpoint
+    'max_hedge_ratio': 0.1,    # at most this fraction of hedge-enabled requests get a duplicate
+    'max_workers': 16          # threads used by the synchronous client to run hedged requests
+}
+
+# Models.predict_all: inputs split into API-sized batches sent concurrently
+DEFAULT_BATCH_PREDICT_CONFIG = {
+    'batch_size': 128,         # inputs per predict request, the API limit
+    'max_workers': 8           # threads of the shared pool (sync client), concurrent batches per call
+}
+
+# PredictBatcher: single-input predicts merged into batch requests per model version
+DEFAULT_PREDICT_BATCHER_CONFIG = {
+    'max_batch_size': 32,      # a batch is sent as soon as it holds this many inputs...
+    'max_wait': 0.01,          # ...or this many seconds after its first input was submitted
+    'max_concurrency': 4       # batch requests in flight, later batches keep filling up meanwhile
+}
+
+# Downscaling of the images sent as base64 (Inputs.add, Models.predict). Disabled unless preprocess_config is given, needs Pillow
+DEFAULT_PREPROCESS_CONFIG = {
+    'max_side': 512,           # px, longest side once resized, smaller images are never upscaled
+    'format': 'JPEG',          # re-encoding format: 'JPEG' or 'WEBP'
+    'quality': 85,
+    'strip_exif': True,        # the EXIF orientation is applied to the pixels before the metadata is dropped
+    'max_workers': 4           # threads decoding and encoding images
+}
+
+# Singleflight: concurrent identical requests share one in-flight HTTP call
+DEFAULT_COALESCE_CONFIG = {
+    'enabled': False,              # opt-in, waiters get the response object of another caller
+    'methods': ('GET',),           # only read requests are safe to share
+    'excluded_endpoints': ()       # endpoint names always sent on their own
+}
+
+# Cache of read-mostly endpoints. Disabled unless cache_config is given
+DEFAULT_CACHE_CONFIG = {
+    'backend': 'memory',           # or 'sqlite': persistent, shared by the processes of a host
+    'max_entries': 1024,           # memory: least recently used responses are evicted past this count...
+    'max_bytes': 100 * 1024 ** 2,  # ...sqlite: past this size of stored responses
+    'directory': None,             # sqlite: defaults to ~/.cache/clarifai_python_sdk
+    'ttls': {                      # seconds, only these endpoints are cached
+        'models__get_model_by_id': 300,
+        'models__get_model_versions_by_model_id': 300,
+        'models__output_info': 300,
+        'models__output_info__with_version_id': 300,
+        'models__list_model_types': 3600,
+        'apps_with_app_id': 300,
+        'concepts__list': 60
+    },
+    'invalidate_on': {             # non-GET request to an endpoint -> cached endpoints of its app to drop, None for all
+        'apps_with_app_id': None,
+        'models__train': (
+            'models__get_model_by_id',
+            'models__get_model_versions_by_model_id',
+            'models__output_info',
+            'models__output_info__with_version_id'
+        ),
+        'inputs__post': ('concepts__list',)
+    }
+}
+
+# Outputs of Models.predict by model version, input content and output config. Disabled unless predict_cache_config is given
+DEFAULT_PREDICT_CACHE_CONFIG = {
+    'max_entries': 10000,          # memory tier, least recently used outputs are evicted past this count
+    'disk': False,                 # True adds a sqlite tier behind the memory one, shared by the processes of a host
+    'directory': None,             # disk tier: defaults to ~/.cache/clarifai_python_sdk
+    'max_bytes': 1024 ** 3,        # disk tier: least recently used outputs are evicted past this size
+    'ttl': None,                   # seconds, None: outputs of a pinned model version do not change
+    'cache_unpinned': False        # also cache predictions made without model_version_id, dropped by Models.train
+}
+
+# Per-endpoint circuit breaker. Disabled unless circuit_breaker_config is given
+DEFAULT_CIRCUIT_BREAKER_CONFIG = {
+    'consecutive_failures': 5,     # opens after this many failures in a row...
+    'error_rate': 0.5,             # ...or when this fraction of the last window_size calls failed
+    'window_size': 20,
+    'min_calls': 10,               # error_rate is only considered once the window holds this many calls
+    'reset_timeout': 30,           # seconds spent open before letting probe requests through (half-open)
+    'half_open_max_calls': 1,      # concurrent probe requests while half-open
+    'failure_http_status': (429, 500, 502, 503, 504)
+}
+
+# In-memory metrics fed by the request hooks. Disabled unless metrics_config is given
+DEFAULT_METRICS_CONFIG = {
+    'namespace': 'clarifai',       # prefix of the prometheus metric names
+    'min_latency': 0.001,          # seconds, upper bound of the first latency bucket...
+    'max_latency': 120.0,          # ...buckets grow geometrically up to this one, slower requests land in +Inf
+    'buckets_per_doubling': 2      # resolution of the latency buckets, 2 gives ~41% wide buckets
+}
+
+# In-process fake Clarifai API (FakeClarifaiServer), for benchmarks and tests without network access
+DEFAULT_FAKE_SERVER_CONFIG = {
+    'latency': 0.0,                # seconds added to every response...
+    'latency_jitter': 0.0,         # ...plus up to this many seconds, uniformly drawn
+    'endpoint_latency': {},        # e.g. {'models__predict': 0.2}, replaces 'latency' for these endpoint names
+    'error_rate': 0.0,             # fraction of requests answered with error_http_status
+    'error_http_status': 503,
+    'connection_error_rate': 0.0,  # fraction of requests failing before any response is sent
+    'num_inputs': 1000,            # inputs and concepts the fake app starts with
+    'num_concepts': 100,
+    'max_concepts': 20,            # concepts returned per predict output
+    'embedding_size': 512,         # length of the vectors of embedding models (model id containing "embed")
+    'etags': True,                 # ETag on GET responses, If-None-Match answered with a 304
+    'seed': None                   # makes latency, errors and payloads reproducible
+}
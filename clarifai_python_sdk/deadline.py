@@ -0,0 +1,60 @@
+# SYSTEM
+import time
+
+# ERRORS
+from clarifai_python_sdk.errors import DeadlineExceededError
+
+
+class Deadline:
+    """
+    Point in time after which a call, and every request it makes, gives up.
+    Multi-request helpers create one and hand it down so each sub-request only gets the remaining budget.
+    """
+
+    # socket timeouts have to be strictly positive
+    MIN_SOCKET_TIMEOUT = 0.001
+
+    def __init__(self, timeout: float):
+        self.timeout     = timeout
+        self._expires_at = time.monotonic() + timeout
+
+    @classmethod
+    def from_timeout(cls, timeout: 'float or Deadline' = None) -> 'Deadline':
+        """
+        Args:
+            timeout (float or Deadline, optional): An existing Deadline is returned as is
+
+        Returns:
+            (Deadline or None): None when there is no timeout
+        """
+        if timeout is None or isinstance(timeout, Deadline):
+            return timeout
+
+        return cls(timeout)
+
+    def remaining(self) -> float:
+        return max(0.0, self._expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self, endpoint: str = None) -> None:
+        """
+        Raises:
+            DeadlineExceededError: When there is no time left
+        """
+        if self.expired:
+            raise DeadlineExceededError(self.timeout, endpoint)
+
+    def cap(self, seconds: float = None) -> float:
+        """
+        Args:
+            seconds (float, optional): None means no limit
+
+        Returns:
+            (float): seconds or the remaining time, whichever is smaller
+        """
+        remaining = max(self.remaining(), self.MIN_SOCKET_TIMEOUT)
+
+        return remaining if seconds is None else min(seconds, remaining)
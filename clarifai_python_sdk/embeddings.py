@@ -0,0 +1,137 @@
+# SYSTEM
+import os
+
+# PACKAGES
+try:
+    import numpy as np
+except ImportError: # optional, only needed by EmbeddingStore
+    np = None
+
+# ERRORS
+from clarifai_python_sdk.errors import UserError
+
+
+def get_embedding(output: dict) -> list or None:
+    """
+    Returns:
+        (list or None): Vector of the first embedding of a predict output
+    """
+    embeddings = (output or {}).get('data', {}).get('embeddings')
+
+    return embeddings[0]['vector'] if embeddings else None
+
+
+class EmbeddingStore:
+    """
+    Embedding vectors in a preallocated .npy file opened as a memmap (np.load(path, mmap_mode='r') reads it
+    back), and their input ids in `<path>.ids`, one per line: line i is the id of row i.
+
+    Rows are written in order and the ids file is only appended once their vectors are flushed, so the
+    number of ids is the number of rows safely written, where an interrupted extraction resumes.
+    Rows of inputs that failed are NaN. The file is allocated with the first vector written, whose size
+    gives the number of dimensions.
+    """
+
+    def __init__(self, path: str, total: int = None, dtype: str = 'float32'):
+        """
+        Args:
+            path (str): Of the .npy file, opened when it exists
+            total (int, optional): Rows to allocate, checked against an existing file
+            dtype (str, optional): Of a new file. Defaults to 'float32'.
+
+        Raises:
+            UserError: When the existing file was allocated for another number of rows
+        """
+        if np is None:
+            raise UserError('EmbeddingStore needs NumPy: pip install numpy')
+
+        self.path     = path
+        self.ids_path = path + '.ids'
+        self.dtype    = dtype
+        self.vectors  = None
+        self.ids      = []
+
+        self._total = total
+        self._index = None
+
+        if os.path.exists(self.path):
+            self.vectors = np.load(self.path, mmap_mode='r+')
+
+            if os.path.exists(self.ids_path):
+                with open(self.ids_path, encoding='utf-8') as file:
+                    self.ids = file.read().splitlines()
+
+            if total is not None and self.total != total:
+                raise UserError(f'{self.path} holds {self.total} rows, not {total}: remove it or pass the same total')
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def total(self) -> int or None:
+        return self.vectors.shape[0] if self.vectors is not None else self._total
+
+    @property
+    def complete(self) -> bool:
+        return self.vectors is not None and len(self.ids) == self.total
+
+    def _create(self, num_dimensions: int) -> None:
+        if self._total is None:
+            raise UserError('The number of rows to allocate (total) is required to create an EmbeddingStore')
+
+        self.vectors = np.lib.format.open_memmap(self.path, mode='w+', dtype=self.dtype, shape=(self._total, num_dimensions))
+        self.ids     = []
+
+        open(self.ids_path, 'w').close()
+
+    def write(self, ids: list, vectors: list) -> bool:
+        """
+        Write the next rows, vectors of failed inputs being None
+
+        Returns:
+            (bool): False when nothing was written: the file does not exist yet and every vector is None,
+                the rows have to be given again with the next ones
+        """
+        if not ids:
+            return True
+
+        if self.vectors is None:
+            vector = next((vector for vector in vectors if vector is not None), None)
+
+            if vector is None:
+                return False
+
+            self._create(len(vector))
+
+        start = len(self.ids)
+
+        if start + len(ids) > self.total:
+            raise UserError(f'More inputs than the {self.total} rows allocated in {self.path}')
+
+        for row, vector in enumerate(vectors, start):
+            self.vectors[row] = vector if vector is not None else np.nan
+
+        self.vectors.flush()
+
+        with open(self.ids_path, 'a', encoding='utf-8') as file:
+            file.write(''.join(f'{input_id}\n' for input_id in ids))
+
+        self.ids.extend(ids)
+        self._index = None
+
+        return True
+
+    def get(self, input_id: str) -> 'np.ndarray':
+        """
+        Returns:
+            (np.ndarray): The vector of an input id, a view
+        """
+        if self._index is None:
+            self._index = {input_id: row for row, input_id in enumerate(self.ids)}
+
+        return self.vectors[self._index[input_id]]
+
+    def close(self) -> None:
+        if self.vectors is not None:
+            self.vectors.flush()
+            self.vectors = None
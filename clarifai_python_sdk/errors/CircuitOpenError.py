@@ -0,0 +1,12 @@
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while the circuit breaker of its endpoint is open
+    """
+    def __init__(self, endpoint_index_name: str, retry_in: float):
+        super().__init__()
+
+        self.endpoint_index_name = endpoint_index_name
+        self.retry_in            = retry_in
+        self.message             = f'Circuit breaker for "{endpoint_index_name}" is open, retry in {retry_in:.1f}s'
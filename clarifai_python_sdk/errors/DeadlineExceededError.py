@@ -0,0 +1,12 @@
+
+
+class DeadlineExceededError(Exception):
+    """
+    Raised when the timeout given to a call (or the client-wide default) runs out
+    """
+    def __init__(self, timeout: float, endpoint: str = None):
+        super().__init__()
+
+        self.timeout  = timeout
+        self.endpoint = endpoint
+        self.message  = f'Deadline of {timeout}s exceeded' + (f' while requesting "{endpoint}"' if endpoint else '')
@@ -0,0 +1,13 @@
+
+
+class PredictError(Exception):
+    """
+    Failure of one input of a batched predict (Models.predict_all), its output status or the one of its request
+    """
+    def __init__(self, status: dict):
+        super().__init__()
+
+        self.status      = status
+        self.status_code = status.get('code')
+        self.message     = f'Predict failed with status {self.status_code}: {status.get("description")}' \
+            + (f' ({status["details"]})' if status.get('details') else '')
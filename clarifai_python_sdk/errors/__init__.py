@@ -1 +1,4 @@
-from .UserError import UserError
\ No newline at end of file
+from .UserError import UserError
+from .CircuitOpenError import CircuitOpenError
+from .DeadlineExceededError import DeadlineExceededError
+from .PredictError import PredictError
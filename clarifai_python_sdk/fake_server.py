@@ -0,0 +1,607 @@
+# SYSTEM
+import re, json, time, random, bisect, hashlib, threading, asyncio
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit, parse_qsl
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# PACKAGES
+from dateutil import parser as date_parser
+
+# PACKAGE
+from clarifai_python_sdk.endpoints import ENDPOINTS
+from clarifai_python_sdk.utils.json_codec import get_json_codec
+from clarifai_python_sdk.utils.compression import decompress_body
+from clarifai_python_sdk.transport import Transport, AsyncTransport, TransportResponse
+from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_FAKE_SERVER_CONFIG
+
+
+# (method, endpoint name of ENDPOINTS, handler), the first match wins
+ROUTES = (
+    ('GET',    'me',                                     '_me'),
+    ('GET',    'apps',                                   '_list_apps'),
+    ('POST',   'apps',                                   '_create_apps'),
+    ('GET',    'apps_with_app_id',                       '_get_app'),
+    ('DELETE', 'apps_with_app_id',                       '_delete_app'),
+    ('POST',   'models__predict',                        '_predict'),
+    ('POST',   'models__predict_without_version_id',     '_predict'),
+    ('POST',   'models__train',                          '_train_model'),
+    ('GET',    'models__list',                           '_list_models'),
+    ('GET',    'models__list_model_types',               '_list_model_types'),
+    ('GET',    'models__get_model_by_id',                '_get_model'),
+    ('GET',    'models__get_model_versions_by_model_id', '_list_model_versions'),
+    ('GET',    'models__get_model_training_inputs',      '_list_inputs'),
+    ('POST',   'models__search',                         '_list_models'),
+    ('GET',    'models__output_info',                    '_get_model_output_info'),
+    ('GET',    'models__output_info__with_version_id',   '_get_model_output_info'),
+    ('POST',   'inputs__post',                           '_add_inputs'),
+    ('DELETE', 'inputs__post',                           '_delete_inputs'),
+    ('GET',    'inputs__list',                           '_list_inputs'),
+    ('GET',    'inputs__stream',                         '_stream_inputs'),
+    ('POST',   'inputs__searches',                       '_search_inputs'),
+    ('GET',    'concepts__list',                         '_list_concepts'),
+    ('GET',    'usage__historical',                      '_historical_usage')
+)
+
+USAGE_CATEGORIES = ('stored-input', 'model-predict', 'search', 'model-training-hours')
+MODEL_TYPES      = ('visual-classifier', 'visual-detector', 'visual-embedder', 'text-classifier', 'clusterer')
+
+
+def _compile_route(endpoint: str) -> re.Pattern:
+    # '/v2/users/{user_id}/apps' -> '/v2/users/(?P<user_id>[^/]+)/apps'
+    parts = re.split(r'\{(\w+)\}', endpoint)
+
+    return re.compile(''.join(
+        f'(?P<{part}>[^/]+)' if idx % 2 else re.escape(part) for idx, part in enumerate(parts)
+    ))
+
+
+COMPILED_ROUTES = tuple((method, name, _compile_route(ENDPOINTS[name]), handler) for method, name, handler in ROUTES)
+
+
+class FakeClarifaiServer:
+    """
+    In-process stand-in for the Clarifai API implementing every route of ENDPOINTS with realistic payloads:
+    paginated inputs, the stream cursor, searches, predict outputs (concepts or embeddings) and usage feeds.
+    Latency, http errors and connection errors can be injected, see DEFAULT_FAKE_SERVER_CONFIG.
+
+    Plug it into a client through its transports...
+        server   = FakeClarifaiServer({'latency': 0.02, 'error_rate': 0.01})
+        clarifai = ClarifaiApi('token', app_id='app', transport=server.transport())
+        clarifai = AsyncClarifaiApi('token', app_id='app', transport=server.async_transport())
+
+    ...or over real sockets with `base_url = server.serve()`.
+    """
+
+    def __init__(self, fake_server_config: dict = None):
+        self.fake_server_config = {**DEFAULT_FAKE_SERVER_CONFIG, **(fake_server_config or {})}
+
+        self.requests = Counter() # per endpoint name, see stats()
+
+        self._random      = random.Random(self.fake_server_config['seed'])
+        self._lock        = threading.Lock()
+        self._http_server = None
+        self._json_codec  = get_json_codec()
+        self._outputs     = {} # predict output data by input digest, keeps the fake cheap next to the client
+
+        self.concepts = [self._build_concept(f'concept-{idx}') for idx in range(self.fake_server_config['num_concepts'])]
+        self.inputs   = [self._build_input(self._random_image_url()) for _ in range(self.fake_server_config['num_inputs'])]
+        self.apps     = {'fake-app': self._build_app('fake-app')}
+        self.models   = {model_id: self._build_model(model_id) for model_id in ('general-image-recognition', 'general-image-embedding')}
+
+    # --- transports
+
+    def transport(self) -> 'FakeTransport':
+        return FakeTransport(self)
+
+    def async_transport(self) -> 'AsyncFakeTransport':
+        return AsyncFakeTransport(self)
+
+    def serve(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """
+        Serve the fake API over http from a background thread
+
+        Returns:
+            (str): base_url to give to the client
+        """
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _handle(self):
+                data          = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                delay, result = server.dispatch(self.command, self.path, dict(self.headers), data)
+
+                time.sleep(delay)
+
+                if isinstance(result, Exception):
+                    self.close_connection = True
+                    return
+
+                self.send_response(result.status)
+                for header in result.headers.items():
+                    self.send_header(*header)
+                self.end_headers()
+                self.wfile.write(result.content)
+
+            do_GET = do_POST = do_DELETE = do_PATCH = _handle
+
+            def log_message(self, *args):
+                pass
+
+        self._http_server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._http_server.serve_forever, daemon=True).start()
+
+        return 'http://{}:{}'.format(*self._http_server.server_address)
+
+    def shutdown(self) -> None:
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+
+    def stats(self) -> dict:
+        return {'requests': sum(self.requests.values()), 'by_endpoint': dict(self.requests)}
+
+    # --- request handling
+
+    def dispatch(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        data: bytes = None
+        ) -> tuple:
+        """
+        Args:
+            method (str)
+            url (str): Absolute url or path with query string
+            headers (dict)
+            data (bytes, optional)
+
+        Returns:
+            (tuple): (delay in seconds to wait before answering, TransportResponse or the exception to raise)
+        """
+        path, query_params = self._split_url(url)
+        route              = self._match_route(method.upper(), path)
+
+        if route is None:
+            return 0.0, self._response(404, self._status(ClarifaiStatusCodes.FAILURE, 'Failure', f'Unknown route {method} {path}'))
+
+        endpoint_name, handler, path_variables = route
+
+        with self._lock:
+            self.requests[endpoint_name] += 1
+
+            delay = self._get_delay(endpoint_name)
+
+            if self._random.random() < self.fake_server_config['connection_error_rate']:
+                return delay, ConnectionError(f'Injected connection error on "{endpoint_name}"')
+
+            if self._random.random() < self.fake_server_config['error_rate']:
+                return delay, self._error_response()
+
+            body                 = self._decode_body(headers, data)
+            http_status, payload = getattr(self, handler)(path_variables, query_params, body)
+
+        if method.upper() == 'GET' and http_status == 200 and self.fake_server_config['etags']:
+            return delay, self._conditional_response(headers, payload)
+
+        return delay, self._response(http_status, payload)
+
+    @staticmethod
+    def _split_url(url: str) -> tuple:
+        url = urlsplit(url)
+
+        return url.path, dict(parse_qsl(url.query))
+
+    @staticmethod
+    def _match_route(method: str, path: str) -> tuple:
+        for route_method, endpoint_name, pattern, handler in COMPILED_ROUTES:
+            match = pattern.fullmatch(path)
+
+            if match and route_method == method:
+                return endpoint_name, handler, match.groupdict()
+
+        return None
+
+    def _get_delay(self, endpoint_name: str) -> float:
+        latency = self.fake_server_config['endpoint_latency'].get(endpoint_name, self.fake_server_config['latency'])
+
+        return latency + self._random.uniform(0, self.fake_server_config['latency_jitter'])
+
+    def _decode_body(self, headers: dict, data: bytes = None) -> dict:
+        if not data:
+            return {}
+
+        encoding = {key.lower(): value for key, value in headers.items()}.get('content-encoding')
+
+        return self._json_codec.loads(decompress_body(data, encoding))
+
+    def _error_response(self) -> TransportResponse:
+        http_status = self.fake_server_config['error_http_status']
+        code        = ClarifaiStatusCodes.CONN_THROTTLED if http_status == 429 else ClarifaiStatusCodes.FAILURE
+
+        return self._response(http_status, self._status(code, 'Failure', 'Injected error'))
+
+    def _response(self, http_status: int, payload: dict, headers: dict = None) -> TransportResponse:
+        content = self._json_codec.dumps(payload)
+
+        return TransportResponse(
+            http_status,
+            {'Content-Type': 'application/json', 'Content-Length': str(len(content)), **(headers or {})},
+            content
+        )
+
+    def _conditional_response(self, headers: dict, payload: dict) -> TransportResponse:
+        # the status carries a new req_id every time, it is left out of the ETag
+        data          = self._json_codec.dumps({key: value for key, value in payload.items() if key != 'status'})
+        etag          = '"%s"' % hashlib.sha1(data).hexdigest()
+        if_none_match = {key.lower(): value for key, value in headers.items()}.get('if-none-match')
+
+        if if_none_match == etag:
+            return TransportResponse(304, {'ETag': etag, 'Content-Length': '0'}, b'')
+
+        return self._response(200, payload, {'ETag': etag})
+
+    def _status(self, code: int = ClarifaiStatusCodes.SUCCESS, description: str = 'Ok', details: str = None) -> dict:
+        return {
+            'status': {
+                'code': code,
+                'description': description,
+                **({'details': details} if details else {}),
+                'req_id': self._new_id()
+            }
+        }
+
+    def _ok(self, **entries) -> tuple:
+        return 200, {**self._status(), **entries}
+
+    def _not_found(self, details: str) -> tuple:
+        return 404, self._status(ClarifaiStatusCodes.FAILURE, 'Resource does not exist', details)
+
+    # --- payload builders
+
+    def _new_id(self) -> str:
+        return '%032x' % self._random.getrandbits(128)
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+    def _random_image_url(self) -> str:
+        return f'https://samples.clarifai.com/fake/{self._new_id()}.jpg'
+
+    def _build_concept(self, name: str) -> dict:
+        return {'id': name, 'name': name, 'value': 1, 'created_at': self._now(), 'language': 'en', 'app_id': 'fake-app'}
+
+    def _build_app(self, app_id: str, **entries) -> dict:
+        return {
+            'id': app_id,
+            'name': entries.get('name', app_id),
+            'default_language': entries.get('default_language', 'en'),
+            'default_workflow_id': entries.get('default_workflow_id', 'General'),
+            'user_id': 'fake-user',
+            'created_at': self._now(),
+            'modified_at': self._now()
+        }
+
+    def _build_model(self, model_id: str) -> dict:
+        return {
+            'id': model_id,
+            'name': model_id,
+            'created_at': self._now(),
+            'app_id': 'main',
+            'output_info': {
+                'output_config': {'max_concepts': self.fake_server_config['max_concepts'], 'min_value': 0},
+                'message': 'Show output_info with: GET /models/{model_id}/output_info'
+            },
+            'model_version': {
+                'id': self._new_id(),
+                'created_at': self._now(),
+                'status': {'code': 21100, 'description': 'Model is trained and ready'},
+                'active_concept_count': len(self.concepts),
+                'total_input_count': len(self.inputs)
+            },
+            'model_type_id': 'visual-embedder' if 'embed' in model_id else 'visual-classifier'
+        }
+
+    def _build_input(self, url: str, data: dict = None) -> dict:
+        data     = data or {}
+        concepts = data.get('concepts') or [
+            {'id': concept['id'], 'name': concept['name'], 'value': 1, 'app_id': 'fake-app'}
+            for concept in self._random.sample(self.concepts, min(2, len(self.concepts)))
+        ]
+
+        return {
+            'id': self._new_id(),
+            'data': {
+                'image': {
+                    'url': url,
+                    'hosted': {
+                        'prefix': 'https://s3.amazonaws.com/clarifai-api/img3/prod',
+                        'suffix': f'{self._new_id()}/{self._new_id()}',
+                        'sizes': ['orig', 'tiny', 'small', 'large']
+                    },
+                    'image_info': {'width': 1024, 'height': 768, 'format': 'JPEG', 'color_mode': 'YUV'}
+                },
+                'concepts': concepts,
+                **({'metadata': data['metadata']} if data.get('metadata') else {})
+            },
+            'created_at': self._now(),
+            'modified_at': self._now(),
+            'status': {'code': 30000, 'description': 'Download complete'}
+        }
+
+    def _build_output_data(self, model: dict, digest: str) -> dict:
+        rand = random.Random(digest)
+
+        if 'embed' in model['id']:
+            size = self.fake_server_config['embedding_size']
+
+            return {'embeddings': [{'vector': [rand.gauss(0, 1) for _ in range(size)], 'num_dimensions': size}]}
+
+        concepts = rand.sample(self.concepts, min(self.fake_server_config['max_concepts'], len(self.concepts)))
+        values   = sorted((rand.random() for _ in concepts), reverse=True)
+
+        return {'concepts': [
+            {'id': concept['id'], 'name': concept['name'], 'value': value, 'app_id': 'main'}
+            for concept, value in zip(concepts, values)
+        ]}
+
+    def _build_output(self, model: dict, input: dict) -> dict:
+        # outputs only depend on the model and the input data, like a real model would
+        digest = hashlib.sha1((model['id'] + json.dumps(input.get('data', {}), sort_keys=True)).encode()).hexdigest()
+        data   = self._outputs.get(digest)
+
+        if data is None:
+            data = self._outputs[digest] = self._build_output_data(model, digest)
+
+        return {
+            'id': digest[:32],
+            'status': {'code': ClarifaiStatusCodes.SUCCESS, 'description': 'Ok'},
+            'created_at': self._now(),
+            'model': {key: model[key] for key in ('id', 'name', 'created_at', 'app_id', 'model_version')},
+            'input': {'id': input.get('id', digest[:32]), 'data': input.get('data', {})},
+            'data': data
+        }
+
+    @staticmethod
+    def _paginate(items: list, page: int = 1, per_page: int = 128) -> list:
+        page, per_page = int(page or 1), int(per_page or 128)
+
+        return items[(page - 1) * per_page:page * per_page]
+
+    # --- route handlers: (path_variables, query_params, body) -> (http_status, payload)
+
+    def _me(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        return self._ok(user={'id': 'fake-user', 'first_name': 'Fake', 'last_name': 'User', 'created_at': self._now()})
+
+    def _list_apps(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        name = query_params.get('name', '').strip('*')
+        apps = [app for app in self.apps.values() if name in app['name']]
+
+        return self._ok(apps=self._paginate(apps, query_params.get('page'), query_params.get('per_page')))
+
+    def _create_apps(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        apps = [self._build_app(app['id'], **app) for app in body.get('apps', [])]
+        self.apps.update({app['id']: app for app in apps})
+
+        return self._ok(apps=apps)
+
+    def _get_app(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        app = self.apps.get(path_variables['app_id'])
+
+        return self._ok(app=app) if app else self._not_found(f'App {path_variables["app_id"]} not found')
+
+    def _delete_app(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        return self._ok() if self.apps.pop(path_variables['app_id'], None) \
+            else self._not_found(f'App {path_variables["app_id"]} not found')
+
+    def _get_or_create_model(self, model_id: str) -> dict:
+        # any model id can be predicted with, like public models
+        if model_id not in self.models:
+            self.models[model_id] = self._build_model(model_id)
+
+        return self.models[model_id]
+
+    def _predict(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        model = self._get_or_create_model(path_variables['model_id'])
+
+        return self._ok(outputs=[self._build_output(model, input) for input in body.get('inputs', [])])
+
+    def _train_model(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        model = self._get_or_create_model(path_variables['model_id'])
+        model['model_version'] = {
+            **model['model_version'],
+            'id': self._new_id(),
+            'created_at': self._now(),
+            'status': {'code': 21103, 'description': 'Model is queued for training.'}
+        }
+
+        return self._ok(model=model)
+
+    def _list_models(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        models = list(self.models.values())
+
+        return self._ok(models=self._paginate(models, query_params.get('page'), query_params.get('per_page')))
+
+    def _list_model_types(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        return self._ok(model_types=[{'id': model_type, 'title': model_type.replace('-', ' ')} for model_type in MODEL_TYPES])
+
+    def _get_model(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        model = self.models.get(path_variables['model_id'])
+
+        return self._ok(model=model) if model else self._not_found(f'Model {path_variables["model_id"]} not found')
+
+    def _list_model_versions(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        model = self.models.get(path_variables['model_id'])
+
+        return self._ok(model_versions=[model['model_version']]) if model \
+            else self._not_found(f'Model {path_variables["model_id"]} not found')
+
+    def _get_model_output_info(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        model = self.models.get(path_variables['model_id'])
+
+        if model is None:
+            return self._not_found(f'Model {path_variables["model_id"]} not found')
+
+        return self._ok(model={**model, 'output_info': {**model['output_info'], 'data': {'concepts': self.concepts}}})
+
+    def _add_inputs(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        inputs = []
+
+        for input in body.get('inputs', []):
+            data  = input.get('data', {})
+            media = data.get('image') or data.get('video') or {}
+            input = self._build_input(media.get('url') or self._random_image_url(), data)
+            input['status'] = {'code': 30001, 'description': 'Download pending'}
+            inputs.append(input)
+
+        self.inputs.extend(inputs)
+
+        return self._ok(inputs=inputs)
+
+    def _delete_inputs(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        ids         = set(body.get('ids', []))
+        self.inputs = [input for input in self.inputs if input['id'] not in ids]
+
+        return self._ok()
+
+    def _list_inputs(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        return self._ok(inputs=self._paginate(self.inputs, query_params.get('page'), query_params.get('per_page')))
+
+    def _stream_inputs(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        # the cursor is the id ordering, so streaming keeps working while the inputs it returned are deleted
+        per_page = int(query_params.get('per_page') or 128)
+        last_id  = query_params.get('last_id') or ''
+        inputs   = sorted(self.inputs, key=lambda input: input['id'])
+        start    = bisect.bisect_right([input['id'] for input in inputs], last_id)
+
+        return self._ok(inputs=inputs[start:start + per_page])
+
+    def _search_inputs(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        search     = (body.get('searches') or [{}])[0]
+        query      = search.get('query', {})
+        pagination = body.get('pagination', {})
+        inputs     = self.inputs
+
+        for filter in query.get('filters', []):
+            wanted = filter.get('annotation', {}).get('data', {}).get('concepts', [])
+            inputs = [
+                input for input in inputs
+                if any(
+                    concept.get('name', concept.get('id')) in (annotation['id'], annotation['name'])
+                    and concept.get('value', 1) == annotation['value']
+                    for concept in wanted for annotation in input['data']['concepts']
+                )
+            ]
+
+        hits = [{'score': 1.0, 'input': input} for input in inputs]
+
+        if query.get('ranks'):
+            rand = random.Random(json.dumps(query['ranks'], sort_keys=True))
+            hits = sorted(({'score': rand.random(), 'input': input} for input in inputs), key=lambda hit: -hit['score'])
+            hits = [hit for hit in hits if hit['score'] >= search.get('min_value', 0)]
+
+        return self._ok(
+            id=self._new_id(),
+            hits=self._paginate(hits, pagination.get('page'), pagination.get('per_page')),
+            searches=[search]
+        )
+
+    def _list_concepts(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        return self._ok(concepts=self._paginate(self.concepts, query_params.get('page'), query_params.get('per_page')))
+
+    def _historical_usage(self, path_variables: dict, query_params: dict, body: dict) -> tuple:
+        end_date   = date_parser.isoparse(query_params['end_date']) if query_params.get('end_date') else datetime.now(timezone.utc)
+        start_date = date_parser.isoparse(query_params['start_date']) if query_params.get('start_date') else end_date - timedelta(days=30)
+        per_app    = query_params.get('broken_down_per_app') in ('True', 'true')
+        app_ids    = list(self.apps) if per_app else [None]
+        rand       = random.Random(f'{start_date.date()}{end_date.date()}{per_app}')
+        usage      = []
+        day        = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        while day <= end_date:
+            for app_id in app_ids:
+                for category_id in USAGE_CATEGORIES:
+                    usage.append({
+                        'date': day.strftime('%Y-%m-%dT00:00:00Z'),
+                        'section': 'model_usage' if category_id == 'model-predict' else 'app_usage',
+                        **({'model_id': rand.choice(list(self.models))} if category_id == 'model-predict' else {}),
+                        **({'app_id': app_id} if app_id else {}),
+                        'category_id': category_id,
+                        'value': rand.randint(0, 500)
+                    })
+
+            day += timedelta(days=1)
+
+        return self._ok(usage=usage)
+
+
+class FakeTransport(Transport):
+    """
+    Sends requests to a FakeClarifaiServer without any network, latency is spent with time.sleep
+    """
+
+    def __init__(self, server: FakeClarifaiServer):
+        self.server = server
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        data: bytes = None,
+        timeout: tuple = None,
+        request_info: dict = None
+        ) -> TransportResponse:
+
+        delay, result = self.server.dispatch(method, url, headers, data)
+        read_timeout  = timeout[1] if timeout else None
+
+        if read_timeout is not None and delay > read_timeout:
+            time.sleep(read_timeout)
+            raise TimeoutError(f'Read timed out after {read_timeout}s')
+
+        time.sleep(delay)
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+
+class AsyncFakeTransport(AsyncTransport):
+    """
+    asyncio counterpart of FakeTransport, latency is spent with asyncio.sleep
+    """
+
+    def __init__(self, server: FakeClarifaiServer):
+        self.server = server
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        data: bytes = None,
+        timeout: float = None,
+        request_info: dict = None
+        ) -> TransportResponse:
+
+        delay, result = self.server.dispatch(method, url, headers, data)
+
+        if timeout is not None and delay > timeout:
+            await asyncio.sleep(timeout)
+            raise asyncio.TimeoutError()
+
+        await asyncio.sleep(delay)
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
@@ -0,0 +1,185 @@
+# SYSTEM
+import asyncio, threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_HEDGE_CONFIG
+
+
+class LatencyTracker:
+    """
+    Rolling window of the latencies measured by the client, per endpoint name
+    """
+
+    def __init__(self, window_size: int = 1000):
+        self.window_size = window_size
+
+        self._samples = {}
+        self._lock    = threading.Lock()
+
+    def record(self, endpoint_index_name: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint_index_name)
+
+            if samples is None:
+                samples = self._samples[endpoint_index_name] = deque(maxlen=self.window_size)
+
+            samples.append(seconds)
+
+    def count(self, endpoint_index_name: str) -> int:
+        return len(self._samples.get(endpoint_index_name, ()))
+
+    def percentile(self, endpoint_index_name: str, percentile: float) -> float or None:
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint_index_name, ()))
+
+        if not samples:
+            return None
+
+        return samples[min(len(samples) - 1, int(len(samples) * percentile / 100))]
+
+
+class RequestHedger:
+    """
+    Sends a duplicate of a slow request and keeps whichever answers first.
+
+    The hedging delay is the configured latency percentile of the endpoint, as measured by the client itself.
+    The loser is cancelled: asyncio tasks are really cancelled, with the synchronous client a request already
+    on the wire cannot be interrupted, its result is simply discarded.
+    """
+
+    def __init__(self, hedge_config: dict = None):
+        self.hedge_config    = {**DEFAULT_HEDGE_CONFIG, **(hedge_config or {})}
+        self.latency_tracker = LatencyTracker(self.hedge_config['window_size'])
+
+        self.number_of_requests = 0
+        self.number_of_hedges   = 0
+
+        self._executor = None
+        self._lock     = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.hedge_config['max_workers'],
+                    thread_name_prefix='clarifai-hedge'
+                )
+
+        return self._executor
+
+    def get_delay(self, endpoint_index_name: str) -> float or None:
+        """
+        Returns:
+            (float or None): Seconds to wait before hedging, None when there are not enough samples yet
+        """
+        if self.latency_tracker.count(endpoint_index_name) < self.hedge_config['min_samples']:
+            return None
+
+        return max(
+            self.hedge_config['min_delay'],
+            self.latency_tracker.percentile(endpoint_index_name, self.hedge_config['percentile'])
+        )
+
+    def _count_request(self) -> None:
+        with self._lock:
+            self.number_of_requests += 1
+
+    def _acquire_hedge(self) -> bool:
+        with self._lock:
+            if self.number_of_hedges + 1 > self.number_of_requests * self.hedge_config['max_hedge_ratio']:
+                return False
+
+            self.number_of_hedges += 1
+
+            return True
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, send: callable, endpoint_index_name: str) -> tuple:
+        """
+        Args:
+            send (callable): Sends the request once, called with a fresh request_info dict
+            endpoint_index_name (str)
+
+        Returns:
+            (tuple): (response, request_info) of the request that answered first
+        """
+        self._count_request()
+        delay = self.get_delay(endpoint_index_name)
+
+        if delay is None:
+            request_info = {}
+            return send(request_info), request_info
+
+        executor     = self._get_executor()
+        request_info = {}
+        attempts     = {executor.submit(send, request_info): request_info}
+
+        done, _ = wait(attempts, timeout=delay)
+
+        if not done and self._acquire_hedge():
+            hedge_request_info = {'hedged': True}
+            attempts[executor.submit(send, hedge_request_info)] = hedge_request_info
+
+        pending = set(attempts)
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner        = next((future for future in done if future.exception() is None), None)
+
+            if winner is not None or not pending:
+                break
+
+        for future in pending:
+            future.cancel()
+
+        if winner is None:
+            raise next(iter(done)).exception()
+
+        return winner.result(), attempts[winner]
+
+    async def run_async(self, send: callable, endpoint_index_name: str) -> tuple:
+        """
+        Args:
+            send (callable): Coroutine function sending the request once, called with a fresh request_info dict
+            endpoint_index_name (str)
+
+        Returns:
+            (tuple): (response, request_info) of the request that answered first
+        """
+        self._count_request()
+        delay = self.get_delay(endpoint_index_name)
+
+        if delay is None:
+            request_info = {}
+            return await send(request_info), request_info
+
+        request_info = {}
+        attempts     = {asyncio.ensure_future(send(request_info)): request_info}
+
+        done, _ = await asyncio.wait(attempts, timeout=delay)
+
+        if not done and self._acquire_hedge():
+            hedge_request_info = {'hedged': True}
+            attempts[asyncio.ensure_future(send(hedge_request_info))] = hedge_request_info
+
+        pending = set(attempts)
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winner        = next((task for task in done if task.exception() is None), None)
+
+            if winner is not None or not pending:
+                break
+
+        for task in pending:
+            task.cancel()
+
+        if winner is None:
+            raise next(iter(done)).exception()
+
+        return winner.result(), attempts[winner]
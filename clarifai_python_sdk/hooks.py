@@ -0,0 +1,124 @@
+# SYSTEM
+import warnings
+
+
+# phases of RequestEvent.timings, in the order they happen
+REQUEST_PHASES = ('url_build', 'serialize', 'rate_limit_wait', 'network', 'retry_wait', 'decode', 'wrap')
+
+
+class RequestEvent:
+    """
+    What hooks receive once a request is over, successful or not.
+
+    timings holds the seconds spent in each phase of REQUEST_PHASES...
+        - url_build: UrlHandler building the endpoint url
+        - serialize: json encoding (and compression) of the body
+        - rate_limit_wait: waits for the client-side rate limiter, before every attempt
+        - network: transport time summed over every attempt
+        - retry_wait: backoff sleeps between attempts
+        - decode: json decoding of the response
+        - wrap: filling the status fields ResponseWrapper reads, the wrapper itself is lazy
+    A phase that did not happen (no body, no retry, failed before sending...) is missing.
+    """
+
+    __slots__ = (
+        'endpoint_index_name', 'method', 'path_variables', 'duration', 'timings',
+        'request_info', 'clarifai_status', 'error'
+    )
+
+    def __init__(
+        self,
+        endpoint_index_name: str,
+        method: str,
+        path_variables: dict,
+        duration: float,
+        timings: dict,
+        request_info: dict,
+        clarifai_status: int = None,
+        error: Exception = None
+        ):
+
+        self.endpoint_index_name = endpoint_index_name
+        self.method              = method
+        self.path_variables      = path_variables
+        self.duration            = duration # seconds, from the deadline check to the response status being set
+        self.timings             = timings
+        self.request_info        = request_info
+        self.clarifai_status     = clarifai_status
+        self.error               = error
+
+    @property
+    def http_status(self) -> int or None:
+        return self.request_info.get('http_status')
+
+    @property
+    def attempts(self) -> int:
+        return self.request_info.get('attempts', 0)
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+    @property
+    def hedged(self) -> bool:
+        return bool(self.request_info.get('hedged'))
+
+    @property
+    def bytes_sent(self) -> int:
+        return self.request_info.get('request_bytes_sent', 0)
+
+    @property
+    def bytes_received(self) -> int or None:
+        # size on the wire, the decoded size when the response was chunked
+        return self.request_info.get('response_bytes_received') or self.request_info.get('response_bytes')
+
+    def as_dict(self) -> dict:
+        return {
+            'endpoint_index_name': self.endpoint_index_name,
+            'method': self.method,
+            'path_variables': self.path_variables,
+            'duration': self.duration,
+            'timings': self.timings,
+            'http_status': self.http_status,
+            'clarifai_status': self.clarifai_status,
+            'attempts': self.attempts,
+            'retries': self.retries,
+            'hedged': self.hedged,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'error': repr(self.error) if self.error is not None else None
+        }
+
+
+class RequestHooks:
+    """
+    Callables fired with a RequestEvent after every request, on the thread (or event loop) that made it.
+    With no hook registered nothing is built nor called.
+
+    A hook raising an exception does not fail the request, a RuntimeWarning is issued instead.
+    """
+
+    def __init__(self, hooks: list = None):
+        self._hooks = tuple(hooks or ())
+
+    def __bool__(self) -> bool:
+        return bool(self._hooks)
+
+    def __len__(self) -> int:
+        return len(self._hooks)
+
+    def add(self, hook: callable) -> callable:
+        # copy-on-write, requests being emitted keep iterating over the previous tuple
+        self._hooks = (*self._hooks, hook)
+
+        return hook
+
+    def remove(self, hook: callable) -> None:
+        self._hooks = tuple(registered for registered in self._hooks if registered is not hook)
+
+    def emit(self, event: RequestEvent) -> None:
+        for hook in self._hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                warnings.warn(f'Request hook {hook!r} raised {e!r}', RuntimeWarning)
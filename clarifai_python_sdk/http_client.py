@@ -1,36 +1,245 @@
 # SYSTEM IMPORTS
-import requests, json
+import json, time
+
+# PACKAGE
+from clarifai_python_sdk.retry import RetryPolicy
+from clarifai_python_sdk.deadline import Deadline
+from clarifai_python_sdk.rate_limiter import RateLimiter
+from clarifai_python_sdk.transport import Transport, RequestsTransport
+
+# UTILS
+from clarifai_python_sdk.utils.json_codec import JsonCodec, get_json_codec
+from clarifai_python_sdk.utils.compression import compress_body, compression_ratio
+
+# ERRORS
+from clarifai_python_sdk.errors import DeadlineExceededError
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_HTTP_CONFIG, DEFAULT_COMPRESSION_CONFIG
+
+
+class BaseHttpClient:
+    """
+    Everything HttpClient and AsyncHttpClient have in common: configuration, headers, body encoding and
+    the request_info bookkeeping. Sending is left to the subclasses.
+    """
 
-class HttpClient:
     def __init__(
         self,
-        token: str,
-        base_url: str
+        base_url: str,
+        http_config: dict = None,
+        retry_config: dict = None,
+        json_codec: str or JsonCodec = None,
+        compression_config: dict = None,
+        rate_limiter: RateLimiter = None
         ):
-        
-        self.token    = token
-        self.base_url = base_url
 
+        self.base_url           = base_url
+        self.http_config        = {**DEFAULT_HTTP_CONFIG, **(http_config or {})}
+        self.compression_config = {**DEFAULT_COMPRESSION_CONFIG, **(compression_config or {})}
+        self.json_codec         = get_json_codec(json_codec)
+        self.retry_policy       = RetryPolicy(retry_config)
+        self.rate_limiter       = rate_limiter
 
-    def make_request(
-        self, 
-        method: str, 
-        endpoint: str, 
+    def _build_request_args(
+        self,
+        method: str,
+        token: str,
         body: dict = None,
-        ) -> json:
+        accept_compressed: bool = False,
+        request_info: dict = None
+        ) -> dict:
 
-        method = method.lower()
-        args   = {}
-        req    = getattr(requests, method)
+        args = {}
 
-        args['headers'] = {'Authorization': f'Key {self.token}'}
+        args['headers'] = {'Authorization': f'Key {token}'}
 
         if method == 'post':
             args['headers'] = {**args['headers'], 'Content-Type': 'application/json'}
 
-        if body: 
-            args['data'] = json.dumps(body)
-                
-        r = req(self.base_url + endpoint, **args)
+        if accept_compressed:
+            args['headers']['Accept-Encoding'] = self.compression_config['accept_encoding']
+
+        if body:
+            started_at             = time.perf_counter()
+            data                   = self.json_codec.dumps(body)
+            args['data'], encoding = compress_body(data, self.compression_config)
+
+            self._add_timing(request_info, 'serialize', time.perf_counter() - started_at)
+
+            if encoding:
+                args['headers']['Content-Encoding'] = encoding
+
+            request_info.update({
+                'request_bytes': len(data),
+                'request_bytes_sent': len(args['data']),
+                'request_compression_ratio': compression_ratio(len(data), len(args['data']))
+            })
+
+        return args
+
+    @staticmethod
+    def _add_timing(request_info: dict, phase: str, seconds: float) -> None:
+        # summed over attempts, see hooks.REQUEST_PHASES
+        timings        = request_info.setdefault('timings', {})
+        timings[phase] = timings.get(phase, 0.0) + seconds
+
+    @staticmethod
+    def _can_wait(backoff: float, deadline: Deadline = None) -> bool:
+        # no point in sleeping when the next attempt would start after the deadline
+        return deadline is None or backoff < deadline.remaining()
+
+    @staticmethod
+    def _record_response_info(
+        request_info: dict,
+        attempt: int,
+        http_status: int,
+        headers: dict,
+        decoded_size: int
+        ) -> None:
+        # Content-Length is the size on the wire, it is missing for chunked responses
+        content_length = headers.get('Content-Length')
+        received_size  = int(content_length) if content_length and content_length.isdigit() else None
+
+        request_info.update({
+            'attempts': attempt,
+            'http_status': http_status,
+            'response_encoding': headers.get('Content-Encoding'),
+            'response_bytes': decoded_size,
+            'response_bytes_received': received_size,
+            'response_compression_ratio': compression_ratio(decoded_size, received_size),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified')
+        })
+
+
+class HttpClient(BaseHttpClient):
+    """
+    Sends every request through one Transport, by default a RequestsTransport keeping a keep-alive
+    connection pool. A single instance is owned by ClarifaiApi and shared by all modules.
+    """
+
+    def __init__(self, base_url: str, transport: Transport = None, **kwargs):
+        super().__init__(base_url, **kwargs)
+
+        self.transport = transport or RequestsTransport(self.http_config)
+
+    @property
+    def timeout(self) -> tuple:
+        return (self.http_config['connect_timeout'], self.http_config['read_timeout'])
+
+    def _get_timeout(self, deadline: Deadline = None) -> tuple:
+        if deadline is None:
+            return self.timeout
+
+        return tuple(deadline.cap(timeout) for timeout in self.timeout)
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        token: str,
+        body: dict = None,
+        idempotent: bool = None,
+        accept_compressed: bool = False,
+        request_info: dict = None,
+        deadline: Deadline = None,
+        headers: dict = None
+        ) -> json:
+        """
+        Args:
+            method (str)
+            endpoint (str)
+            token (str)
+            body (dict, optional)
+            idempotent (bool, optional): Allows retrying a read-only POST, see RetryPolicy
+            accept_compressed (bool, optional): Explicitly negotiate a compressed response
+            request_info (dict, optional): Filled with sizes, compression ratios, http status and attempts
+            deadline (Deadline, optional): Caps socket timeouts and stops retrying once it runs out
+            headers (dict, optional): Added to the request, e.g. If-None-Match
+
+        Raises:
+            DeadlineExceededError
+
+        Returns:
+            (dict): None when the server answered 304 Not Modified
+        """
+
+        method       = method.lower()
+        request_info = request_info if request_info is not None else {}
+        args         = self._build_request_args(method, token, body, accept_compressed, request_info)
+
+        if headers:
+            args['headers'].update(headers)
+
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            if deadline:
+                deadline.check(endpoint)
+
+            if self.rate_limiter:
+                # every attempt sent takes a token, retries and hedged duplicates included
+                waited = self.rate_limiter.acquire(token, request_info.get('endpoint_index_name'), deadline)
+                self._add_timing(request_info, 'rate_limit_wait', waited)
+
+            sent_at = time.perf_counter()
+
+            try:
+                r = self.transport.send(
+                    method.upper(),
+                    self.base_url + endpoint,
+                    timeout=self._get_timeout(deadline),
+                    request_info=request_info,
+                    **args
+                )
+            except self.transport.retryable_exceptions as e:
+                self._add_timing(request_info, 'network', time.perf_counter() - sent_at)
+
+                if deadline and deadline.expired:
+                    raise DeadlineExceededError(deadline.timeout, endpoint) from e
+
+                backoff = self.retry_policy.get_backoff(attempt)
+
+                if not self.retry_policy.should_retry(attempt, method, idempotent, exception=e) \
+                    or not self._can_wait(backoff, deadline):
+                    raise
+
+                time.sleep(backoff)
+                self._add_timing(request_info, 'retry_wait', backoff)
+                continue
+
+            self._add_timing(request_info, 'network', time.perf_counter() - sent_at)
+
+            if r.status == 304: # conditional request, the caller holds the body
+                self._record_response_info(request_info, attempt, r.status, r.headers, 0)
+
+                return None
+
+            decode_started_at = time.perf_counter()
+
+            try:
+                response = self.json_codec.loads(r.content)
+            except ValueError: # e.g. html body of a 502 from a proxy
+                response = None
+
+            self._add_timing(request_info, 'decode', time.perf_counter() - decode_started_at)
+
+            clarifai_status = response.get('status', {}).get('code') if isinstance(response, dict) else None
+
+            if self.retry_policy.should_retry(attempt, method, idempotent, r.status, clarifai_status):
+                backoff = self.retry_policy.get_backoff(attempt, r.headers.get('Retry-After'))
+
+                if self._can_wait(backoff, deadline):
+                    time.sleep(backoff)
+                    self._add_timing(request_info, 'retry_wait', backoff)
+                    continue
+
+            self._record_response_info(request_info, attempt, r.status, r.headers, len(r.content))
 
-        return r.json()
\ No newline at end of file
+            return response if response is not None else self.json_codec.loads(r.content)
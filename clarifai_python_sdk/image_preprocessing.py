@@ -0,0 +1,183 @@
+# SYSTEM
+import io, base64, asyncio, threading
+from concurrent.futures import ThreadPoolExecutor
+
+# PACKAGES
+try:
+    from PIL import Image, ImageOps
+except ImportError: # optional, only needed with preprocess_config
+    Image = ImageOps = None
+
+# ERRORS
+from clarifai_python_sdk.errors import UserError
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_PREPROCESS_CONFIG
+
+
+PREPROCESS_FORMATS = ('JPEG', 'WEBP')
+
+
+class ImagePreprocessor:
+    """
+    Downscales the images sent as base64 before they leave the client: resized to max_side, re-encoded
+    to JPEG or WebP at the configured quality, EXIF stripped. Images are processed on a thread pool,
+    Pillow releasing the GIL while decoding, resizing and encoding.
+
+    Urls are left to the API, except those of Inputs.add inputs with convert_src_to_base64 which are
+    downloaded first. Data that is not an image Pillow can read is sent as is.
+    """
+
+    def __init__(self, preprocess_config: dict = None):
+        if Image is None:
+            raise UserError('Image preprocessing needs Pillow: pip install Pillow')
+
+        self.preprocess_config = {**DEFAULT_PREPROCESS_CONFIG, **(preprocess_config or {})}
+
+        if self.preprocess_config['format'].upper() not in PREPROCESS_FORMATS:
+            raise UserError(f'Unknown image format "{self.preprocess_config["format"]}", options are: {", ".join(PREPROCESS_FORMATS)}')
+
+        self.images    = 0
+        self.skipped   = 0
+        self.bytes_in  = 0
+        self.bytes_out = 0
+
+        self._executor = None
+        self._lock     = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.preprocess_config['max_workers'],
+                    thread_name_prefix='clarifai-preprocess'
+                )
+
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _encode(self, image: 'Image.Image') -> bytes:
+        max_side = self.preprocess_config['max_side']
+        format   = self.preprocess_config['format'].upper()
+
+        # JPEGs are decoded straight at a reduced scale, much cheaper than decoding 4000px then resizing
+        image.draft('RGB', (max_side, max_side))
+
+        exif = image.info.get('exif')
+
+        if self.preprocess_config['strip_exif']:
+            image = ImageOps.exif_transpose(image)
+
+        image.thumbnail((max_side, max_side), Image.LANCZOS)
+
+        if image.mode in ('RGBA', 'LA', 'PA', 'RGBa', 'La') or 'transparency' in image.info:
+            image = image.convert('RGBA')
+
+            # JPEG has no alpha channel, transparent pixels are white rather than whatever color they hold
+            if format != 'WEBP':
+                background = Image.new('RGB', image.size, (255, 255, 255))
+                background.paste(image, mask=image.getchannel('A'))
+                image      = background
+        elif image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+
+        buffer = io.BytesIO()
+
+        image.save(
+            buffer,
+            format=format,
+            quality=self.preprocess_config['quality'],
+            **({'exif': exif} if exif and not self.preprocess_config['strip_exif'] else {})
+        )
+
+        return buffer.getvalue()
+
+    def process(self, content: bytes) -> bytes:
+        """
+        Args:
+            content (bytes): Encoded image, any format Pillow reads
+
+        Returns:
+            (bytes): The re-encoded image, content itself when it is not a readable image or when
+                re-encoding would not make it smaller without having to (no resize, no EXIF to strip)
+        """
+        try:
+            with Image.open(io.BytesIO(content)) as image:
+                required = max(image.size) > self.preprocess_config['max_side'] \
+                    or (self.preprocess_config['strip_exif'] and 'exif' in image.info)
+
+                processed = self._encode(image)
+        except (OSError, ValueError, Image.DecompressionBombError):
+            processed = None
+
+        if processed is None or (len(processed) >= len(content) and not required):
+            processed = content
+
+        with self._lock:
+            self.images    += processed is not content
+            self.skipped   += processed is content
+            self.bytes_in  += len(content)
+            self.bytes_out += len(processed)
+
+        return processed
+
+    def process_input(self, input: dict) -> dict:
+        """
+        Args:
+            input (dict): Input data as Inputs.add and Models.predict take it, e.g. {'image': {'base64': ...}}
+
+        Returns:
+            (dict): input itself when it has no base64 image, a copy holding the processed image otherwise
+        """
+        image = input.get('image')
+
+        if not image or not image.get('base64'):
+            return input
+
+        content = image['base64']
+        content = base64.b64decode(content) if isinstance(content, str) else content
+
+        return {**input, 'image': {**image, 'base64': base64.b64encode(self.process(content)).decode('ascii')}}
+
+    def process_inputs(self, inputs: list) -> list:
+        """
+        process_input over every input, on the pool of the preprocessor
+
+        Returns:
+            (list): New list, same order
+        """
+        if not any(input.get('image', {}).get('base64') for input in inputs):
+            return inputs
+
+        return list(self._get_executor().map(self.process_input, inputs))
+
+    async def process_inputs_async(self, inputs: list) -> list:
+        """
+        Same as process_inputs, without blocking the event loop
+        """
+        if not any(input.get('image', {}).get('base64') for input in inputs):
+            return inputs
+
+        loop = asyncio.get_running_loop()
+
+        return list(await asyncio.gather(*(
+            loop.run_in_executor(self._get_executor(), self.process_input, input) for input in inputs
+        )))
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            (dict): {'images': 120, 'skipped': 3, 'bytes_in': 480000000, 'bytes_out': 9000000, 'bytes_saved': 471000000, ...}
+        """
+        with self._lock:
+            return {
+                'images': self.images,
+                'skipped': self.skipped,
+                'bytes_in': self.bytes_in,
+                'bytes_out': self.bytes_out,
+                'bytes_saved': self.bytes_in - self.bytes_out,
+                'ratio': round(self.bytes_out / self.bytes_in, 3) if self.bytes_in else None
+            }
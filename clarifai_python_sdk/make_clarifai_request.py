@@ -1,14 +1,20 @@
 # SYSTEM
-import copy
+import time
 
 # PACKAGE
 from clarifai_python_sdk.http_client import HttpClient
+from clarifai_python_sdk.deadline import Deadline
+from clarifai_python_sdk.hooks import RequestEvent, REQUEST_PHASES
+from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
 
 # UTILS
 from clarifai_python_sdk.utils.url_handler import UrlHandler
 
 
 class MakeClarifaiRequest:
+
+    _make_request_on_init = True
+
     def __init__(
         self,
         endpoint_index_name: str,
@@ -18,6 +24,9 @@ class MakeClarifaiRequest:
         path_variables: dict = None,
         query_params: dict = None,
         body: dict = None,
+        idempotent: bool = None,
+        hedge: bool = False,
+        timeout: float or Deadline = None
         ):
         
         self.endpoint_index_name = endpoint_index_name
@@ -27,6 +36,9 @@ class MakeClarifaiRequest:
         self.auth_object    = auth_object
         self.package_params = package_params
         self.body           = body
+        self.idempotent     = idempotent # read-only POSTs (predict, searches) can be retried
+        self.hedge          = hedge      # send a duplicate when slow, see RequestHedger
+        self.deadline       = Deadline.from_timeout(timeout if timeout is not None else package_params.get('timeout'))
 
         if not self.auth_object: # is None or empty dict
             self.auth_object = {
@@ -42,18 +54,29 @@ class MakeClarifaiRequest:
         self.description = None
         self.details     = None
         self.response    = None
-        self.data        = None
+        self._data       = None
+        self._endpoint   = None
+
+        # added to the request, e.g. If-None-Match when revalidating a cached response
+        self.request_headers = None
+
+        # filled by the http client: sizes, compression ratios, http status, attempts, timings...
+        self.request_info = self._new_request_info()
+        self.timings      = {} # phases timed here rather than by the http client, see hooks.REQUEST_PHASES
 
-        self.make_request()
+        if self._make_request_on_init:
+            self.make_request()
 
     def _filter_status_details_from_response(self) -> None:
         self.details = self.response.get('status', {}).get('details')
 
-    def _filter_data_from_response(self) -> None:
-        response_copy = copy.deepcopy(self.response)
-        response_copy.pop('status')
-        
-        self.data = response_copy
+    @property
+    def data(self) -> dict:
+        # built on first access, shallow on purpose: large listings are not duplicated
+        if self._data is None and self.response is not None:
+            self._data = {key: value for key, value in self.response.items() if key != 'status'}
+
+        return self._data
 
     def _filter_status_code_from_response(self) -> None:
         self.status_code = self.response.get('status', {}).get('code')
@@ -61,23 +84,347 @@ class MakeClarifaiRequest:
     def _filter_status_description_from_response(self) -> None:
         self.description = self.response.get('status', {}).get('description')
 
-    def make_request(self):
-        endpoint = UrlHandler().build(
-            self.endpoint_index_name,
-            **({'path_variables': self.path_variables} if self.path_variables else {}),
-            **({'query_params': self.query_params} if self.query_params else {})
-        )
+    def _build_endpoint(self) -> str:
+        return UrlHandler.build(self.endpoint_index_name, self.path_variables, self.query_params)
 
-        response = HttpClient(
-            token=self.auth_object['token'],
-            base_url=self.package_params['base_url']
-        ).make_request(
-            method=self.method,
-            endpoint=endpoint,
-            **({'body': self.body} if self.body else {})
-        )
+    def _get_endpoint(self) -> str:
+        # built once, the coalescing key needs it before the request kwargs
+        if self._endpoint is None:
+            started_at     = time.perf_counter()
+            self._endpoint = self._build_endpoint()
+
+            self.timings['url_build'] = time.perf_counter() - started_at
+
+        return self._endpoint
+
+    def _get_request_key(self) -> tuple:
+        # identifies identical GET requests, for coalescing and caching
+        return (self.endpoint_index_name, self.auth_object['token'], self._get_endpoint())
+
+    def _get_app_id(self) -> str or None:
+        for user_app_id in (
+            self.path_variables,
+            (self.body or {}).get('user_app_id'),
+            self.auth_object.get('user_app_id'),
+            self.auth_object.get('user_data_object')
+        ):
+            if user_app_id and user_app_id.get('app_id'):
+                return user_app_id['app_id']
+
+        return None
+
+    def _get_cached_response(self, response_cache) -> dict or None:
+        if not response_cache.is_cacheable(self.endpoint_index_name, self.method):
+            return None
+
+        # conditional headers when an expired entry has to be revalidated
+        response, self.request_headers = response_cache.get(self._get_request_key())
+
+        if response is not None:
+            self.request_info['cached'] = True
+
+        return response
+
+    def _get_revalidated_response(self, response_cache) -> dict or None:
+        # after a 304 Not Modified
+        response = response_cache.revalidated(self._get_request_key())
+
+        if response is not None:
+            self.request_info['revalidated'] = True
+
+        return response
+
+    def _update_cache(self, response_cache, response: dict) -> None:
+        if response_cache.is_cacheable(self.endpoint_index_name, self.method) \
+            and not self.request_info.get('revalidated') \
+            and response.get('status', {}).get('code') == ClarifaiStatusCodes.SUCCESS:
+            response_cache.set(
+                self._get_request_key(),
+                self.endpoint_index_name,
+                self._get_app_id(),
+                response,
+                self.request_info.get('etag'),
+                self.request_info.get('last_modified')
+            )
+
+    def _get_http_request_kwargs(self, http_client) -> dict:
+        return {
+            'method': self.method,
+            'endpoint': self._get_endpoint(),
+            'token': self.auth_object['token'],
+            **({'body': self.body} if self.body else {}),
+            'idempotent': self.idempotent,
+            'accept_compressed': self.endpoint_index_name in http_client.compression_config['compressed_response_endpoints'],
+            'request_info': self.request_info,
+            'deadline': self.deadline,
+            **({'headers': self.request_headers} if self.request_headers else {})
+        }
 
+    def _set_response(self, response: dict) -> None:
         self.response = response
-        self._filter_data_from_response()
+        self._data    = None
         self._filter_status_code_from_response()
-        self._filter_status_description_from_response()
\ No newline at end of file
+        self._filter_status_description_from_response()
+
+    def _new_request_info(self) -> dict:
+        # also read by transports recording or routing requests, see Transport.send
+        return {'endpoint_index_name': self.endpoint_index_name, 'path_variables': self.path_variables or {}}
+
+    def _set_timed_response(self, response: dict) -> None:
+        started_at = time.perf_counter()
+
+        self._set_response(response)
+
+        self.timings['wrap'] = time.perf_counter() - started_at
+
+    def _build_request_event(self, started_at: float, error: Exception = None) -> RequestEvent:
+        timings = {**self.timings, **self.request_info.get('timings', {})}
+
+        return RequestEvent(
+            endpoint_index_name=self.endpoint_index_name,
+            method=self.method,
+            path_variables=self.path_variables or {},
+            duration=time.perf_counter() - started_at,
+            timings={phase: timings[phase] for phase in REQUEST_PHASES if phase in timings},
+            request_info=self.request_info,
+            clarifai_status=self.status_code,
+            error=error
+        )
+
+    def _get_circuit_breaker(self):
+        circuit_breakers = self.package_params.get('circuit_breakers')
+
+        return circuit_breakers.get(self.endpoint_index_name) if circuit_breakers else None
+
+    def _send(self, http_client) -> dict:
+        request_hedger = self.package_params.get('request_hedger')
+        request_kwargs = self._get_http_request_kwargs(http_client)
+        started_at     = time.perf_counter()
+
+        if self.hedge and request_hedger:
+            def send(request_info: dict) -> dict:
+                request_info.update(self._new_request_info())
+
+                return http_client.make_request(**{**request_kwargs, 'request_info': request_info})
+
+            response, self.request_info = request_hedger.run(send, self.endpoint_index_name)
+        else:
+            response = http_client.make_request(**request_kwargs)
+
+        if request_hedger:
+            request_hedger.latency_tracker.record(self.endpoint_index_name, time.perf_counter() - started_at)
+
+        return response
+
+    def make_request(self):
+        hooks = self.package_params.get('hooks')
+
+        if not hooks:
+            return self._make_request()
+
+        started_at = time.perf_counter()
+
+        try:
+            self._make_request()
+        except Exception as e:
+            hooks.emit(self._build_request_event(started_at, e))
+            raise
+
+        hooks.emit(self._build_request_event(started_at))
+
+    def _make_request(self):
+        # the pooled client is owned by ClarifaiApi, fall back to a one-off client otherwise
+        http_client     = self.package_params.get('http_client') or HttpClient(
+            base_url=self.package_params['base_url'],
+            json_codec=self.package_params.get('json_codec')
+        )
+        request_coalescer = self.package_params.get('request_coalescer')
+        response_cache    = self.package_params.get('response_cache')
+        response          = self._get_cached_response(response_cache) if response_cache else None
+
+        if response is not None:
+            self._set_timed_response(response)
+
+            return
+
+        if self.deadline:
+            self.deadline.check(self.endpoint_index_name)
+
+        try:
+            if request_coalescer and request_coalescer.should_coalesce(self.endpoint_index_name, self.method):
+                (response, request_info), coalesced = request_coalescer.run(
+                    self._get_request_key(),
+                    lambda: (self._send_conditional(http_client, response_cache), self.request_info),
+                    self.deadline
+                )
+
+                if coalesced:
+                    self.request_info = {**request_info, 'coalesced': True}
+            else:
+                response = self._send_conditional(http_client, response_cache)
+        finally:
+            # a mutation may have gone through even when its response was lost
+            if response_cache:
+                response_cache.invalidate_after(self.endpoint_index_name, self.method, self._get_app_id())
+
+        if response_cache:
+            self._update_cache(response_cache, response)
+
+        self._set_timed_response(response)
+
+    def _send_conditional(self, http_client, response_cache) -> dict:
+        response = self._send_guarded(http_client)
+
+        if response is None and self.request_headers: # 304 Not Modified
+            response = self._get_revalidated_response(response_cache)
+
+            if response is None: # dropped in the meantime, ask again without conditions
+                self.request_headers = None
+                response             = self._send_guarded(http_client)
+
+        return response
+
+    def _send_guarded(self, http_client) -> dict:
+        # the circuit breaker only sees requests actually sent, not the coalesced ones
+        circuit_breaker = self._get_circuit_breaker()
+
+        if circuit_breaker:
+            circuit_breaker.before_request()
+
+        try:
+            response = self._send(http_client)
+        except Exception as e:
+            if circuit_breaker:
+                circuit_breaker.record(exception=e)
+            raise
+        except BaseException: # cancelled or interrupted, nothing learnt about the endpoint
+            if circuit_breaker:
+                circuit_breaker.release()
+            raise
+
+        if circuit_breaker:
+            circuit_breaker.record(http_status=self.request_info.get('http_status'))
+
+        return response
+
+
+class AsyncMakeClarifaiRequest(MakeClarifaiRequest):
+    """
+    Same as MakeClarifaiRequest but the request is only sent once the object is awaited...
+        response_object = await AsyncMakeClarifaiRequest(...)
+    """
+
+    _make_request_on_init = False
+
+    def __await__(self):
+        return self.make_request().__await__()
+
+    async def _send(self, http_client) -> dict:
+        request_hedger = self.package_params.get('request_hedger')
+        request_kwargs = self._get_http_request_kwargs(http_client)
+        started_at     = time.perf_counter()
+
+        if self.hedge and request_hedger:
+            async def send(request_info: dict) -> dict:
+                request_info.update(self._new_request_info())
+
+                return await http_client.make_request(**{**request_kwargs, 'request_info': request_info})
+
+            response, self.request_info = await request_hedger.run_async(send, self.endpoint_index_name)
+        else:
+            response = await http_client.make_request(**request_kwargs)
+
+        if request_hedger:
+            request_hedger.latency_tracker.record(self.endpoint_index_name, time.perf_counter() - started_at)
+
+        return response
+
+    async def make_request(self):
+        hooks = self.package_params.get('hooks')
+
+        if not hooks:
+            return await self._make_request()
+
+        started_at = time.perf_counter()
+
+        try:
+            await self._make_request()
+        except Exception as e:
+            hooks.emit(self._build_request_event(started_at, e))
+            raise
+
+        hooks.emit(self._build_request_event(started_at))
+
+        return self
+
+    async def _make_request(self):
+        http_client       = self.package_params['http_client']
+        request_coalescer = self.package_params.get('request_coalescer')
+        response_cache    = self.package_params.get('response_cache')
+        response          = self._get_cached_response(response_cache) if response_cache else None
+
+        if response is not None:
+            self._set_timed_response(response)
+
+            return self
+
+        if self.deadline:
+            self.deadline.check(self.endpoint_index_name)
+
+        try:
+            if request_coalescer and request_coalescer.should_coalesce(self.endpoint_index_name, self.method):
+                async def send() -> tuple:
+                    return await self._send_conditional(http_client, response_cache), self.request_info
+
+                (response, request_info), coalesced = await request_coalescer.run_async(
+                    self._get_request_key(), send, self.deadline
+                )
+
+                if coalesced:
+                    self.request_info = {**request_info, 'coalesced': True}
+            else:
+                response = await self._send_conditional(http_client, response_cache)
+        finally:
+            if response_cache:
+                response_cache.invalidate_after(self.endpoint_index_name, self.method, self._get_app_id())
+
+        if response_cache:
+            self._update_cache(response_cache, response)
+
+        self._set_timed_response(response)
+
+        return self
+
+    async def _send_conditional(self, http_client, response_cache) -> dict:
+        response = await self._send_guarded(http_client)
+
+        if response is None and self.request_headers:
+            response = self._get_revalidated_response(response_cache)
+
+            if response is None:
+                self.request_headers = None
+                response             = await self._send_guarded(http_client)
+
+        return response
+
+    async def _send_guarded(self, http_client) -> dict:
+        circuit_breaker = self._get_circuit_breaker()
+
+        if circuit_breaker:
+            circuit_breaker.before_request()
+
+        try:
+            response = await self._send(http_client)
+        except Exception as e:
+            if circuit_breaker:
+                circuit_breaker.record(exception=e)
+            raise
+        except BaseException: # cancelled or interrupted, nothing learnt about the endpoint
+            if circuit_breaker:
+                circuit_breaker.release()
+            raise
+
+        if circuit_breaker:
+            circuit_breaker.record(http_status=self.request_info.get('http_status'))
+
+        return response
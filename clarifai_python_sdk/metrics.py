@@ -0,0 +1,230 @@
+# SYSTEM
+import math, bisect, threading
+from collections import Counter
+
+# PACKAGE
+from clarifai_python_sdk.hooks import RequestEvent
+from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_METRICS_CONFIG
+
+
+def build_latency_buckets(metrics_config: dict) -> tuple:
+    """
+    Upper bounds (seconds) of log-spaced latency buckets, from min_latency to at least max_latency
+    """
+    factor = 2 ** (1 / metrics_config['buckets_per_doubling'])
+    count  = math.ceil(math.log(metrics_config['max_latency'] / metrics_config['min_latency'], factor)) + 1
+
+    return tuple(round(metrics_config['min_latency'] * factor ** idx, 6) for idx in range(count))
+
+
+class LatencyHistogram:
+    """
+    Fixed log-spaced buckets: recording is a bisect and an increment, percentiles are interpolated
+    within their bucket so their relative error is bounded by the bucket width
+    """
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts  = [0] * (len(buckets) + 1) # the last one is +Inf
+        self.count   = 0
+        self.sum     = 0.0
+        self.max     = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum   += seconds
+        self.max    = max(self.max, seconds)
+
+    def percentile(self, percentile: float) -> float or None:
+        if not self.count:
+            return None
+
+        rank       = percentile / 100 * self.count
+        cumulative = 0
+
+        for idx, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                lower = self.buckets[idx - 1] if idx else 0.0
+                upper = self.buckets[idx] if idx < len(self.buckets) else self.max
+
+                return min(lower + (upper - lower) * (rank - cumulative) / count, self.max)
+
+            cumulative += count
+
+        return self.max
+
+    def as_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.sum / self.count if self.count else None,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'buckets': {
+                str(self.buckets[idx]) if idx < len(self.buckets) else '+Inf': count
+                for idx, count in enumerate(self.counts) if count
+            }
+        }
+
+
+class EndpointMetrics:
+    """
+    Everything kept for one (endpoint, app_id) pair
+    """
+
+    def __init__(self, buckets: tuple):
+        self.requests       = 0
+        self.errors         = Counter() # by kind, see MetricsRegistry._get_error_kind
+        self.retries        = 0
+        self.hedged         = 0
+        self.bytes_sent     = 0
+        self.bytes_received = 0
+        self.latency        = LatencyHistogram(buckets)
+
+    def as_dict(self) -> dict:
+        return {
+            'requests': self.requests,
+            'errors': dict(self.errors),
+            'retries': self.retries,
+            'hedged': self.hedged,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'latency': self.latency.as_dict()
+        }
+
+
+class MetricsRegistry:
+    """
+    In-memory request metrics per ENDPOINTS key and app: request, error and retry counters, bytes and
+    latency histograms. It is a request hook, ClarifaiApi(metrics_config={...}) registers one...
+        clarifai.metrics.snapshot()       # {'models__predict': {'my-app': {'requests': 12, ...}}}
+        clarifai.metrics.to_prometheus()  # text exposition format, e.g. served on /metrics
+    """
+
+    def __init__(self, metrics_config: dict = None, default_app_id: str = None):
+        self.metrics_config = {**DEFAULT_METRICS_CONFIG, **(metrics_config or {})}
+        self.default_app_id = default_app_id # for endpoints without app_id in their path (predict...)
+
+        self._buckets = build_latency_buckets(self.metrics_config)
+        self._series  = {} # (endpoint_index_name, app_id) -> EndpointMetrics
+        self._lock    = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        self.record(event)
+
+    @staticmethod
+    def _get_error_kind(event: RequestEvent) -> str or None:
+        if event.error is not None:
+            return type(event.error).__name__
+
+        if event.http_status and event.http_status >= 400:
+            return f'http_{event.http_status}'
+
+        if event.clarifai_status not in (None, ClarifaiStatusCodes.SUCCESS):
+            return f'clarifai_{event.clarifai_status}'
+
+        return None
+
+    def record(self, event: RequestEvent) -> None:
+        key        = (event.endpoint_index_name, event.path_variables.get('app_id') or self.default_app_id or '')
+        error_kind = self._get_error_kind(event)
+
+        with self._lock:
+            metrics = self._series.get(key)
+
+            if metrics is None:
+                metrics = self._series[key] = EndpointMetrics(self._buckets)
+
+            metrics.requests       += 1
+            metrics.retries        += event.retries
+            metrics.hedged         += event.hedged
+            metrics.bytes_sent     += event.bytes_sent or 0
+            metrics.bytes_received += event.bytes_received or 0
+            metrics.latency.observe(event.duration)
+
+            if error_kind:
+                metrics.errors[error_kind] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series = {}
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            (dict): {endpoint_index_name: {app_id: EndpointMetrics.as_dict()}}
+        """
+        snapshot = {}
+
+        with self._lock:
+            for (endpoint_index_name, app_id), metrics in sorted(self._series.items()):
+                snapshot.setdefault(endpoint_index_name, {})[app_id] = metrics.as_dict()
+
+        return snapshot
+
+    @staticmethod
+    def _labels(**labels) -> str:
+        escaped = (
+            (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+            for name, value in labels.items()
+        )
+
+        return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+    def to_prometheus(self) -> str:
+        """
+        Returns:
+            (str): Every metric in the prometheus text exposition format (version 0.0.4)
+        """
+        namespace = self.metrics_config['namespace']
+        counters  = (
+            ('requests_total', 'Requests sent, failed ones included', 'requests'),
+            ('retries_total', 'Attempts made on top of the first one', 'retries'),
+            ('hedged_requests_total', 'Requests answered by a hedged duplicate', 'hedged'),
+            ('sent_bytes_total', 'Request body bytes sent, after compression', 'bytes_sent'),
+            ('received_bytes_total', 'Response body bytes received', 'bytes_received')
+        )
+
+        with self._lock:
+            series = sorted((key, metrics) for key, metrics in self._series.items())
+            lines  = []
+
+            for name, help_text, attribute in counters:
+                lines += [f'# HELP {namespace}_{name} {help_text}', f'# TYPE {namespace}_{name} counter']
+                lines += [
+                    f'{namespace}_{name}{self._labels(endpoint=endpoint, app_id=app_id)} {getattr(metrics, attribute)}'
+                    for (endpoint, app_id), metrics in series
+                ]
+
+            lines += [
+                f'# HELP {namespace}_errors_total Failed requests by kind: exception name, http_<status> or clarifai_<status>',
+                f'# TYPE {namespace}_errors_total counter'
+            ]
+            lines += [
+                f'{namespace}_errors_total{self._labels(endpoint=endpoint, app_id=app_id, kind=kind)} {count}'
+                for (endpoint, app_id), metrics in series for kind, count in sorted(metrics.errors.items())
+            ]
+
+            name   = f'{namespace}_request_duration_seconds'
+            lines += [f'# HELP {name} Request latency, retries included', f'# TYPE {name} histogram']
+
+            for (endpoint, app_id), metrics in series:
+                histogram  = metrics.latency
+                cumulative = 0
+
+                for idx, count in enumerate(histogram.counts):
+                    cumulative += count
+                    le          = str(histogram.buckets[idx]) if idx < len(histogram.buckets) else '+Inf'
+
+                    lines.append(f'{name}_bucket{self._labels(endpoint=endpoint, app_id=app_id, le=le)} {cumulative}')
+
+                lines.append(f'{name}_sum{self._labels(endpoint=endpoint, app_id=app_id)} {histogram.sum}')
+                lines.append(f'{name}_count{self._labels(endpoint=endpoint, app_id=app_id)} {histogram.count}')
+
+        return '\n'.join(lines) + '\n'
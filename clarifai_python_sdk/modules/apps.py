@@ -20,7 +20,8 @@ class Search:
         sort_by_name: bool = None,
         page: str = None,
         per_page: str = None,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
         ) -> str or dict:
         """
         Search Clarifai apps by name
@@ -30,6 +31,7 @@ class Search:
             sort_by_modified_at (str, optional)
             page (str, optional)code 
             per_page (str, optional)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (json or dict)
@@ -47,7 +49,8 @@ class Search:
                 'per_page': per_page
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)    
@@ -63,7 +66,8 @@ class Apps:
         name: str = None,
         default_language: str = None,
         default_workflow_id: str = None,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
     ) -> ResponseWrapper: 
         """
         Create Clarifai Application
@@ -90,17 +94,19 @@ class Apps:
             path_variables={**(auth_object.get('user_app_id', {}) or self.params['user_app_id'])},
             body=json_body,
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)    
 
-    def get(self, app_id: str, auth_object: dict = {}) -> ResponseWrapper:
+    def get(self, app_id: str, auth_object: dict = {}, timeout: float = None) -> ResponseWrapper:
         """
         Get app by app_id
 
         Args:
             app_id (str)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Object) - ResponseWrapper
@@ -111,7 +117,8 @@ class Apps:
             method="GET",
             path_variables={**(auth_object.get('user_app_id', {}) or self.params['user_app_id'])},
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)    
@@ -120,7 +127,8 @@ class Apps:
         self, 
         page: int = None, 
         per_page: int = None,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
         ) -> ResponseWrapper:
         """
         List all apps given a user_id.
@@ -129,6 +137,7 @@ class Apps:
         Args:
             page (int)
             per_page (int)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Object): ResponseWrapper
@@ -143,17 +152,19 @@ class Apps:
                 'per_page': per_page
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)    
     
-    def delete(self, app_id: str, auth_object: dict = {}) -> ResponseWrapper:
+    def delete(self, app_id: str, auth_object: dict = {}, timeout: float = None) -> ResponseWrapper:
         """
         Delete Clarifai application by app_id
 
         Args:
             app_id (str)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Object) - ResponseWrapper
@@ -169,7 +180,8 @@ class Apps:
                 **(auth_object.get('user_app_id', {}) or self.params['user_app_id'])
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)
\ No newline at end of file
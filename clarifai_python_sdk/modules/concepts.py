@@ -2,6 +2,10 @@
 from clarifai_python_sdk.make_clarifai_request import MakeClarifaiRequest
 from clarifai_python_sdk.response              import ResponseWrapper 
 from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
+from clarifai_python_sdk.deadline              import Deadline
+
+# ERRORS
+from clarifai_python_sdk.errors import DeadlineExceededError
 
 # UTILS
 from clarifai_python_sdk.utils.url_handler import UrlHandler
@@ -15,7 +19,8 @@ class Concepts:
         self,
         page: int = 1,
         per_page: int = 100,
-        auth_object: int = {}
+        auth_object: int = {},
+        timeout: float = None
     ) -> ResponseWrapper:
         """
         List concepts in app
@@ -23,6 +28,7 @@ class Concepts:
         Args:
             page (str, optional): Defaults to 1.
             per_page (str, optional): Defaults to 100.
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Object) - ResponseWrapper
@@ -37,46 +43,57 @@ class Concepts:
                 'per_page': per_page
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)
 
-    def list_all(self) -> ResponseWrapper:
+    def list_all(self, timeout: float = None) -> ResponseWrapper:
         """
         List all concepts in app
 
+        Args:
+            timeout (float, optional): Budget in seconds for the whole listing, pages fetched before it
+                runs out are returned with 'deadline_exceeded': True. Defaults to the client timeout.
+
         Returns:
             (Object) - ResponseWrapper
         """
         BATCH_SIZE = 100
 
-        current_page = 1
-        concepts     = []
-        last_batch   = []
+        current_page      = 1
+        concepts          = []
+        last_batch        = []
+        deadline          = Deadline.from_timeout(timeout if timeout is not None else self.params.get('timeout'))
+        deadline_exceeded = False
 
         def get_new_batch(page, per_page):
-            get_page = self.list(page=page, per_page=per_page).response.dict
+            get_page = self.list(page=page, per_page=per_page, timeout=deadline).response.dict
             concepts = get_page['concepts']
 
             return concepts
         
-        first_batch = get_new_batch(current_page, BATCH_SIZE)
-        concepts.extend(first_batch)
-        last_batch = first_batch
+        try:
+            first_batch = get_new_batch(current_page, BATCH_SIZE)
+            concepts.extend(first_batch)
+            last_batch = first_batch
 
-        while len(last_batch) == BATCH_SIZE:
-            new_batch = get_new_batch(current_page, BATCH_SIZE)
-            concepts.extend(new_batch)
-            current_page +=1
-            last_batch = new_batch
+            while len(last_batch) == BATCH_SIZE:
+                current_page +=1
+                new_batch = get_new_batch(current_page, BATCH_SIZE)
+                concepts.extend(new_batch)
+                last_batch = new_batch
+        except DeadlineExceededError:
+            deadline_exceeded = True
 
         response_schema = {
             'status': {
                 'code': ClarifaiStatusCodes.SUCCESS,
-                'description': 'Ok'
+                'description': 'Deadline exceeded, partial results' if deadline_exceeded else 'Ok'
             },
-            **({'concepts': concepts} if concepts else {})
+            **({'concepts': concepts} if concepts else {}),
+            **({'deadline_exceeded': True} if deadline_exceeded else {})
         }
 
         return ResponseWrapper(self.params, response_dict=response_schema)
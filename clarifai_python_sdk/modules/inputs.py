@@ -5,9 +5,13 @@ from operator import itemgetter
 from clarifai_python_sdk.make_clarifai_request import MakeClarifaiRequest
 from clarifai_python_sdk.response              import ResponseWrapper
 from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
+from clarifai_python_sdk.deadline              import Deadline
 
 # PACKAGES
 
+# ERRORS
+from clarifai_python_sdk.errors import DeadlineExceededError
+
 # UTILS
 from clarifai_python_sdk.utils.filters     import Filters
 from clarifai_python_sdk.utils.data        import Data
@@ -25,7 +29,8 @@ class Search:
         threshold: float or int,
         page: str,
         per_page: str,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
         ) -> ResponseWrapper:
 
         additional_params = {}
@@ -48,8 +53,10 @@ class Search:
             method="POST",
             path_variables={**(auth_object.get('user_app_id', {}) or self.params['user_app_id']),},
             body=body,
+            idempotent=True,
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)        
@@ -59,7 +66,8 @@ class Search:
         filters: list,
         page: int,
         per_page: int,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
     ) -> ResponseWrapper:
 
         body = { 
@@ -76,8 +84,10 @@ class Search:
             method="POST",
             path_variables={**(auth_object.get('user_app_id', {}) or self.params['user_app_id']),},
             body=body,
+            idempotent=True,
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)        
@@ -87,7 +97,8 @@ class Search:
         concepts: list,
         page: int = None, 
         per_page: int = None,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
     ) -> ResponseWrapper:
         """
         Search inputs annotated with given concept name and value
@@ -99,12 +110,13 @@ class Search:
                 - [{"name": "sky"}, ...] or without value
             page (int, optional)
             per_page (int, optional)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Object) - ResponseWrapper
         """
 
-        param_args = (page, per_page, auth_object)
+        param_args = (page, per_page, auth_object, timeout)
         
         filters = [{
             'annotation': {
@@ -123,7 +135,8 @@ class Search:
         threshold: float or int = None,
         page: int = None,
         per_page: int = None,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
     ) -> ResponseWrapper:
         """
         Rank by image based on visual similarity 
@@ -134,12 +147,13 @@ class Search:
                 - { 'base64': {BASE64_STRING} } ...with base64
             page (int, optional)
             per_page (int, optional)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Object) - ResponseWrapper
         """
  
-        param_args = (threshold, page, per_page, auth_object)
+        param_args = (threshold, page, per_page, auth_object, timeout)
 
         ranks = [{
             'annotation': {
@@ -157,7 +171,8 @@ class Search:
         threshold: float or int = None,
         page: int = None,
         per_page: int = None,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
     ) -> ResponseWrapper:
         """
         Rank by input id based on visual similarity
@@ -167,12 +182,13 @@ class Search:
             threshold (float or int, optional)
             page (int, optional)
             per_page (int, optional)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Object) - ResponseWrapper
         """
 
-        param_args = (threshold, page, per_page, auth_object)
+        param_args = (threshold, page, per_page, auth_object, timeout)
 
         ranks = [{
             'annotation': {
@@ -193,24 +209,35 @@ class Inputs:
     def add(
         self,
         inputs: list,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
         ) -> ResponseWrapper:
         """Add inputs to Clarifai App
 
         Args:
             inputs (list): List of input objects
                             - See example of input objects in data/inputs/add_mock.py
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Object) ResponseWrapper
         """
 
+        # downloads and the request share the same budget
+        deadline = Deadline.from_timeout(timeout if timeout is not None else self.params.get('timeout'))
+
         for input in inputs:
             input_type = 'image' if input.get('image') else 'video'
             if input.get('convert_src_to_base64'):
-                input[input_type]['base64'] = Data.image_url_to_base_64(input[input_type]['url'])
+                input[input_type]['base64'] = Data.image_url_to_base_64(
+                    input[input_type]['url'],
+                    timeout=deadline.cap() if deadline else None
+                )
                 del input[input_type]['url']
                 del input['convert_src_to_base64']
+
+        if self.params.get('image_preprocessor') is not None:
+            inputs = self.params['image_preprocessor'].process_inputs(inputs)
         
         clarifai_api_final_formatting = list(map(lambda input: {'data': input}, inputs))
 
@@ -224,7 +251,8 @@ class Inputs:
             method="POST",
             body=body,
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=deadline
         )
 
         return ResponseWrapper(self.params, response_object=response_object)
@@ -233,7 +261,8 @@ class Inputs:
         self,
         page: int = 1,
         per_page: int = 100,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
     ):
         """
         List Inputs
@@ -242,6 +271,7 @@ class Inputs:
             page (int, optional): Defaults to 1.
             per_page (int, optional): Defaults to 100.
             auth_object (dict, optional):  Defaults to {}.
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             _type_: _description_
@@ -255,7 +285,8 @@ class Inputs:
                 'per_page': per_page
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)
@@ -265,13 +296,15 @@ class Inputs:
         self,
         per_page: int = 128,
         last_id: int = None,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
         ) -> ResponseWrapper:
         """Streaming (paginating) inputs in given Clarifai app
 
         Args:
             per_page (int, optional): Defaults to 128.
             last_id (int, optional): Defaults to None.
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (dict)
@@ -285,16 +318,21 @@ class Inputs:
                 'last_id': last_id
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)
 
-    def list_all(self) -> dict:
+    def list_all(self, timeout: float = None) -> dict:
         """Lists all inputs objects in app
 
         - Not recommended for large apps as output would be potentially too big
 
+        Args:
+            timeout (float, optional): Budget in seconds for the whole listing, inputs streamed before it
+                runs out are returned with 'deadline_exceeded': True. Defaults to the client timeout.
+
         Returns:
             (dict): { 'inputs', 'inputs_number' }
         """
@@ -304,28 +342,37 @@ class Inputs:
         inputs                    = []
         last_batch                = []
         is_listing_success        = True
+        deadline                  = Deadline.from_timeout(timeout if timeout is not None else self.params.get('timeout'))
+        deadline_exceeded         = False
 
         def request_new_batch(**kwargs):
-            nonlocal last_batch
+            nonlocal last_batch, is_listing_success
 
-            stream_inputs_response = self.stream(per_page=PER_PAGE, **kwargs).response.dict
-            last_batch             = stream_inputs_response.get('inputs', [])
+            stream_inputs_response = self.stream(per_page=PER_PAGE, timeout=deadline, **kwargs).response
+            # a failed page ends the listing, flag it instead of returning partial data as a success
+            is_listing_success     = stream_inputs_response.status_code == ClarifaiStatusCodes.SUCCESS
+            last_batch             = stream_inputs_response.dict.get('inputs', [])
             inputs.extend(last_batch)
 
-        request_new_batch()
+        try:
+            request_new_batch()
 
-        while len(last_batch) == LAST_BATCH_COUNT_SHOULD_BE:        
-            last_id = last_batch[-1]['id']
-            last_batch.clear()
+            while len(last_batch) == LAST_BATCH_COUNT_SHOULD_BE:        
+                last_id = last_batch[-1]['id']
+                last_batch.clear()
 
-            # Provide last_id to get the next set of inputs.
-            request_new_batch(last_id=last_id)
+                # Provide last_id to get the next set of inputs.
+                request_new_batch(last_id=last_id)
+        except DeadlineExceededError:
+            deadline_exceeded = True
 
         response_schema = {
              'status': {
-                'code': 10000 if is_listing_success else 10020
+                'code': 10000 if is_listing_success else 10020,
+                **({'description': 'Deadline exceeded, partial results'} if deadline_exceeded else {})
             },
-            **({'inputs': inputs} if inputs else {})
+            **({'inputs': inputs} if inputs else {}),
+            **({'deadline_exceeded': True} if deadline_exceeded else {})
         }
 
         return ResponseWrapper(self.params, response_dict=response_schema)
@@ -335,19 +382,21 @@ class Inputs:
     def delete_by_ids(
         self,
         inputs_ids: list,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
         ) -> dict:
         """Delete a list of inputs by input_ids
 
         Args:
             inputs_ids (list)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (dict)
         """
 
         body = { 
-            'user_app_id': self.params['user_data_object'],
+            'user_app_id': auth_object.get('user_app_id', {}) or self.params['user_app_id'],
             'ids': inputs_ids
         }
 
@@ -357,14 +406,20 @@ class Inputs:
             path_variables={**(auth_object.get('user_app_id', {}) or self.params['user_app_id'])},
             body=body,
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)
 
-    def delete_all(self) -> ResponseWrapper:
+    def delete_all(self, timeout: float = None) -> ResponseWrapper:
         """Deletes all app inputs by streaming
 
+        Args:
+            timeout (float, optional): Budget in seconds for the whole deletion, when it runs out the
+                number of inputs deleted so far is returned with 'deadline_exceeded': True. Defaults to the client timeout.
+                A failed deletion stops there too, its status is returned with the number of inputs deleted so far.
+
         Returns:
             (Object) - ResponseWrapper
         """
@@ -372,28 +427,50 @@ class Inputs:
         last_batch_count_sould_be = per_page
         last_batch                = []
         number_of_deleted_inputs  = 0
+        deadline                  = Deadline.from_timeout(timeout if timeout is not None else self.params.get('timeout'))
+        deadline_exceeded         = False
+        failed_status             = None
 
         def request_new_batch(**kwargs):
-            nonlocal number_of_deleted_inputs, last_batch
+            nonlocal number_of_deleted_inputs, last_batch, failed_status
 
-            stream_inputs_response = self.stream(per_page=per_page, **kwargs).response.dict
+            stream_inputs_response = self.stream(per_page=per_page, timeout=deadline, **kwargs).response.dict
             last_batch             = stream_inputs_response['inputs']
-            self.delete_by_ids(Filters(last_batch).ids_from_input_objects())
+            delete_response        = self.delete_by_ids(Filters(last_batch).ids_from_input_objects(), timeout=deadline)
+
+            # delete_by_ids returns the error message instead of raising, see handle_exception
+            if isinstance(delete_response, str):
+                if deadline:
+                    deadline.check('inputs__post')
+
+                failed_status = {'code': ClarifaiStatusCodes.FAILURE, 'description': delete_response}
+            elif delete_response.response.status_code != ClarifaiStatusCodes.SUCCESS:
+                failed_status = delete_response.response.dict['status']
+
+            if failed_status:
+                last_batch = [] # nothing more is requested
+                return
+
             number_of_deleted_inputs = number_of_deleted_inputs + len(last_batch) 
 
-        request_new_batch()
+        try:
+            request_new_batch()
 
-        while len(last_batch) == last_batch_count_sould_be:        
-            last_id = last_batch[-1]['id']
-            last_batch.clear()
+            while len(last_batch) == last_batch_count_sould_be:        
+                last_id = last_batch[-1]['id']
+                last_batch.clear()
 
-            request_new_batch(last_id=last_id)
+                request_new_batch(last_id=last_id)
+        except DeadlineExceededError:
+            deadline_exceeded = True
 
         response_schema = {
-            'status': {
-                'code': ClarifaiStatusCodes.SUCCESS
+            'status': failed_status or {
+                'code': ClarifaiStatusCodes.SUCCESS,
+                **({'description': 'Deadline exceeded, partial results'} if deadline_exceeded else {})
             },
-            'number_of_delete_inputs': number_of_deleted_inputs
+            'number_of_delete_inputs': number_of_deleted_inputs,
+            **({'deadline_exceeded': True} if deadline_exceeded else {})
         }
         
         return ResponseWrapper(
@@ -1,10 +1,17 @@
 # SYSTEM
 from operator import itemgetter
+from itertools import islice
+from collections import deque
 from ..clarifai_status_codes import ClarifaiStatusCodes
 
 # PACKAGE
 from clarifai_python_sdk.make_clarifai_request import MakeClarifaiRequest
 from clarifai_python_sdk.response import ResponseWrapper
+from clarifai_python_sdk.deadline import Deadline
+from clarifai_python_sdk.embeddings import EmbeddingStore, get_embedding
+
+# ERRORS
+from clarifai_python_sdk.errors import UserError
 
 # UTILS
 from clarifai_python_sdk.utils.url_handler import UrlHandler
@@ -14,12 +21,54 @@ class Models:
     def __init__(self, params: dict):
         self.params = params
     
+    def _predict_request(
+        self,
+        inputs: list,
+        model_id: str,
+        model_version_id: str,
+        output_config: dict,
+        hedge: bool,
+        auth_object: dict,
+        timeout: float
+        ) -> MakeClarifaiRequest:
+
+        path_variables = {
+            'model_id'        : model_id,
+            'model_version_id': model_version_id
+        }
+
+        if self.params.get('image_preprocessor') is not None:
+            inputs = self.params['image_preprocessor'].process_inputs(inputs)
+
+        inputs_payload = [{'data': input} for input in inputs]
+
+        body = { 
+            'user_app_id': auth_object.get('user_app_id', {}) or self.params['user_app_id'],
+            'inputs': inputs_payload,
+            **({'model': {'output_info': {'output_config': output_config}}} if output_config else {})
+        }
+
+        return MakeClarifaiRequest(
+            endpoint_index_name="models__predict_without_version_id" if None in path_variables.values() else 'models__predict',
+            method="POST",
+            path_variables=path_variables,
+            body=body,
+            idempotent=True,
+            hedge=hedge,
+            auth_object=auth_object,
+            package_params=self.params,
+            timeout=timeout
+        )
+
     def predict(
         self, 
         inputs: list,
-        model_id: str, 
+        model_id: str,
         model_version_id: str = None,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        hedge: bool = False,
+        timeout: float = None,
+        output_config: dict = None
         ) -> ResponseWrapper:
         """
         Predict endpoint
@@ -28,44 +77,206 @@ class Models:
             inputs (list)
             model_id (str)
             model_version_id (str, optional):  Defaults to None.
+            hedge (bool, optional): Send a duplicate request when this one is slower than usual and keep
+                the first answer, see hedge_config on the client. Defaults to False.
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
+            output_config (dict, optional): e.g. {'min_value': 0.9, 'max_concepts': 10}. Defaults to None.
 
         Returns:
             (dict): Response dict
         """
+        predict_cache = self.params.get('predict_cache')
+        request_args  = (model_id, model_version_id, output_config, hedge, auth_object, timeout)
 
-        path_variables = {
-            'model_id'        : model_id,
-            'model_version_id': model_version_id
-        }
-        
-        inputs_payload = [{'data': input} for input in inputs]
+        if predict_cache is None or not predict_cache.is_enabled(model_version_id):
+            return ResponseWrapper(self.params, response_object=self._predict_request(inputs, *request_args))
 
-        body = { 
-            'user_app_id': auth_object.get('user_app_id', {}) or self.params['user_app_id'],
-            'inputs': inputs_payload,
-        }
+        # only the inputs missing from the predict cache are sent
+        keys, outputs, misses = predict_cache.lookup(
+            model_id, model_version_id, inputs, output_config,
+            auth_object.get('token') or self.params['token'],
+            auth_object.get('user_app_id', {}) or self.params['user_app_id']
+        )
 
-        response_object = MakeClarifaiRequest(
-            endpoint_index_name="models__predict_without_version_id" if None in path_variables.values() else 'models__predict',
-            method="POST",
-            path_variables=path_variables,
-            body=body,
-            auth_object=auth_object,
-            package_params=self.params
+        if not misses:
+            return ResponseWrapper(self.params, response_dict=predict_cache.build_response(outputs))
+
+        response_object = self._predict_request([inputs[idx] for idx in misses], *request_args)
+
+        response_object._set_response(
+            predict_cache.merge(model_id, model_version_id, keys, outputs, misses, response_object.response)
         )
 
         return ResponseWrapper(self.params, response_object=response_object)
 
+    def predict_all(
+        self,
+        inputs: iter,
+        model_id: str,
+        model_version_id: str = None,
+        auth_object: dict = {},
+        hedge: bool = False,
+        timeout: float = None,
+        batch_size: int = None,
+        max_workers: int = None,
+        output_config: dict = None
+        ) -> list:
+        """
+        Predict over any number of inputs: split into API-sized batches, sent concurrently on the
+        pool of the client, see batch_predict_config. A failed batch does not fail the whole call,
+        each of its inputs gets the error.
+
+        Args:
+            inputs (iterable): Same items as predict's, of any size, consumed lazily
+            model_id (str)
+            model_version_id (str, optional): Defaults to None.
+            hedge (bool, optional): Hedge each batch request, see predict. Defaults to False.
+            timeout (float, optional): In seconds, for the whole call. Defaults to the client timeout.
+            batch_size (int, optional): Inputs per request. Defaults to batch_predict_config['batch_size'].
+            max_workers (int, optional): Batches in flight. Defaults to batch_predict_config['max_workers'].
+            output_config (dict, optional): See predict. Defaults to None.
+
+        Returns:
+            (list): One batch_predict.PredictResult (.output or .error) per input, in input order
+        """
+        deadline = Deadline.from_timeout(timeout if timeout is not None else self.params.get('timeout'))
+
+        def send(batch: list) -> dict:
+            return self.predict(
+                batch, model_id, model_version_id, auth_object=auth_object, hedge=hedge, timeout=deadline,
+                output_config=output_config
+            ).response.dict
+
+        return self.params['batch_predictor'].run(send, inputs, batch_size, max_workers)
+
+    def predict_stream(
+        self,
+        inputs: iter,
+        model_id: str,
+        model_version_id: str = None,
+        auth_object: dict = {},
+        hedge: bool = False,
+        timeout: float = None,
+        batch_size: int = None,
+        max_workers: int = None,
+        ordered: bool = True,
+        reorder_buffer: int = None,
+        output_config: dict = None
+        ) -> iter:
+        """
+        Lazy predict_all: inputs are read and sent as results are consumed, with at most max_workers
+        batches in flight, so memory stays flat whatever the number of inputs. Iterating slowly slows
+        the requests down.
+
+        Args:
+            inputs (iterable): Same items as predict's, e.g. a generator reading a file
+            model_id (str)
+            model_version_id (str, optional): Defaults to None.
+            hedge (bool, optional): Hedge each batch request, see predict. Defaults to False.
+            timeout (float, optional): In seconds, for each batch request. Defaults to the client timeout.
+            batch_size (int, optional): Inputs per request. Defaults to batch_predict_config['batch_size'].
+            max_workers (int, optional): Batches in flight. Defaults to batch_predict_config['max_workers'].
+            ordered (bool, optional): Yield in input order, otherwise as soon as each batch completes. Defaults to True.
+            reorder_buffer (int, optional): When ordered, completed batches held back while an earlier one is
+                in flight, sending pauses once it is full. Defaults to max_workers.
+            output_config (dict, optional): See predict. Defaults to None.
+
+        Yields:
+            (PredictResult): .output or .error of each input, with its .index in the inputs
+        """
+        batch_predictor = self.params['batch_predictor']
+
+        def send(batch: list) -> dict:
+            return self.predict(
+                batch, model_id, model_version_id, auth_object=auth_object, hedge=hedge, timeout=timeout,
+                output_config=output_config
+            ).response.dict
+
+        return batch_predictor.iter_results(
+            send, inputs, batch_size, max_workers, ordered,
+            reorder_buffer or max_workers or batch_predictor.batch_predict_config['max_workers']
+        )
+
+    def extract_embeddings(
+        self,
+        inputs: iter,
+        model_id: str,
+        path: str,
+        total: int = None,
+        model_version_id: str = None,
+        auth_object: dict = {},
+        hedge: bool = False,
+        timeout: float = None,
+        batch_size: int = None,
+        max_workers: int = None,
+        dtype: str = 'float32'
+        ) -> EmbeddingStore:
+        """
+        Predict with an embedding model over any number of inputs and write the vectors into a preallocated
+        .npy memmap, see embeddings.EmbeddingStore. Batches are sent as with predict_stream, memory stays flat.
+        Run again with the same inputs (same order) and path to resume after the last row written.
+
+        Args:
+            inputs (iterable): (input_id, input) pairs, input as an item of predict's inputs
+            model_id (str): e.g. 'travel-embedding-v1'
+            path (str): Of the .npy file, the ids of its rows go to `<path>.ids`
+            total (int, optional): Number of inputs, rows allocated. Defaults to len(inputs).
+            model_version_id (str, optional): Defaults to None.
+            hedge (bool, optional): Hedge each batch request, see predict. Defaults to False.
+            timeout (float, optional): In seconds, for each batch request. Defaults to the client timeout.
+            batch_size (int, optional): Inputs per request, and rows flushed at once. Defaults to batch_predict_config['batch_size'].
+            max_workers (int, optional): Batches in flight. Defaults to batch_predict_config['max_workers'].
+            dtype (str, optional): Of the vectors. Defaults to 'float32'.
+
+        Returns:
+            (EmbeddingStore): .vectors (memmap), .ids, .get(input_id). Rows of failed inputs are NaN.
+        """
+        if total is None:
+            if not hasattr(inputs, '__len__'):
+                raise UserError('total is required when inputs has no len()')
+
+            total = len(inputs)
+
+        store       = EmbeddingStore(path, total, dtype)
+        pending_ids = deque() # ids of the inputs read, results come back in the same order
+        flush_size  = batch_size or self.params['batch_predictor'].batch_predict_config['batch_size']
+
+        def read_inputs() -> iter:
+            # rows already written are skipped
+            for input_id, input in islice(iter(inputs), len(store), None):
+                pending_ids.append(input_id)
+                yield input
+
+        ids, vectors = [], []
+        results      = self.predict_stream(
+            read_inputs(), model_id, model_version_id,
+            batch_size=batch_size, max_workers=max_workers, hedge=hedge, auth_object=auth_object, timeout=timeout
+        )
+
+        for result in results:
+            ids.append(pending_ids.popleft())
+            vectors.append(get_embedding(result.output) if result.ok else None)
+
+            if len(ids) >= flush_size and store.write(ids, vectors):
+                ids, vectors = [], []
+
+        if ids and not store.write(ids, vectors):
+            raise UserError(f'No embedding in the outputs of model "{model_id}", none of its {len(ids)} predictions succeeded')
+
+        return store
+
     def train(
         self,
         model_id: str,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
         ) -> ResponseWrapper:
         """
         Start training a model 
 
         Args:
             model_id (str)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Response Object)
@@ -79,16 +290,21 @@ class Models:
                 **(auth_object.get('user_app_id', {}) or self.params['user_app_id'])
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
+        if self.params.get('predict_cache') is not None:
+            self.params['predict_cache'].invalidate_model(model_id)
+
         return ResponseWrapper(self.params, response_object=response_object)
 
     def list(
         self,
         page: int = None,
         per_page: int = None,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
         ) -> ResponseWrapper:
         """
         List models present in the app_id provided
@@ -96,6 +312,7 @@ class Models:
         Args:
             page (int, optional): Defaults to None.
             per_page (int, optional): Defaults to None.
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Response Object)
@@ -110,7 +327,8 @@ class Models:
                 'per_page': per_page
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)
@@ -119,7 +337,8 @@ class Models:
         self,
         page: int = None,
         per_page: int = None,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
         ) -> ResponseWrapper:
         """
         List model types
@@ -127,6 +346,7 @@ class Models:
         Args:
             page (int, optional): Defaults to None.
             per_page (int, optional): Defaults to None.
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Response Object)
@@ -141,17 +361,19 @@ class Models:
                 'per_page': per_page
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)
 
-    def get_model_by_id(self, model_id: str, auth_object: dict = {}) -> ResponseWrapper:
+    def get_model_by_id(self, model_id: str, auth_object: dict = {}, timeout: float = None) -> ResponseWrapper:
         """
         Get model by ID
 
         Args:
             model_id (str)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Response Object)
@@ -165,7 +387,8 @@ class Models:
                 'model_id': model_id
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)
@@ -175,13 +398,15 @@ class Models:
         model_id: str,
         page: int = None,
         per_page: int = None,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
         ) -> ResponseWrapper:
         """
         Get a list of model versions given a model_id
 
         Args:
             model_id (str)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Response Object)
@@ -199,17 +424,19 @@ class Models:
                 'per_page': per_page
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)
     
-    def get_model_training_inputs(self, model_id: str, auth_object: dict = {}) -> ResponseWrapper:
+    def get_model_training_inputs(self, model_id: str, auth_object: dict = {}, timeout: float = None) -> ResponseWrapper:
         """
         Get a model's training inputs
 
         Args:
             model_id (str)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Response)
@@ -223,7 +450,8 @@ class Models:
                 'model_id': model_id
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)   
@@ -232,7 +460,8 @@ class Models:
         self, 
         model_id: str, 
         model_version_id: str = None, 
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
         ) -> ResponseWrapper:
         """
         Retrieve model's trained concepts
@@ -241,6 +470,7 @@ class Models:
             model_id (str)
             model_version_id (str, optional)
             auth_object (dict, optional): Defaults to {}.
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Object) - Response Wrapper
@@ -267,7 +497,7 @@ class Models:
         """
 
         concepts = []
-        endpoint_index_name = 'models__output_info' + '' if not model_version_id else '__with_version_id'
+        endpoint_index_name = 'models__output_info' + ('' if not model_version_id else '__with_version_id')
 
         response_object = MakeClarifaiRequest(
             endpoint_index_name=endpoint_index_name,
@@ -278,7 +508,8 @@ class Models:
                 **({'version_id': model_version_id} if model_version_id else {})
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         if response_object.status_code == ClarifaiStatusCodes.SUCCESS:
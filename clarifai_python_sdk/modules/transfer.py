@@ -2,6 +2,10 @@
 
 # PACKAGE
 from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
+from clarifai_python_sdk.deadline import Deadline
+
+# ERRORS
+from clarifai_python_sdk.errors import UserError, DeadlineExceededError
 
 # MODULES
 from clarifai_python_sdk.modules import Models, Concepts, Inputs
@@ -62,24 +66,33 @@ class Transfer:
         self,
         page: int = 1,
         per_page = 128,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
     ) -> list:
         kwargs = locals()
         kwargs.pop('self')
 
-        response_list_inputs = self.module_inputs.list(**kwargs).to_dict()
+        response_list_inputs = self.module_inputs.list(**kwargs).response.dict
 
         return response_list_inputs.get('inputs', [])
     
     def _upload_inputs(
         self,
         inputs: list,
-        auth_object: dict = {}
+        auth_object: dict = {},
+        timeout: float = None
     ) -> list:
 
-        response_upload_inputs = self.module_inputs.add(inputs, auth_object).to_dict()
+        response_upload_inputs = self.module_inputs.add(inputs, auth_object, timeout=timeout)
+
+        # add returns the error message instead of raising, see handle_exception
+        if isinstance(response_upload_inputs, str):
+            if isinstance(timeout, Deadline):
+                timeout.check('inputs__post')
+
+            raise UserError(response_upload_inputs)
 
-        return response_upload_inputs
+        return response_upload_inputs.response.dict
 
     @staticmethod
     def _filter_input_objects(
@@ -190,41 +203,67 @@ class Transfer:
     def inputs_all(
         self,
         keep_annotations: bool = True,
-        keep_metadata: bool = True
+        keep_metadata: bool = True,
+        timeout: float = None
     ):
+        """
+        Copy every input of origin to the other app, page by page
+
+        Args:
+            keep_annotations (bool, optional): Defaults to True.
+            keep_metadata (bool, optional): Defaults to True.
+            timeout (float, optional): Budget in seconds for the whole transfer, when it runs out the pages
+                uploaded so far are returned followed by a {'deadline_exceeded': True} status object. Defaults to the client timeout.
+
+        Returns:
+            (list): Upload response of every page
+        """
         PER_PAGE = 128
 
         responses_stack = []
         inputs       = []
         current_page = 1
         last_batch   = []
+        deadline     = Deadline.from_timeout(timeout if timeout is not None else self.params.get('timeout'))
 
         def request_new_batch():
             list_orgin_inputs_response = self._list_inputs(
                 page=current_page,
                 per_page=PER_PAGE, 
-                auth_object=self.origin_auth_object
+                auth_object=self.origin_auth_object,
+                timeout=deadline
             )
             
             return list_orgin_inputs_response or []
         
-        last_batch = request_new_batch()
-        current_page += 1
-        response = self._upload_inputs(
-            self._filter_input_objects(last_batch, keep_annotations, keep_metadata),
-            auth_object=self.to_auth_object
-        )
-        responses_stack.append(response)
-
-        while len(last_batch) == PER_PAGE:
+        try:
             last_batch = request_new_batch()
             current_page += 1
             response = self._upload_inputs(
                 self._filter_input_objects(last_batch, keep_annotations, keep_metadata),
-                auth_object=self.to_auth_object
+                auth_object=self.to_auth_object,
+                timeout=deadline
             )
             responses_stack.append(response)
 
+            while len(last_batch) == PER_PAGE:
+                last_batch = request_new_batch()
+                current_page += 1
+                response = self._upload_inputs(
+                    self._filter_input_objects(last_batch, keep_annotations, keep_metadata),
+                    auth_object=self.to_auth_object,
+                    timeout=deadline
+                )
+                responses_stack.append(response)
+        except DeadlineExceededError as e:
+            responses_stack.append({
+                'status': {
+                    'code': ClarifaiStatusCodes.FAILURE,
+                    'description': e.message
+                },
+                'deadline_exceeded': True
+            })
+
         # response_schema = {
         #     'status': {
         #         'code': clarifai_status_code if clarifai_status_code is not None else ClarifaiStatusCodes.SUCCESS,
@@ -5,7 +5,7 @@ from urllib import response
 from dateutil.relativedelta import relativedelta
 
 # PACKAGE
-from clarifai_python_sdk.response import ResponseWrapper, BuildResponseSchema
+from clarifai_python_sdk.response import ResponseWrapper, BuildResponseSchema, LazyResponse
 from clarifai_python_sdk.make_clarifai_request import MakeClarifaiRequest
 
 # PACKAGES
@@ -96,6 +96,326 @@ class Usage:
 
         return templates[template]
 
+    @classmethod
+    def _build_historical_schema(
+        cls,
+        response_object: LazyResponse,
+        start_date: str,
+        end_date: str,
+        template: str
+    ) -> dict:
+        usage_data_dict = {
+            'by_ops_category': {},
+            'total_ops': 0
+        }
+        response_schema = BuildResponseSchema()
+
+        if response_object.status_code != ClarifaiStatusCodes.SUCCESS:
+            response_schema.update(
+                clarifai_status_code=response_object.status_code,
+                clarifai_error_description=response_object.details or response_object.description
+            )
+        else:
+            response_schema.update(is_success=True)
+            usages: List[dict] = response_object.dict.get('usage')
+            
+            for usage in usages:
+                usage = UsageObject(usage)
+
+                usage_data_dict['by_ops_category'][usage.category_id] = usage.value if not \
+                    usage_data_dict['by_ops_category'].get(usage.category_id) \
+                        else usage_data_dict['by_ops_category'][usage.category_id] + usage.value
+                
+                if usage.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
+                    if not usage_data_dict.get('by_models'): usage_data_dict['by_models'] = {}
+                    usage_data_dict['by_models'][usage.model_id] = usage.value if not \
+                        usage_data_dict['by_models'].get(usage.model_id) \
+                            else usage_data_dict['by_models'][usage.model_id] + usage.value
+                
+                usage_data_dict['total_ops'] += usage.value
+
+            usage_data_dict: dict = _ensure_key_is_last(usage_data_dict, 'total_ops')
+
+        response_schema.update(
+            entries_if_success={
+                'usage': usage_data_dict,
+                'timeframe': cls._get_templates(template) \
+                    if start_date is None and end_date is None \
+                        else {'start_date': start_date, 'end_date': end_date}
+            },
+        )
+
+        return response_schema.build()
+
+    @classmethod
+    def _build_historical_by_apps_schema(
+        cls,
+        response_object: LazyResponse,
+        start_date: str,
+        end_date: str,
+        template: str
+    ) -> dict:
+        usage_data_dict = {}
+        response_schema = BuildResponseSchema()
+
+        if response_object.status_code != ClarifaiStatusCodes.SUCCESS:
+            response_schema.update(
+                clarifai_status_code=response_object.status_code,
+                clarifai_error_description=response_object.details or response_object.description
+            )
+        else:
+            response_schema.update(is_success=True)
+            usages: List[dict] = response_object.dict['usage']
+
+            for usage in usages:
+                usage = UsageObject(usage)
+
+                if usage_data_dict.get(usage.app_id) is None:
+                    usage_data_dict[usage.app_id] = {
+                        'by_ops_category': {},
+                        'total_ops': 0
+                    }
+                else:
+                    app_dict: dict = usage_data_dict[usage.app_id]
+
+                    app_dict['by_ops_category'][usage.category_id] = usage.value \
+                        if app_dict['by_ops_category'].get(usage.category_id) is None \
+                            else app_dict['by_ops_category'][usage.category_id] + usage.value
+
+                    if usage.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
+                        app_dict['by_models'] = {} if app_dict.get('by_models') is None else app_dict['by_models']
+                        app_dict['by_models'][usage.model_id] = usage.value \
+                            if app_dict['by_models'].get(usage.model_id) is None \
+                                else app_dict['by_models'][usage.model_id] + usage.value
+                    
+                    app_dict['total_ops'] = app_dict['total_ops'] + usage.value
+
+                    usage_data_dict[usage.app_id]: dict = _ensure_key_is_last(app_dict, 'total_ops')
+
+        response_schema.update(
+            entries_if_success={
+                'usage_by_apps': usage_data_dict,
+                'timeframe': cls._get_templates(template) \
+                    if start_date is None and end_date is None \
+                        else {'start_date': start_date, 'end_date': end_date}
+            }
+        )
+
+        return response_schema.build()
+
+    @classmethod
+    def _build_historical_by_apps_and_dates_schema(
+        cls,
+        response_object: LazyResponse,
+        start_date: str,
+        end_date: str,
+        template: str
+    ) -> dict:
+        usage_data_dict = {}
+        response_schema = BuildResponseSchema()
+
+        if response_object.status_code != ClarifaiStatusCodes.SUCCESS:
+            response_schema.update(
+                clarifai_status_code=response_object.status_code,
+                clarifai_error_description=response_object.details or response_object.description
+            )
+        else:
+            response_schema.update(is_success=True)
+            usages: List[dict] = response_object.dict.get('usage')
+
+            for usage in usages:
+                usage = UsageObject(usage)
+
+                if not usage_data_dict.get(usage.app_id):
+                    usage_data_dict[usage.app_id] = {}
+                
+                if not usage_data_dict[usage.app_id].get(usage.date):
+                    usage_data_dict[usage.app_id][usage.date] = {}
+                
+                if not usage_data_dict[usage.app_id][usage.date].get('by_ops_category'):
+                    usage_data_dict[usage.app_id][usage.date]['by_ops_category'] = {}
+
+                by_models_dict_exists: Union[dict, None] = usage_data_dict[usage.app_id][usage.date].get('by_models')
+                
+                if not by_models_dict_exists and usage.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
+                    usage_data_dict[usage.app_id][usage.date]['by_models'] = {}
+                
+                if usage.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
+                    by_models_dict = usage_data_dict[usage.app_id][usage.date]['by_models']
+                    by_models_dict[usage.model_id] = usage.value if not by_models_dict.get(usage.model_id) else \
+                        by_models_dict[usage.model_id] + usage.value
+                
+                by_ops_dict = usage_data_dict[usage.app_id][usage.date]['by_ops_category']
+                by_ops_dict[usage.category_id] = usage.value if not by_ops_dict.get(usage.category_id) else \
+                    by_ops_dict[usage.category_id] + usage.value
+                
+                usage_data_dict[usage.app_id][usage.date]['total_ops'] = usage.value if not \
+                    usage_data_dict[usage.app_id][usage.date].get('total_ops') else \
+                        usage_data_dict[usage.app_id][usage.date]['total_ops'] + usage.value
+            
+        response_schema.update(
+            entries_if_success={
+                'usage_by_apps_and_dates': usage_data_dict,
+                'timeframe': cls._get_templates(template) \
+                    if start_date is None and end_date is None \
+                        else {'start_date': start_date, 'end_date': end_date}
+            },
+        )
+
+        return response_schema.build()
+
+    @classmethod
+    def _build_historical_by_date_schema(
+        cls,
+        response_object: LazyResponse,
+        start_date: str,
+        end_date: str,
+        template: str
+    ) -> dict:
+        usage_data_dict = {}
+        response_schema = BuildResponseSchema()
+
+        if response_object.status_code != ClarifaiStatusCodes.SUCCESS:
+            response_schema.update(
+                clarifai_status_code=response_object.status_code,
+                clarifai_error_description=response_object.details or response_object.description
+            )
+        else:
+            response_schema.update(is_success=True)
+            usages: List[dict] = response_object.dict.get('usage')
+
+            for usage in usages:
+                usage = UsageObject(usage)
+
+                if not usage_data_dict.get(usage.date):
+                    usage_data_dict[usage.date] = {
+                        'by_ops_category': {usage.category_id: usage.value},
+                        **({'by_models': {usage.model_id: usage.value}} if usage.category_id in OPS_CATEGORIES_RELATED_TO_MODELS else {}),
+                        'total_ops': 0
+                    }
+                else:
+                    date_dict = usage_data_dict[usage.date]
+
+                    date_dict['by_ops_category'][usage.category_id] = usage.value if not \
+                        date_dict['by_ops_category'].get(usage.category_id) \
+                            else date_dict['by_ops_category'][usage.category_id] + usage.value
+
+                    if usage.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
+                        usage_dict_has_model_key: Union[dict, None] = date_dict.get('by_models')
+
+                        if not usage_dict_has_model_key: 
+                            date_dict['by_models'] = {}
+
+                        date_dict['by_models'][usage.model_id] = usage.value if not \
+                            date_dict.get('by_models', {}).get(usage.model_id) else \
+                                date_dict.get('by_models', {})[usage.model_id] + usage.value
+                
+                usage_data_dict[usage.date]['total_ops'] += usage.value
+
+                usage_data_dict[usage.date] = _ensure_key_is_last(usage_data_dict[usage.date], 'total_ops')
+
+        response_schema.update(
+            entries_if_success={
+                'usage_by_date': usage_data_dict,
+                'timeframe': cls._get_templates(template) \
+                    if start_date is None and end_date is None \
+                        else {'start_date': start_date, 'end_date': end_date}
+            }
+        )
+
+        return response_schema.build()
+
+    @classmethod
+    def _build_historical_by_date_and_apps_schema(
+        cls,
+        response_object: LazyResponse,
+        start_date: str,
+        end_date: str,
+        template: str
+    ) -> dict:
+        usage_data_dict = {}
+        response_schema = BuildResponseSchema()
+
+        if response_object.status_code != ClarifaiStatusCodes.SUCCESS:
+            response_schema.update(
+                clarifai_status_code=response_object.status_code,
+                clarifai_error_description=response_object.details or response_object.description
+            )
+        else:
+            response_schema.update(is_success=True)
+            usages: List[dict] = response_object.dict.get('usage')
+
+            for usage in usages:
+                usage_object = UsageObject(usage)
+
+                if not usage_data_dict.get(usage_object.date):
+                    usage_data_dict[usage_object.date] = {}
+                
+                if not usage_data_dict.get(usage_object.date, {}).get(usage_object.app_id):
+                    usage_data_dict[usage_object.date][usage_object.app_id] = {}
+                
+                if not usage_data_dict[usage_object.date][usage_object.app_id].get('by_ops_category'):
+                    usage_data_dict[usage_object.date][usage_object.app_id]['by_ops_category'] = {}
+                
+                by_models_dict_exists: Union[dict, None] = usage_data_dict[usage_object.date][usage_object.app_id].get('by_models')
+                    
+                if not by_models_dict_exists and usage_object.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
+                    usage_data_dict[usage_object.date][usage_object.app_id]['by_models'] = {}
+        
+                by_ops_dict = usage_data_dict[usage_object.date][usage_object.app_id]['by_ops_category']
+                by_ops_dict[usage_object.category_id] = usage_object.value if not by_ops_dict.get(usage_object.category_id) else \
+                    by_ops_dict.get(usage_object.category_id) + usage_object.value
+
+                if usage_object.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
+                    by_models_dict = usage_data_dict[usage_object.date][usage_object.app_id]['by_models']
+                    by_models_dict[usage_object.model_id] = usage_object.value if not by_models_dict.get(usage_object.model_id) else \
+                        by_models_dict.get(usage_object.model_id) + usage_object.value
+
+        response_schema.update(
+            entries_if_success={
+                'usage_by_date_and_apps': usage_data_dict,
+                'timeframe': cls._get_templates(template) \
+                    if None in (start_date, end_date) \
+                    else {'start_date': start_date, 'end_date': end_date}
+            }
+        )
+
+        return response_schema.build()
+
+    @classmethod
+    def _build_total_ops_schema(
+        cls,
+        response_object: LazyResponse,
+        start_date: str,
+        end_date: str,
+        template: str
+    ) -> dict:
+        response_schema = BuildResponseSchema()
+
+        total_ops = 0
+       
+        if response_object.status_code != ClarifaiStatusCodes.SUCCESS:
+            response_schema.update(
+                clarifai_status_code=response_object.status_code,
+                clarifai_error_description=response_object.details or response_object.description
+            )
+        else:
+            response_schema.update(is_success=True)
+            usages = response_object.dict['usage']
+
+            total_ops = sum(map(lambda usage: UsageObject(usage).value, usages))
+        
+        response_schema.update(
+            entries_if_success={
+                'total_ops': total_ops,
+                'timeframe': cls._get_templates(template) \
+                    if None in (start_date, end_date) \
+                        else {'start_date': start_date, 'end_date': end_date}
+            }
+        )
+
+        return response_schema.build()
+
     def _request_historical_usage(
         self,
         start_date: str = None,
@@ -103,6 +423,7 @@ class Usage:
         template: str = DEFAULT_TEMPLATE,
         broken_down_per_app: bool = None,
         auth_object: dict = {},
+        timeout: float = None,
         **kwargs
     ) -> ResponseWrapper:
         """
@@ -116,6 +437,7 @@ class Usage:
             end_date (str, optional)
             template (str, optional)
             broken_down_per_app (bool, optional)
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Object) - ResponseWrapper
@@ -132,7 +454,8 @@ class Usage:
                 'broken_down_per_app': broken_down_per_app
             },
             auth_object=auth_object,
-            package_params=self.params
+            package_params=self.params,
+            timeout=timeout
         )
 
         return ResponseWrapper(self.params, response_object=response_object)
@@ -142,6 +465,7 @@ class Usage:
         start_date: str = None,
         end_date: str = None,
         template: str = DEFAULT_TEMPLATE,
+        timeout: float = None
     ) -> ResponseWrapper:
         """
         Get historical usage (organized data) for specified timeframe.
@@ -156,6 +480,7 @@ class Usage:
                 - last_month
                 - last_3_months
                 - last_6_months
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Object) - ResponseWrapper
@@ -185,58 +510,21 @@ class Usage:
         """
         kwargs: dict = locals()
         kwargs.pop('self')
-        
-        usage_data_dict = {
-            'by_ops_category': {},
-            'total_ops': 0
-        }
 
         response_object = self._request_historical_usage(**kwargs).response
-        response_schema = BuildResponseSchema()
-
-        if response_object.status_code != ClarifaiStatusCodes.SUCCESS:
-            response_schema.update(
-                clarifai_status_code=response_object.status_code,
-                clarifai_error_description=response_object.details or response_object.description
-            )
-        else:
-            response_schema.update(is_success=True)
-            usages: List[dict] = response_object.dict.get('usage')
-            
-            for usage in usages:
-                usage = UsageObject(usage)
-
-                usage_data_dict['by_ops_category'][usage.category_id] = usage.value if not \
-                    usage_data_dict['by_ops_category'].get(usage.category_id) \
-                        else usage_data_dict['by_ops_category'][usage.category_id] + usage.value
-                
-                if usage.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
-                    if not usage_data_dict.get('by_models'): usage_data_dict['by_models'] = {}
-                    usage_data_dict['by_models'][usage.model_id] = usage.value if not \
-                        usage_data_dict['by_models'].get(usage.model_id) \
-                            else usage_data_dict['by_models'][usage.model_id] + usage.value
-                
-                usage_data_dict['total_ops'] += usage.value
-
-            usage_data_dict: dict = _ensure_key_is_last(usage_data_dict, 'total_ops')
 
-        response_schema.update(
-            entries_if_success={
-                'usage': usage_data_dict,
-                'timeframe': self._get_templates(template) \
-                    if start_date is None and end_date is None \
-                        else {'start_date': start_date, 'end_date': end_date}
-            },
+        return ResponseWrapper(
+            self.params,
+            response_dict=self._build_historical_schema(response_object, start_date, end_date, template)
         )
-
-        return ResponseWrapper(self.params, response_dict=response_schema.build())
     
     def historical_feed(
         self,
         start_date: str = None,
         end_date: str = None,
         template: str = DEFAULT_TEMPLATE,
-        broken_down_per_app: bool = None
+        broken_down_per_app: bool = None,
+        timeout: float = None
     ) -> ResponseWrapper:  
         """
         Get historical feed (unorganized data) usage for specified timeframe.
@@ -267,7 +555,8 @@ class Usage:
         self,
         start_date: str = None,
         end_date: str = None,
-        template: str = DEFAULT_TEMPLATE
+        template: str = DEFAULT_TEMPLATE,
+        timeout: float = None
     ) -> ResponseWrapper:
         """
         Get historical usage broken down per app.
@@ -282,6 +571,7 @@ class Usage:
                 - last_month
                 - last_3_months
                 - last_6_months
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
            (Object) - ResponseWrapper
@@ -289,61 +579,19 @@ class Usage:
         kwargs = locals() 
         kwargs.pop('self')
 
-        usage_data_dict = {}
-
         response_object = self._request_historical_usage(broken_down_per_app=True, **kwargs).response
-        response_schema = BuildResponseSchema()
-
-        if response_object.status_code != ClarifaiStatusCodes.SUCCESS:
-            response_schema.update(
-                clarifai_status_code=response_object.status_code,
-                clarifai_error_description=response_object.details or response_object.description
-            )
-        else:
-            response_schema.update(is_success=True)
-            usages: List[dict] = response_object.dict['usage']
-
-            for usage in usages:
-                usage = UsageObject(usage)
-
-                if usage_data_dict.get(usage.app_id) is None:
-                    usage_data_dict[usage.app_id] = {
-                        'by_ops_category': {},
-                        'total_ops': 0
-                    }
-                else:
-                    app_dict: dict = usage_data_dict[usage.app_id]
-
-                    app_dict['by_ops_category'][usage.category_id] = usage.value \
-                        if app_dict['by_ops_category'].get(usage.category_id) is None \
-                            else app_dict['by_ops_category'][usage.category_id] + usage.value
-
-                    if usage.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
-                        app_dict['by_models'] = {} if app_dict.get('by_models') is None else app_dict['by_models']
-                        app_dict['by_models'][usage.model_id] = usage.value \
-                            if app_dict['by_models'].get(usage.model_id) is None \
-                                else app_dict['by_models'][usage.model_id] + usage.value
-                    
-                    app_dict['total_ops'] = app_dict['total_ops'] + usage.value
-
-                    usage_data_dict[usage.app_id]: dict = _ensure_key_is_last(app_dict, 'total_ops')
 
-        response_schema.update(
-            entries_if_success={
-                'usage_by_apps': usage_data_dict,
-                'timeframe': self._get_templates(template) \
-                    if start_date is None and end_date is None \
-                        else {'start_date': start_date, 'end_date': end_date}
-            }
+        return ResponseWrapper(
+            self.params,
+            response_dict=self._build_historical_by_apps_schema(response_object, start_date, end_date, template)
         )
-
-        return ResponseWrapper(self.params, response_dict=response_schema.build())
     
     def historical_by_apps_and_dates(
         self,
         start_date: str = None,
         end_date: str = None,
-        template: str = None
+        template: str = None,
+        timeout: float = None
     ) -> ResponseWrapper:
         """
         Get historical usage broken down apps then date.
@@ -358,6 +606,7 @@ class Usage:
                 - last_month
                 - last_3_months
                 - last_6_months
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
            (Object) - ResponseWrapper
@@ -391,66 +640,19 @@ class Usage:
         kwargs = locals() 
         kwargs.pop('self')
 
-        usage_data_dict = {}
-
         response_object = self._request_historical_usage(broken_down_per_app=True, **kwargs).response
-        response_schema = BuildResponseSchema()
-
-        if response_object.status_code != ClarifaiStatusCodes.SUCCESS:
-            response_schema.update(
-                clarifai_status_code=response_object.status_code,
-                clarifai_error_description=response_object.details or response_object.description
-            )
-        else:
-            response_schema.update(is_success=True)
-            usages: List[dict] = response_object.dict.get('usage')
-
-            for usage in usages:
-                usage = UsageObject(usage)
-
-                if not usage_data_dict.get(usage.app_id):
-                    usage_data_dict[usage.app_id] = {}
-                
-                if not usage_data_dict[usage.app_id].get(usage.date):
-                    usage_data_dict[usage.app_id][usage.date] = {}
-                
-                if not usage_data_dict[usage.app_id][usage.date].get('by_ops_category'):
-                    usage_data_dict[usage.app_id][usage.date]['by_ops_category'] = {}
 
-                by_models_dict_exists: Union[dict, None] = usage_data_dict[usage.app_id][usage.date].get('by_models')
-                
-                if not by_models_dict_exists and usage.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
-                    usage_data_dict[usage.app_id][usage.date]['by_models'] = {}
-                
-                if usage.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
-                    by_models_dict = usage_data_dict[usage.app_id][usage.date]['by_models']
-                    by_models_dict[usage.model_id] = usage.value if not by_models_dict.get(usage.model_id) else \
-                        by_models_dict[usage.model_id] + usage.value
-                
-                by_ops_dict = usage_data_dict[usage.app_id][usage.date]['by_ops_category']
-                by_ops_dict[usage.category_id] = usage.value if not by_ops_dict.get(usage.category_id) else \
-                    by_ops_dict[usage.category_id] + usage.value
-                
-                usage_data_dict[usage.app_id][usage.date]['total_ops'] = usage.value if not \
-                    usage_data_dict[usage.app_id][usage.date].get('total_ops') else \
-                        usage_data_dict[usage.app_id][usage.date]['total_ops'] + usage.value
-            
-        response_schema.update(
-            entries_if_success={
-                'usage_by_apps_and_dates': usage_data_dict,
-                'timeframe': self._get_templates(template) \
-                    if start_date is None and end_date is None \
-                        else {'start_date': start_date, 'end_date': end_date}
-            },
+        return ResponseWrapper(
+            self.params,
+            response_dict=self._build_historical_by_apps_and_dates_schema(response_object, start_date, end_date, template)
         )
 
-        return ResponseWrapper(self.params, response_dict=response_schema.build())
-
     def historical_by_date(
         self,
         start_date: str = None,
         end_date: str = None,
-        template: str = None
+        template: str = None,
+        timeout: float = None
     ) -> ResponseWrapper:
         """
         Get historical usage broken down by date.
@@ -465,6 +667,7 @@ class Usage:
                 - last_month
                 - last_3_months
                 - last_6_months
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
            (Object) - ResponseWrapper
@@ -490,67 +693,20 @@ class Usage:
         
         kwargs: dict = locals()
         kwargs.pop('self')
-        
-        usage_data_dict = {}
 
         response_object = self._request_historical_usage(**kwargs).response
-        response_schema = BuildResponseSchema()
-
-        if response_object.status_code != ClarifaiStatusCodes.SUCCESS:
-            response_schema.update(
-                clarifai_status_code=response_object.status_code,
-                clarifai_error_description=response_object.details or response_object.description
-            )
-        else:
-            response_schema.update(is_success=True)
-            usages: List[dict] = response_object.dict.get('usage')
-
-            for usage in usages:
-                usage = UsageObject(usage)
-
-                if not usage_data_dict.get(usage.date):
-                    usage_data_dict[usage.date] = {
-                        'by_ops_category': {usage.category_id: usage.value},
-                        **({'by_models': {usage.model_id: usage.value}} if usage.category_id in OPS_CATEGORIES_RELATED_TO_MODELS else {}),
-                        'total_ops': 0
-                    }
-                else:
-                    date_dict = usage_data_dict[usage.date]
-
-                    date_dict['by_ops_category'][usage.category_id] = usage.value if not \
-                        date_dict['by_ops_category'].get(usage.category_id) \
-                            else date_dict['by_ops_category'][usage.category_id] + usage.value
-
-                    if usage.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
-                        usage_dict_has_model_key: Union[dict, None] = date_dict.get('by_models')
-
-                        if not usage_dict_has_model_key: 
-                            date_dict['by_models'] = {}
-
-                        date_dict['by_models'][usage.model_id] = usage.value if not \
-                            date_dict.get('by_models', {}).get(usage.model_id) else \
-                                date_dict.get('by_models', {})[usage.model_id] + usage.value
-                
-                usage_data_dict[usage.date]['total_ops'] += usage.value
-
-                usage_data_dict[usage.date] = _ensure_key_is_last(usage_data_dict[usage.date], 'total_ops')
 
-        response_schema.update(
-            entries_if_success={
-                'usage_by_date': usage_data_dict,
-                'timeframe': self._get_templates(template) \
-                    if start_date is None and end_date is None \
-                        else {'start_date': start_date, 'end_date': end_date}
-            }
+        return ResponseWrapper(
+            self.params,
+            response_dict=self._build_historical_by_date_schema(response_object, start_date, end_date, template)
         )
 
-        return ResponseWrapper(self.params, response_dict=response_schema.build())
-
     def historical_by_date_and_apps(
         self,
         start_date: str = None,
         end_date: str = None,
-        template: str = None
+        template: str = None,
+        timeout: float = None
     ) -> ResponseWrapper:
         """
         Get historical usage broken down by date then app.
@@ -565,6 +721,7 @@ class Usage:
                 - last_month
                 - last_3_months
                 - last_6_months
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
            (Object) - ResponseWrapper
@@ -601,63 +758,20 @@ class Usage:
         
         kwargs: dict = locals()
         kwargs.pop('self')
-        
-        usage_data_dict = {}
 
         response_object = self._request_historical_usage(broken_down_per_app=True, **kwargs).response
-        response_schema = BuildResponseSchema()
 
-        if response_object.status_code != ClarifaiStatusCodes.SUCCESS:
-            response_schema.update(
-                clarifai_status_code=response_object.status_code,
-                clarifai_error_description=response_object.details or response_object.description
-            )
-        else:
-            response_schema.update(is_success=True)
-            usages: List[dict] = response_object.dict.get('usage')
-
-            for usage in usages:
-                usage_object = UsageObject(usage)
-
-                if not usage_data_dict.get(usage_object.date):
-                    usage_data_dict[usage_object.date] = {}
-                
-                if not usage_data_dict.get(usage_object.date, {}).get(usage_object.app_id):
-                    usage_data_dict[usage_object.date][usage_object.app_id] = {}
-                
-                if not usage_data_dict[usage_object.date][usage_object.app_id].get('by_ops_category'):
-                    usage_data_dict[usage_object.date][usage_object.app_id]['by_ops_category'] = {}
-                
-                by_models_dict_exists: Union[dict, None] = usage_data_dict[usage_object.date][usage_object.app_id].get('by_models')
-                    
-                if not by_models_dict_exists and usage_object.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
-                    usage_data_dict[usage_object.date][usage_object.app_id]['by_models'] = {}
-        
-                by_ops_dict = usage_data_dict[usage_object.date][usage_object.app_id]['by_ops_category']
-                by_ops_dict[usage_object.category_id] = usage_object.value if not by_ops_dict.get(usage_object.category_id) else \
-                    by_ops_dict.get(usage_object.category_id) + usage_object.value
-
-                if usage_object.category_id in OPS_CATEGORIES_RELATED_TO_MODELS:
-                    by_models_dict = usage_data_dict[usage_object.date][usage_object.app_id]['by_models']
-                    by_models_dict[usage_object.model_id] = usage_object.value if not by_models_dict.get(usage_object.model_id) else \
-                        by_models_dict.get(usage_object.model_id) + usage_object.value
-
-        response_schema.update(
-            entries_if_success={
-                'usage_by_date_and_apps': usage_data_dict,
-                'timeframe': self._get_templates(template) \
-                    if None in (start_date, end_date) \
-                    else {'start_date': start_date, 'end_date': end_date}
-            }
+        return ResponseWrapper(
+            self.params,
+            response_dict=self._build_historical_by_date_and_apps_schema(response_object, start_date, end_date, template)
         )
-
-        return ResponseWrapper(self.params, response_dict=response_schema.build())
     
     def total_ops(
         self,
         start_date: str = None,
         end_date: str = None,
-        template: str = None
+        template: str = None,
+        timeout: float = None
     ) -> ResponseWrapper:
         """
         Return the total number of operations used for time period provided.
@@ -672,6 +786,7 @@ class Usage:
                 - last_month
                 - last_3_months
                 - last_6_months
+            timeout (float, optional): In seconds, retries included. Defaults to the client timeout.
 
         Returns:
             (Object) - ResponseWrapper
@@ -681,28 +796,8 @@ class Usage:
         kwargs.pop('self')
 
         response_object = self._request_historical_usage(broken_down_per_app=True, **kwargs).response
-        response_schema = BuildResponseSchema()
-
-        total_ops = 0
-       
-        if response_object.status_code != ClarifaiStatusCodes.SUCCESS:
-            response_schema.update(
-                clarifai_status_code=response_object.status_code,
-                clarifai_error_description=response_object.details or response_object.description
-            )
-        else:
-            response_schema.update(is_success=True)
-            usages = response_object.dict['usage']
-
-            total_ops = sum(map(lambda usage: UsageObject(usage).value, usages))
-        
-        response_schema.update(
-            entries_if_success={
-                'total_ops': total_ops,
-                'timeframe': self._get_templates(template) \
-                    if None in (start_date, end_date) \
-                        else {'start_date': start_date, 'end_date': end_date}
-            }
-        )
 
-        return ResponseWrapper(self.params, response_dict=response_schema.build())
\ No newline at end of file
+        return ResponseWrapper(
+            self.params,
+            response_dict=self._build_total_ops_schema(response_object, start_date, end_date, template)
+        )
\ No newline at end of file
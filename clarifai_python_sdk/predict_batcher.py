@@ -0,0 +1,388 @@
+# SYSTEM
+import json, time, asyncio, threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+
+# PACKAGE
+from clarifai_python_sdk.batch_predict import PredictResult, split_predict_response
+
+# ERRORS
+from clarifai_python_sdk.errors import UserError, DeadlineExceededError
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_PREDICT_BATCHER_CONFIG
+
+
+class _PendingBatch:
+    __slots__ = ('predict_args', 'items', 'send_at', 'timer')
+
+    def __init__(self, predict_args: tuple, send_at: float):
+        self.predict_args = predict_args # (model_id, model_version_id, output_config, auth_object)
+        self.items        = []           # (input, future)
+        self.send_at      = send_at
+        self.timer        = None         # asyncio only
+
+
+def _resolve(items: list, results: list) -> None:
+    for (_, future), result in zip(items, results):
+        if future.done(): # cancelled meanwhile
+            continue
+
+        if result.error is not None:
+            future.set_exception(result.error)
+        else:
+            future.set_result(result.output)
+
+
+class BasePredictBatcher:
+
+    def __init__(self, models: 'Models or AsyncModels', predict_batcher_config: dict = None):
+        self.models                 = models
+        self.predict_batcher_config = {**DEFAULT_PREDICT_BATCHER_CONFIG, **(predict_batcher_config or {})}
+
+        if self.predict_batcher_config['max_batch_size'] < 1 or self.predict_batcher_config['max_concurrency'] < 1:
+            raise UserError('max_batch_size and max_concurrency must be at least 1')
+
+        self.number_of_batches = 0
+        self.number_of_inputs  = 0
+
+        self._pending = {} # grouping key -> _PendingBatch, oldest first
+        self._closed  = False
+
+    @staticmethod
+    def _get_key(model_id: str, model_version_id: str, output_config: dict, auth_object: dict) -> tuple:
+        # inputs are only merged with those of the same model version, output config and credentials
+        return model_id, model_version_id, json.dumps([output_config, auth_object], sort_keys=True)
+
+    def _predict(self, inputs: list, model_id: str, model_version_id: str, output_config: dict, auth_object: dict):
+        # by keyword, the batched request has to carry the credentials of the inputs it groups
+        return self.models.predict(
+            inputs, model_id, model_version_id, output_config=output_config, auth_object=auth_object
+        )
+
+    @staticmethod
+    def _get_results(inputs: list, response: dict = None, error: Exception = None) -> list:
+        if error is not None:
+            return [PredictResult(idx, input, error=error) for idx, input in enumerate(inputs)]
+
+        return split_predict_response(0, inputs, response)
+
+    def _count_batch(self, number_of_inputs: int) -> None:
+        self.number_of_batches += 1
+        self.number_of_inputs  += number_of_inputs
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            (dict): {'batches': 40, 'inputs': 1100, 'mean_batch_size': 27.5, 'pending': 3}
+        """
+        return {
+            'batches': self.number_of_batches,
+            'inputs': self.number_of_inputs,
+            'mean_batch_size': round(self.number_of_inputs / self.number_of_batches, 2) if self.number_of_batches else None,
+            'pending': sum(len(batch.items) for batch in list(self._pending.values()))
+        }
+
+
+class PredictBatcher(BasePredictBatcher):
+    """
+    Merges single-input predicts made from any number of threads into batched models__predict requests...
+        future = clarifai.predict_batcher.submit({'image': {'url': ...}}, 'general-image-recognition')
+        output = future.result()  # this input's output, or raises its PredictError
+
+    Inputs are grouped per model version (and output config). A group is sent once it holds max_batch_size
+    inputs or max_wait seconds after its first one, whichever comes first. At most max_concurrency requests
+    are in flight, groups keep growing meanwhile: under load batches get bigger, not more numerous.
+    """
+
+    def __init__(self, models: 'Models', predict_batcher_config: dict = None):
+        super().__init__(models, predict_batcher_config)
+
+        self._in_flight  = 0
+        self._condition  = threading.Condition()
+        self._executor   = None
+        self._dispatcher = None
+
+    def _start(self) -> None:
+        if self._dispatcher is not None:
+            return
+
+        self._executor   = ThreadPoolExecutor(
+            max_workers=self.predict_batcher_config['max_concurrency'],
+            thread_name_prefix='clarifai-batcher'
+        )
+        self._dispatcher = threading.Thread(target=self._dispatch, name='clarifai-batcher-dispatch', daemon=True)
+        self._dispatcher.start()
+
+    def submit(
+        self,
+        input: dict,
+        model_id: str,
+        model_version_id: str = None,
+        output_config: dict = None,
+        auth_object: dict = {}
+        ) -> Future:
+        """
+        Args:
+            input (dict): One input, as an item of Models.predict's inputs
+            model_id (str)
+            model_version_id (str, optional): Defaults to None.
+            output_config (dict, optional): See Models.predict. Defaults to None.
+
+        Returns:
+            (Future): Resolves to the output of the input, or to its error (PredictError, request exception)
+        """
+        future = Future()
+        key    = self._get_key(model_id, model_version_id, output_config, auth_object)
+
+        with self._condition:
+            if self._closed:
+                raise UserError('PredictBatcher is closed')
+
+            self._start()
+
+            batch = self._pending.get(key)
+
+            if batch is None:
+                batch = self._pending[key] = _PendingBatch(
+                    (model_id, model_version_id, output_config, auth_object),
+                    time.monotonic() + self.predict_batcher_config['max_wait']
+                )
+
+            batch.items.append((input, future))
+
+            # the dispatcher sleeps until the oldest group is due, a new or full group changes that
+            if len(batch.items) == 1 or len(batch.items) >= self.predict_batcher_config['max_batch_size']:
+                self._condition.notify()
+
+        return future
+
+    def predict(
+        self,
+        input: dict,
+        model_id: str,
+        model_version_id: str = None,
+        output_config: dict = None,
+        auth_object: dict = {},
+        timeout: float = None
+        ) -> dict:
+        """
+        submit, then wait for the output
+
+        Args:
+            timeout (float, optional): In seconds, batching delay included. Defaults to None.
+
+        Returns:
+            (dict): Output of the input
+
+        Raises:
+            DeadlineExceededError: When the output is not there within timeout
+        """
+        future = self.submit(input, model_id, model_version_id, output_config, auth_object)
+
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise DeadlineExceededError(timeout) from None
+
+    def _take_due_batch(self, now: float) -> tuple or None:
+        max_batch_size = self.predict_batcher_config['max_batch_size']
+
+        for key, batch in self._pending.items():
+            if len(batch.items) < max_batch_size and batch.send_at > now and not self._closed:
+                continue
+
+            items = batch.items[:max_batch_size]
+
+            if len(batch.items) > max_batch_size:
+                batch.items = batch.items[max_batch_size:]
+            else:
+                del self._pending[key]
+
+            return batch.predict_args, items
+
+        return None
+
+    def _dispatch(self) -> None:
+        with self._condition:
+            while True:
+                timeout = None
+
+                if self._in_flight < self.predict_batcher_config['max_concurrency']:
+                    now = time.monotonic()
+                    due = self._take_due_batch(now)
+
+                    if due is not None:
+                        self._in_flight += 1
+                        self._executor.submit(self._send, *due)
+                        continue
+
+                    if self._closed and not self._pending:
+                        return
+
+                    if self._pending:
+                        timeout = min(batch.send_at for batch in self._pending.values()) - now
+
+                self._condition.wait(timeout)
+
+    def _send(self, predict_args: tuple, items: list) -> None:
+        # futures cancelled while waiting are left out
+        items  = [(input, future) for input, future in items if future.set_running_or_notify_cancel()]
+        inputs = [input for input, _ in items]
+
+        try:
+            if inputs:
+                response = self._predict(inputs, *predict_args).response.dict
+                results  = self._get_results(inputs, response)
+        except Exception as e:
+            results = self._get_results(inputs, error=e)
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify()
+
+                if inputs:
+                    self._count_batch(len(inputs))
+
+        if inputs:
+            _resolve(items, results)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Send what is pending and stop, later submits raise UserError
+
+        Args:
+            wait (bool, optional): Wait for the last batches to be answered. Defaults to True.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        if self._dispatcher is not None:
+            self._dispatcher.join()
+            self._executor.shutdown(wait=wait)
+
+
+class AsyncPredictBatcher(BasePredictBatcher):
+    """
+    PredictBatcher for AsyncClarifaiApi: coroutines of one event loop submit inputs, groups are sent as tasks...
+        output = await clarifai.predict_batcher.predict({'image': {'url': ...}}, 'general-image-recognition')
+    """
+
+    def __init__(self, models: 'AsyncModels', predict_batcher_config: dict = None):
+        super().__init__(models, predict_batcher_config)
+
+        self._semaphore = None
+        self._tasks     = set()
+
+    def submit(
+        self,
+        input: dict,
+        model_id: str,
+        model_version_id: str = None,
+        output_config: dict = None,
+        auth_object: dict = {}
+        ) -> asyncio.Future:
+        """
+        Same as PredictBatcher.submit, from a coroutine
+
+        Returns:
+            (asyncio.Future): Resolves to the output of the input, or to its error
+        """
+        if self._closed:
+            raise UserError('PredictBatcher is closed')
+
+        loop   = asyncio.get_running_loop()
+        future = loop.create_future()
+        key    = self._get_key(model_id, model_version_id, output_config, auth_object)
+        batch  = self._pending.get(key)
+
+        if batch is None:
+            batch       = self._pending[key] = _PendingBatch((model_id, model_version_id, output_config, auth_object), None)
+            batch.timer = loop.call_later(self.predict_batcher_config['max_wait'], self._flush, key)
+
+        batch.items.append((input, future))
+
+        if len(batch.items) >= self.predict_batcher_config['max_batch_size']:
+            self._flush(key)
+
+        return future
+
+    async def predict(
+        self,
+        input: dict,
+        model_id: str,
+        model_version_id: str = None,
+        output_config: dict = None,
+        auth_object: dict = {},
+        timeout: float = None
+        ) -> dict:
+        """
+        submit, then wait for the output
+
+        Args:
+            timeout (float, optional): In seconds, batching delay included. Defaults to None.
+
+        Returns:
+            (dict): Output of the input
+
+        Raises:
+            DeadlineExceededError: When the output is not there within timeout
+        """
+        future = self.submit(input, model_id, model_version_id, output_config, auth_object)
+
+        try:
+            # cancels the future on timeout, its input is then left out of the batch if not sent yet
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(timeout) from None
+
+    def _flush(self, key: tuple) -> None:
+        batch = self._pending.pop(key, None)
+
+        if batch is None:
+            return
+
+        batch.timer.cancel()
+
+        task = asyncio.ensure_future(self._send(batch.predict_args, batch.items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, predict_args: tuple, items: list) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.predict_batcher_config['max_concurrency'])
+
+        async with self._semaphore:
+            items  = [(input, future) for input, future in items if not future.done()]
+            inputs = [input for input, _ in items]
+
+            if not inputs:
+                return
+
+            try:
+                response = (await self._predict(inputs, *predict_args)).response.dict
+                results  = self._get_results(inputs, response)
+            except asyncio.CancelledError:
+                for _, future in items:
+                    future.cancel()
+
+                raise
+            except Exception as e:
+                results = self._get_results(inputs, error=e)
+
+            self._count_batch(len(inputs))
+
+        _resolve(items, results)
+
+    async def close(self) -> None:
+        """
+        Send what is pending and wait for it, later submits raise UserError
+        """
+        self._closed = True
+
+        for key in list(self._pending):
+            self._flush(key)
+
+        if self._tasks:
+            await asyncio.wait(list(self._tasks))
@@ -0,0 +1,116 @@
+# SYSTEM
+import time, asyncio, threading
+
+# PACKAGE
+from clarifai_python_sdk.deadline import Deadline
+
+# ERRORS
+from clarifai_python_sdk.errors import UserError, DeadlineExceededError
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_RATE_LIMIT_CONFIG
+
+
+class TokenBucket:
+    """
+    Tokens are reserved up front (the level may go negative), callers then sleep outside of the lock
+    for as long as the bucket needs to refill. This keeps callers served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate       = rate
+        self.capacity   = capacity
+        self.tokens     = capacity
+        self.updated_at = time.monotonic()
+
+    def reserve(self, weight: float = 1) -> float:
+        """
+        Returns:
+            (float): Seconds to wait before the request may be sent
+        """
+        now             = time.monotonic()
+        self.tokens     = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens    -= weight
+
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self, weight: float = 1) -> None:
+        # for a reservation that will not be used, callers queued behind it keep their wait
+        self.tokens = min(self.capacity, self.tokens + weight)
+
+
+class RateLimiter:
+    """
+    Thread-safe, shared by every module of a client through its http client, which takes a token for each
+    attempt sent (retries and hedged duplicates included). Each token (API key) gets its own bucket so the
+    origin and destination of a Transfer have separate budgets.
+    """
+
+    def __init__(self, rate_limit_config: dict = None):
+        self.rate_limit_config = {**DEFAULT_RATE_LIMIT_CONFIG, **(rate_limit_config or {})}
+
+        for key in ('requests_per_second', 'burst'):
+            if not self.rate_limit_config[key] > 0:
+                raise UserError(f'rate_limit_config["{key}"] must be greater than 0, got {self.rate_limit_config[key]}')
+
+        for endpoint_index_name, weight in self.rate_limit_config['endpoint_weights'].items():
+            if not weight >= 0:
+                raise UserError(f'Weight of "{endpoint_index_name}" in rate_limit_config must be positive, got {weight}')
+
+        self._buckets = {}
+        self._lock    = threading.Lock()
+
+    def _get_weight(self, endpoint_index_name: str) -> float:
+        return self.rate_limit_config['endpoint_weights'].get(endpoint_index_name, 1)
+
+    def reserve(self, token: str, endpoint_index_name: str) -> float:
+        with self._lock:
+            bucket = self._buckets.get(token)
+
+            if bucket is None:
+                bucket = self._buckets[token] = TokenBucket(
+                    rate=self.rate_limit_config['requests_per_second'],
+                    capacity=self.rate_limit_config['burst']
+                )
+
+            return bucket.reserve(self._get_weight(endpoint_index_name))
+
+    def refund(self, token: str, endpoint_index_name: str) -> None:
+        with self._lock:
+            self._buckets[token].refund(self._get_weight(endpoint_index_name))
+
+    def _reserve_within(self, token: str, endpoint_index_name: str, deadline: Deadline = None) -> float:
+        wait = self.reserve(token, endpoint_index_name)
+
+        # no point in waiting for a request that could only start after the deadline
+        if deadline is not None and wait >= deadline.remaining():
+            self.refund(token, endpoint_index_name)
+            raise DeadlineExceededError(deadline.timeout, endpoint_index_name)
+
+        return wait
+
+    def acquire(self, token: str, endpoint_index_name: str = None, deadline: Deadline = None) -> float:
+        """
+        Block until the request is allowed by the bucket of given token
+
+        Raises:
+            DeadlineExceededError: Right away, when the wait would outlast the deadline. The tokens are given back.
+
+        Returns:
+            (float): Seconds waited
+        """
+        wait = self._reserve_within(token, endpoint_index_name, deadline)
+
+        if wait:
+            time.sleep(wait)
+
+        return wait
+
+    async def acquire_async(self, token: str, endpoint_index_name: str = None, deadline: Deadline = None) -> float:
+        wait = self._reserve_within(token, endpoint_index_name, deadline)
+
+        if wait:
+            await asyncio.sleep(wait)
+
+        return wait
@@ -1,11 +1,16 @@
 # SYSTEM 
-import json
-from collections import namedtuple
+from functools import cached_property
 
 # PACKAGE
 from clarifai_python_sdk.make_clarifai_request import MakeClarifaiRequest
 from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
 
+# UTILS
+from clarifai_python_sdk.utils.json_codec import get_json_codec
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_RESPONSE_CONFIG
+
 
 class BuildResponseSchema:
     def __init__(
@@ -37,6 +42,67 @@ class BuildResponseSchema:
         return response_schema
 
 
+class LazyResponse:
+    """
+    What ResponseWrapper.response points to. Status fields are read straight from the response,
+    .dict, .data and .json are only built on first access and are never deep copies.
+    Any other attribute is looked up on the MakeClarifaiRequest object when there is one (.response, ...).
+    """
+
+    def __init__(
+        self,
+        params: dict,
+        response: dict,
+        response_object: MakeClarifaiRequest = None
+        ):
+
+        self._params          = params
+        self._response        = response
+        self._response_object = response_object
+
+    def __getattr__(self, name: str):
+        response_object = self.__dict__.get('_response_object')
+
+        if response_object is None:
+            raise AttributeError(name)
+
+        return getattr(response_object, name)
+
+    @property
+    def status_code(self) -> int or None:
+        return ResponseWrapper._get_satus_code_from_response(self._response)
+
+    @property
+    def description(self) -> str or None:
+        return ResponseWrapper._get_status_description_from_response(self._response)
+
+    @property
+    def details(self) -> str or None:
+        return ResponseWrapper._get_status_details_from_response(self._response)
+
+    @cached_property
+    def dict(self) -> dict:
+        return ResponseWrapper._get_response_as_dict(self._response)
+
+    @cached_property
+    def data(self) -> dict:
+        if self._response_object is not None:
+            return self._response_object.data
+
+        return {key: value for key, value in self._response.items() if key != 'status'}
+
+    @cached_property
+    def json(self) -> str or None:
+        response_config = {**DEFAULT_RESPONSE_CONFIG, **(self._params.get('response_config') or {})}
+
+        if not response_config['render_json']:
+            return None
+
+        json_codec = self._params.get('json_codec') or get_json_codec()
+
+        return json_codec.dumps_to_str(self._response, pretty=response_config['pretty_print_if_json'] == True)
+
+
 class ResponseWrapper:
     def __init__(
         self, 
@@ -48,20 +114,10 @@ class ResponseWrapper:
         self.params = params   
 
         if response_object:
-            self.response = response_object
-
-            setattr(self.response, 'dict', self._get_response_as_dict(self.response.response))
-            setattr(self.response, 'json', self._get_response_as_json(self.response.response))
+            self.response = LazyResponse(params, response_object.response, response_object=response_object)
         
         elif response_dict:
-            _class = namedtuple('Test', field_names=['dict', 'json', 'status_code', 'description', 'details'])
-            self.response = _class(
-                dict=self._get_response_as_dict(response_dict),
-                json=self._get_response_as_json(response_dict),
-                status_code=self._get_satus_code_from_response(response_dict),
-                description=self._get_status_description_from_response(response_dict),
-                details=self._get_status_details_from_response(response_dict)
-            )
+            self.response = LazyResponse(params, response_dict)
             
     @staticmethod
     def _get_status_details_from_response(response: dict) -> str or None:
@@ -76,14 +132,6 @@ class ResponseWrapper:
         return response.get('status', {}).get('code')
 
     @staticmethod
-    def _get_response_as_dict(response: dict) -> str:
+    def _get_response_as_dict(response: dict) -> dict:
+        # shallow, nested objects are shared with the raw response
         return dict(response)
-    
-    def _get_response_as_json(self, response):
-        additional_json_args = {}
-        pretty_print         = self.params.get('response_config', {}).get('pretty_print_if_json') or True
-        
-        if pretty_print is not None and pretty_print == True:
-            additional_json_args = {'indent': 2}
-
-        return json.dumps(response, **additional_json_args)
\ No newline at end of file
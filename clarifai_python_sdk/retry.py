@@ -0,0 +1,113 @@
+# SYSTEM
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_RETRY_CONFIG
+
+
+class RetryPolicy:
+    """
+    Decides whether a request should be sent again and how long to wait before doing so.
+    It does not send anything itself, HttpClient and AsyncHttpClient drive the attempts.
+    """
+
+    IDEMPOTENT_METHODS = frozenset(['get', 'head', 'options', 'put', 'delete'])
+
+    def __init__(self, retry_config: dict = None):
+        self.retry_config = {**DEFAULT_RETRY_CONFIG, **(retry_config or {})}
+
+    def is_retryable_method(self, method: str, idempotent: bool = None) -> bool:
+        """
+        Args:
+            method (str)
+            idempotent (bool, optional): Set by callers sending read-only POSTs (predict, searches...).
+                Defaults to None, the HTTP method decides.
+        """
+        if self.retry_config['retry_non_idempotent']:
+            return True
+
+        if idempotent is not None:
+            return idempotent
+
+        return method.lower() in self.IDEMPOTENT_METHODS
+
+    def should_retry(
+        self,
+        attempt: int,
+        method: str,
+        idempotent: bool = None,
+        http_status: int = None,
+        clarifai_status: int = None,
+        exception: Exception = None
+        ) -> bool:
+        """
+        Args:
+            attempt (int): Number of attempts already made, starts at 1
+            method (str)
+            idempotent (bool, optional)
+            http_status (int, optional)
+            clarifai_status (int, optional)
+            exception (Exception, optional): Connection error or timeout raised by the attempt
+
+        Returns:
+            (bool)
+        """
+        if attempt >= self.retry_config['max_attempts']:
+            return False
+
+        if not self.is_retryable_method(method, idempotent):
+            return False
+
+        if exception is not None:
+            return self.retry_config['retry_on_connection_errors']
+
+        return http_status in self.retry_config['retry_on_http_status'] \
+            or clarifai_status in self.retry_config['retry_on_clarifai_status']
+
+    def get_backoff(self, attempt: int, retry_after: str = None) -> float:
+        """
+        Seconds to wait before the next attempt
+
+        Args:
+            attempt (int): Number of attempts already made, starts at 1
+            retry_after (str, optional): Value of the Retry-After response header
+
+        Returns:
+            (float)
+        """
+        retry_after_seconds = self.parse_retry_after(retry_after) if self.retry_config['respect_retry_after'] else None
+
+        if retry_after_seconds is not None:
+            return min(retry_after_seconds, self.retry_config['max_retry_after'])
+
+        backoff = min(
+            self.retry_config['max_backoff'],
+            self.retry_config['backoff_factor'] * 2 ** (attempt - 1)
+        )
+
+        return random.uniform(0, backoff) if self.retry_config['jitter'] else backoff
+
+    @staticmethod
+    def parse_retry_after(retry_after: str = None) -> float or None:
+        """
+        Retry-After is either a number of seconds or an HTTP date
+        """
+        if not retry_after:
+            return None
+
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,126 @@
+# SYSTEM
+import asyncio, requests
+from requests.adapters import HTTPAdapter
+
+# CONSTANTS
+from clarifai_python_sdk.constants import DEFAULT_HTTP_CONFIG
+
+
+class TransportResponse:
+    """
+    What a transport hands back to HttpClient: the decoded body and what is needed to decide on a retry
+    """
+
+    def __init__(self, status: int, headers: dict, content: bytes):
+        self.status  = status
+        self.headers = headers
+        self.content = content
+
+
+class Transport:
+    """
+    Sends a single HTTP request and nothing else, retries, deadlines and decoding stay in HttpClient.
+
+    Subclasses set `retryable_exceptions` to the errors HttpClient should treat as connection failures.
+    """
+
+    retryable_exceptions = (ConnectionError, TimeoutError)
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        data: bytes = None,
+        timeout: tuple = None,
+        request_info: dict = None
+        ) -> TransportResponse:
+        """
+        Args:
+            method (str): Upper case http method
+            url (str)
+            headers (dict)
+            data (bytes, optional): Encoded (and possibly compressed) body
+            timeout (tuple, optional): (connect_timeout, read_timeout), None meaning no limit
+            request_info (dict, optional): What the client knows about the request (endpoint_index_name,
+                path_variables...), for transports recording or routing requests
+
+        Returns:
+            (Object) - TransportResponse
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncTransport:
+    """
+    asyncio counterpart of Transport, used by AsyncHttpClient
+    """
+
+    retryable_exceptions = (ConnectionError, TimeoutError, asyncio.TimeoutError)
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        data: bytes = None,
+        timeout: float = None,
+        request_info: dict = None
+        ) -> TransportResponse:
+        """
+        Args:
+            See Transport.send
+            timeout (float, optional): Total time allowed for the request, None meaning the transport default
+
+        Returns:
+            (Object) - TransportResponse
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class RequestsTransport(Transport):
+    """
+    Default transport, one keep-alive connection pool (requests.Session) for every request made through it
+    """
+
+    retryable_exceptions = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(self, http_config: dict = None):
+        self.http_config = {**DEFAULT_HTTP_CONFIG, **(http_config or {})}
+        self.session     = self._build_session()
+
+    def _build_session(self) -> requests.Session:
+        adapter = HTTPAdapter(
+            pool_connections=self.http_config['pool_connections'],
+            pool_maxsize=self.http_config['pool_maxsize'],
+            pool_block=self.http_config['pool_block']
+        )
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        data: bytes = None,
+        timeout: tuple = None,
+        request_info: dict = None
+        ) -> TransportResponse:
+
+        r = self.session.request(method, url, headers=headers, data=data, timeout=timeout)
+
+        return TransportResponse(r.status_code, r.headers, r.content)
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,50 @@
+# SYSTEM IMPORTS
+import gzip, zlib
+
+
+SUPPORTED_REQUEST_ENCODINGS = ('gzip', 'deflate')
+
+
+def compress_body(data: bytes, compression_config: dict) -> tuple:
+    """
+    Compress an encoded request body when compression is enabled and the body is large enough
+
+    Args:
+        data (bytes)
+        compression_config (dict): See DEFAULT_COMPRESSION_CONFIG
+
+    Returns:
+        (tuple): (data, content_encoding), content_encoding is None when data was left untouched
+    """
+    encoding = compression_config['request_encoding']
+
+    if not encoding or len(data) < compression_config['min_request_size']:
+        return data, None
+
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=compression_config['compress_level']), 'gzip'
+
+    if encoding == 'deflate':
+        return zlib.compress(data, compression_config['compress_level']), 'deflate'
+
+    raise ValueError(f'Unsupported request encoding "{encoding}", options are: {", ".join(SUPPORTED_REQUEST_ENCODINGS)}')
+
+
+def decompress_body(data: bytes, content_encoding: str = None) -> bytes:
+    """
+    Reverse of compress_body, data is returned as is for any other content_encoding
+    """
+    if content_encoding == 'gzip':
+        return gzip.decompress(data)
+
+    if content_encoding == 'deflate':
+        return zlib.decompress(data)
+
+    return data
+
+
+def compression_ratio(uncompressed_size: int or None, compressed_size: int or None) -> float or None:
+    if not uncompressed_size or not compressed_size:
+        return None
+
+    return round(uncompressed_size / compressed_size, 3)
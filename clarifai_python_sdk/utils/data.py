@@ -5,15 +5,16 @@ import base64, requests
 class Data:
 
     @staticmethod
-    def image_url_to_base_64(image_url: str) -> str:
+    def image_url_to_base_64(image_url: str, timeout: float = None) -> str:
         """Converts an image_url to base64 string
 
         Args:
             image_url (str)
+            timeout (float, optional)
 
         Returns:
             (string): base64
         """
-        return base64.b64encode(requests.get(image_url).content).decode('ascii')
+        return base64.b64encode(requests.get(image_url, timeout=timeout).content).decode('ascii')
     
 
@@ -1,4 +1,5 @@
 # SYSTEM
+import inspect
 from functools import wraps
 from subprocess import call
 
@@ -8,12 +9,22 @@ from clarifai_python_sdk.errors import UserError
 
 def handle_exception(fn: callable) -> callable:
 
+    if inspect.iscoroutinefunction(fn):
+        @wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                return getattr(e, 'message', str(e))
+
+        return async_wrapper
+
     @wraps(fn)
     def wrapper(*args, **kwargs):
         try:
             return fn(*args, **kwargs)
         except Exception as e:
-            return e.message
+            return getattr(e, 'message', str(e))
 
     return wrapper
 
@@ -28,22 +39,33 @@ def set_limits(limits: dict) -> callable:
             {'inputs': (128, 1), 'per_page': (10, 2)}  
     """
 
+    def check_limits(args: tuple, kwargs: dict) -> None:
+        for limit_key, limit_value in limits.items():
+            limit_key_is_kwargs = kwargs.get(limit_key, False)
+            
+            if limit_key_is_kwargs:
+                retrieved_arg_value = limit_key_is_kwargs
+            else:
+                retrieved_arg_value = args[limit_value[1]]
+
+            if len(retrieved_arg_value) > limit_value[0]:
+                raise UserError(f'Endpoints limits exceed "{limit_key}" length should be less or equal than {limit_value[0]}')
+
     def inner(fn):
-        @wraps(fn)
-        def wrapper(*args, **kwargs):
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                check_limits(args, kwargs)
+
+                return await fn(*args, **kwargs)
 
-            for limit_key, limit_value in limits.items():
-                limit_key_is_kwargs = kwargs.get(limit_key, False)
-                
-                if limit_key_is_kwargs:
-                    retrieved_arg_value = limit_key_is_kwargs
-                else:
-                    retrieved_arg_value = args[limit_value[1]]
+            return async_wrapper
 
-                if len(retrieved_arg_value) > limit_value[0]:
-                    raise UserError(f'Endpoints limits exceed "{limit_key}" length should be less or equal than {limit_value[0]}')
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            check_limits(args, kwargs)
 
             return fn(*args, **kwargs)
 
         return wrapper
-    return inner
\ No newline at end of file
+    return inner
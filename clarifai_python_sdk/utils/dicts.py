@@ -14,7 +14,7 @@ def get_existing_dicts_from_keys(_dict: dict, keys: list) -> dict:
 
     for key in keys:
         if key in _dict:
-            dict_to_return[key] = dic_dicttt[key]
+            dict_to_return[key] = _dict[key]
     
     return dict_to_return
 
@@ -0,0 +1,79 @@
+# SYSTEM IMPORTS
+import json
+
+# PACKAGES
+try:
+    import orjson
+except ImportError: # optional, stdlib json is used instead
+    orjson = None
+
+# ERRORS
+from clarifai_python_sdk.errors import UserError
+
+
+class JsonCodec:
+    """
+    Standard library codec, always available
+    """
+
+    name = 'json'
+
+    def dumps(self, obj) -> bytes:
+        """Encode a request body"""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data: bytes or str):
+        """Decode a response body"""
+        return json.loads(data)
+
+    def dumps_to_str(self, obj, pretty: bool = False) -> str:
+        """Render a response for ResponseWrapper.json"""
+        return json.dumps(obj, **({'indent': 2} if pretty else {}))
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    orjson codec, several times faster on large bodies (base64 images, inputs pages)
+    """
+
+    name = 'orjson'
+
+    def dumps(self, obj) -> bytes:
+        # usage aggregations may carry None keys (inputs without app_id), stdlib turns them into "null"
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: bytes or str):
+        return orjson.loads(data)
+
+    def dumps_to_str(self, obj, pretty: bool = False) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)).decode('utf-8')
+
+
+JSON_CODECS = {
+    'json': JsonCodec,
+    'orjson': OrjsonCodec
+}
+
+
+def get_json_codec(codec: str or JsonCodec = 'auto') -> JsonCodec:
+    """
+    Args:
+        codec (str or JsonCodec, optional): 'auto', 'orjson', 'json' or a JsonCodec instance.
+            'auto' picks orjson when installed. Defaults to 'auto'.
+
+    Returns:
+        (JsonCodec)
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+
+    if codec in (None, 'auto'):
+        codec = 'orjson' if orjson is not None else 'json'
+
+    if codec not in JSON_CODECS:
+        raise UserError(f'Unknown json codec "{codec}", options are: {", ".join(JSON_CODECS)}')
+
+    if codec == 'orjson' and orjson is None:
+        raise UserError('json codec "orjson" requires the "orjson" package, install it with `pip install orjson`')
+
+    return JSON_CODECS[codec]()
@@ -1,7 +1,112 @@
+# SYSTEM
+import re
+from operator import itemgetter
+from urllib.parse import quote
+
+# CONSTANTS
 from clarifai_python_sdk.endpoints import ENDPOINTS
 
-# UTILS
-from clarifai_python_sdk.utils.dicts import delete_none_values, get_existing_dicts_from_keys
+
+# unreserved characters of RFC 3986, values made of them only are used as is
+_is_url_safe = re.compile(r'[\w.~-]*', re.ASCII).fullmatch
+
+# ids, query param names... come back on every call, their encoding is looked up rather than recomputed
+_ENCODED_STRINGS_MAX_SIZE = 4096
+_encoded_strings          = {}
+
+
+def encode_url_value(value) -> str:
+    """
+    Percent-encode a path segment or query string value, '/' included
+    """
+    if type(value) is int:
+        return str(value)
+
+    value   = value if isinstance(value, str) else str(value)
+    encoded = _encoded_strings.get(value)
+
+    if encoded is None:
+        encoded = value if _is_url_safe(value) else quote(value, safe='')
+
+        if len(_encoded_strings) >= _ENCODED_STRINGS_MAX_SIZE:
+            _encoded_strings.clear()
+
+        _encoded_strings[value] = encoded
+
+    return encoded
+
+
+class CompiledRoute:
+    """
+    An ENDPOINTS format string parsed once: '/v2/users/{user_id}/apps' -> '/v2/users/%s/apps' and ('user_id',)
+    """
+
+    __slots__ = ('endpoint_name', 'template', 'variable_names', '_get_values', '_urls')
+
+    # urls kept per route, by path variable values
+    MAX_CACHED_URLS = 1024
+
+    def __init__(self, endpoint_name: str, endpoint: str):
+        parts = re.split(r'\{(\w+)\}', endpoint)
+
+        self.endpoint_name  = endpoint_name
+        self.variable_names = tuple(parts[1::2])
+        # used as is without variables, %-formatted otherwise
+        self.template       = endpoint if not self.variable_names else ''.join(
+            '%s' if idx % 2 else part.replace('%', '%%') for idx, part in enumerate(parts)
+        )
+
+        # always a tuple, itemgetter returns the value itself for a single name
+        getter           = itemgetter(*self.variable_names) if self.variable_names else None
+        self._get_values = getter if len(self.variable_names) > 1 else lambda variables: (getter(variables),)
+        self._urls       = {}
+
+    def _format(self, values: tuple) -> str:
+        if None in values:
+            raise KeyError(self.variable_names[values.index(None)])
+
+        url = self.template % tuple(map(encode_url_value, values))
+
+        # strings only, 1 and True would share a key
+        if all(type(value) is str for value in values):
+            if len(self._urls) >= self.MAX_CACHED_URLS:
+                self._urls.clear()
+
+            self._urls[values] = url
+
+        return url
+
+    def build(self, path_variables: dict = None, query_params: dict = None) -> str:
+        """
+        Variables that are not part of the route are ignored, inputs are never modified
+
+        Raises:
+            KeyError: When a variable of the route is missing or None
+        """
+        url = self.template
+
+        if self.variable_names:
+            try:
+                values = self._get_values(path_variables or {})
+                url    = self._urls.get(values)
+            except TypeError: # unhashable value
+                url = None
+
+            if url is None:
+                url = self._format(values)
+
+        if query_params:
+            query = '&'.join([
+                encode_url_value(key) + '=' + encode_url_value(value) for key, value in query_params.items() if value is not None
+            ])
+
+            if query:
+                url += '?' + query
+
+        return url
+
+
+COMPILED_ROUTES = {endpoint_name: CompiledRoute(endpoint_name, endpoint) for endpoint_name, endpoint in ENDPOINTS.items()}
 
 
 class UrlHandler:
@@ -17,33 +122,23 @@ class UrlHandler:
         query_params: dict = None
         ) -> str:
         """
-        Build a string for requested endpoint and feeds ids to pre-formatted string
+        Build the url of an endpoint from its route compiled at import, path variables and query params
+        are percent-encoded, None query params are left out
 
         Args:
             endpoint_name (str)
-            data (dict, optional): Url ids should be passed in a dict like {'user_id': 'xyz'}. Defaults to None.
+            path_variables (dict, optional): e.g. {'user_id': 'xyz'}. Defaults to None.
+            query_params (dict, optional): e.g. {'page': 1, 'per_page': 100}. Defaults to None.
 
         Returns:
             (String)
         """
+        route = COMPILED_ROUTES.get(endpoint_name)
 
-        url               = ENDPOINTS[endpoint_name]
-        query_params_list = []
+        if route is None: # added to ENDPOINTS after import
+            route = COMPILED_ROUTES[endpoint_name] = CompiledRoute(endpoint_name, ENDPOINTS[endpoint_name])
 
-        if (path_variables):
-            url = getattr(url, 'format')(**delete_none_values(path_variables))
-        
-        if query_params:
-            for idx, query_param in enumerate(query_params.items()):
-                if query_param[1] is not None:
-                    if idx == 0:
-                        query = f'?{query_param[0]}={query_param[1]}'
-                    else:
-                        query = f'&{query_param[0]}={query_param[1]}'
-                    
-                    query_params_list.append(query)
-                
-        return url + ''.join(query_params_list)
+        return route.build(path_variables, query_params)
 
     
     @classmethod
@@ -0,0 +1,175 @@
+# SYSTEM
+import json, time, threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# PACKAGES
+import pytest
+
+# PACKAGE
+from clarifai_python_sdk.fake_server import FakeClarifaiServer, FakeTransport, AsyncFakeTransport
+
+
+SUCCESS_RESPONSE = {'status': {'code': 10000, 'description': 'Ok'}}
+
+
+class RecordedRequest:
+    def __init__(self, method: str, path: str, headers: dict, body: bytes, client_port: int):
+        self.method      = method
+        self.path        = path
+        self.headers     = headers
+        self.body        = body
+        self.client_port = client_port
+
+
+class LocalApiServer:
+    """
+    HTTP server on localhost standing in for the Clarifai API. Every request is recorded and answered with
+    the next queued response, a successful status when the queue is empty...
+        api_server.responses.append((503, {'status': {'code': 10020}}, {'Retry-After': '0'}))
+    """
+
+    def __init__(self):
+        self.requests  = []
+        self.responses = [] # (http_status, dict or bytes, headers)
+        self.delay     = 0  # seconds before answering
+
+        self._lock   = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._build_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+
+        self._thread.start()
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_port}'
+
+    @property
+    def connections(self) -> int:
+        return len({request.client_port for request in self.requests})
+
+    def _next_response(self) -> tuple:
+        with self._lock:
+            return self.responses.pop(0) if self.responses else (200, SUCCESS_RESPONSE, {})
+
+    def _build_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1' # keep-alive
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body   = self.rfile.read(length) if length else b''
+
+                server.requests.append(
+                    RecordedRequest(self.command, self.path, dict(self.headers), body, self.client_address[1])
+                )
+
+                http_status, payload, headers = server._next_response()
+                content                       = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+
+                time.sleep(server.delay)
+
+                self.send_response(http_status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+
+                for name, value in headers.items():
+                    self.send_header(name, value)
+
+                self.end_headers()
+
+                try:
+                    self.wfile.write(content)
+                except ConnectionError: # the client gave up, e.g. its deadline ran out
+                    self.close_connection = True
+
+            do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class FailureInjection:
+    """
+    Counts attempts, and the most requests ever in flight at once, and keeps the headers of every request.
+    Requests for which `fail(attempt, data)` returns True raise a connection error instead of reaching the
+    fake server...
+        transport.fail = lambda attempt, data: attempt <= 2
+    """
+
+    def __init__(self, server: FakeClarifaiServer):
+        super().__init__(server)
+
+        self.fail          = lambda attempt, data: False
+        self.attempts      = 0
+        self.headers       = []
+        self.in_flight     = 0
+        self.max_in_flight = 0
+
+        self._lock = threading.Lock()
+
+    def _inject(self, headers: dict, data: bytes = None) -> None:
+        with self._lock:
+            self.attempts += 1
+            self.headers.append(headers)
+            attempt = self.attempts
+
+        if self.fail(attempt, data):
+            raise ConnectionError('Injected connection error')
+
+        with self._lock:
+            self.in_flight    += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _done(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+
+class InjectingTransport(FailureInjection, FakeTransport):
+    def send(self, method: str, url: str, headers: dict, data: bytes = None, **kwargs):
+        self._inject(headers, data)
+
+        try:
+            return super().send(method, url, headers, data, **kwargs)
+        finally:
+            self._done()
+
+
+class AsyncInjectingTransport(FailureInjection, AsyncFakeTransport):
+    async def send(self, method: str, url: str, headers: dict, data: bytes = None, **kwargs):
+        self._inject(headers, data)
+
+        try:
+            return await super().send(method, url, headers, data, **kwargs)
+        finally:
+            self._done()
+
+
+@pytest.fixture
+def fake_server() -> FakeClarifaiServer:
+    return FakeClarifaiServer({'seed': 1})
+
+
+@pytest.fixture
+def transport(fake_server) -> InjectingTransport:
+    return InjectingTransport(fake_server)
+
+
+@pytest.fixture
+def async_transport(fake_server) -> AsyncInjectingTransport:
+    return AsyncInjectingTransport(fake_server)
+
+
+@pytest.fixture
+def api_server():
+    server = LocalApiServer()
+    yield server
+    server.close()
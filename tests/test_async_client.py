@@ -0,0 +1,57 @@
+import asyncio, inspect
+
+import pytest
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+
+
+MODULES = ('apps', 'models', 'inputs', 'concepts', 'usage', 'transfer')
+
+# placeholders of the sync modules, not implemented yet
+NOT_IMPLEMENTED = {
+    'inputs': {'reupload_failed_inputs_as_base64', 'reupload_existing_inputs_as_base64'},
+    'transfer': {'inputs', 'models'}
+}
+
+
+def get_public_methods(module, excluded: set = ()) -> dict:
+    return {
+        name: method for name, method in inspect.getmembers(type(module), inspect.isfunction)
+        if (not name.startswith('_') or name == '__call__') and name not in excluded
+    }
+
+
+@pytest.mark.parametrize('module_name', MODULES)
+def test_every_method_has_an_async_counterpart(module_name):
+    sync_methods  = get_public_methods(getattr(ClarifaiApi('token'), module_name), NOT_IMPLEMENTED.get(module_name, ()))
+    async_methods = get_public_methods(getattr(AsyncClarifaiApi('token'), module_name))
+
+    assert set(async_methods) >= set(sync_methods)
+
+    for name, method in sync_methods.items():
+        async_method = async_methods[name]
+
+        assert inspect.signature(async_method).parameters.keys() == inspect.signature(method).parameters.keys(), name
+
+        if inspect.isgeneratorfunction(method):
+            assert inspect.isasyncgenfunction(async_method), name
+        elif inspect.signature(method).return_annotation is iter: # returns an iterator, an async one
+            assert not inspect.iscoroutinefunction(async_method), name
+        elif name != '__call__':
+            assert inspect.iscoroutinefunction(async_method), name
+
+
+def test_async_requests_share_one_session(api_server):
+    async def run():
+        async with AsyncClarifaiApi('token', app_id='app', base_url=api_server.base_url) as clarifai:
+            responses = await asyncio.gather(*(clarifai.apps.list(page=page) for page in range(1, 6)))
+            responses.append(await clarifai.me())
+
+        return responses
+
+    responses = asyncio.run(run())
+
+    assert [response.response.status_code for response in responses] == [10000] * 6
+    assert {request.headers['Authorization'] for request in api_server.requests} == {'Key token'}
+    assert len(api_server.requests) == 6
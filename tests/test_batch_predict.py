@@ -0,0 +1,80 @@
+import asyncio
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.fake_server import FakeClarifaiServer
+from clarifai_python_sdk.batch_predict import iter_batches, split_predict_response
+from clarifai_python_sdk.clarifai_status_codes import ClarifaiStatusCodes
+from clarifai_python_sdk.errors import PredictError
+
+
+def get_inputs(count: int) -> list:
+    return [{'image': {'url': f'https://example.com/{idx}.jpg'}} for idx in range(count)]
+
+
+def get_url(result) -> str:
+    return result.output['input']['data']['image']['url']
+
+
+def test_iter_batches():
+    assert list(iter_batches(iter(range(5)), 2)) == [(0, [0, 1]), (2, [2, 3]), (4, [4])]
+
+
+def test_split_mixed_status_response():
+    response = {
+        'status': {'code': ClarifaiStatusCodes.MIXED_STATUS},
+        'outputs': [
+            {'status': {'code': ClarifaiStatusCodes.SUCCESS}},
+            {'status': {'code': ClarifaiStatusCodes.FAILURE, 'description': 'Failure'}}
+        ]
+    }
+
+    results = split_predict_response(10, ['a', 'b'], response)
+
+    assert [result.index for result in results] == [10, 11]
+    assert results[0].ok
+    assert isinstance(results[1].error, PredictError)
+
+
+def test_split_failed_response():
+    results = split_predict_response(0, ['a', 'b'], {'status': {'code': ClarifaiStatusCodes.FAILURE}})
+
+    assert not any(result.ok for result in results)
+    assert results[0].error is results[1].error
+
+
+def test_predict_all_keeps_input_order():
+    server = FakeClarifaiServer({'seed': 1, 'latency_jitter': 0.01})
+
+    with ClarifaiApi('token', app_id='fake-app', transport=server.transport()) as clarifai:
+        results = clarifai.models.predict_all(get_inputs(100), 'general-image-recognition', batch_size=8, max_workers=4)
+
+    assert [result.index for result in results] == list(range(100))
+    assert [get_url(result) for result in results] == [input['image']['url'] for input in get_inputs(100)]
+    assert server.requests['models__predict_without_version_id'] == 13
+
+
+def test_failed_batch_only_fails_its_inputs(transport):
+    transport.fail = lambda attempt, data: b'fail' in (data or b'')
+
+    inputs     = get_inputs(30)
+    inputs[12] = {'image': {'url': 'https://example.com/fail.jpg'}}
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, retry_config={'max_attempts': 1}) as clarifai:
+        results = clarifai.models.predict_all(inputs, 'general-image-recognition', batch_size=10)
+
+    assert [result.ok for result in results] == [True] * 10 + [False] * 10 + [True] * 10
+    assert all(isinstance(result.error, ConnectionError) for result in results[10:20])
+
+
+def test_async_predict_all_keeps_input_order():
+    server = FakeClarifaiServer({'seed': 1, 'latency_jitter': 0.01})
+
+    async def run():
+        async with AsyncClarifaiApi('token', app_id='fake-app', transport=server.async_transport()) as clarifai:
+            return await clarifai.models.predict_all(get_inputs(50), 'general-image-recognition', batch_size=8)
+
+    results = asyncio.run(run())
+
+    assert [get_url(result) for result in results] == [input['image']['url'] for input in get_inputs(50)]
+    assert server.requests['models__predict_without_version_id'] == 7
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.cassette import Cassette, RecordingTransport, ReplayTransport, AsyncReplayTransport
+from clarifai_python_sdk.fake_server import FakeClarifaiServer
+from clarifai_python_sdk.errors import UserError
+
+
+PREDICT_INPUTS = [{'image': {'url': 'https://samples.clarifai.com/metro-north.jpg'}}]
+
+
+def record(path: str) -> tuple:
+    server   = FakeClarifaiServer({'seed': 1})
+    clarifai = ClarifaiApi('token', app_id='fake-app', transport=RecordingTransport(Cassette(path), server.transport()))
+
+    responses = (
+        clarifai.models.predict(PREDICT_INPUTS, 'general-image-recognition').response.dict,
+        clarifai.models.get_model_by_id('general-image-recognition').response.dict
+    )
+    clarifai.close()
+
+    return responses
+
+
+@pytest.mark.parametrize('filename', ['traffic.jsonl', 'traffic.jsonl.gz'])
+def test_replay_answers_recorded_requests(tmp_path, filename):
+    path      = str(tmp_path / filename)
+    responses = record(path)
+    cassette  = Cassette.load(path)
+
+    assert cassette.endpoints() == {'models__predict_without_version_id': 1, 'models__get_model_by_id': 1}
+
+    clarifai = ClarifaiApi('token', app_id='fake-app', transport=ReplayTransport(cassette))
+
+    assert clarifai.models.predict(PREDICT_INPUTS, 'general-image-recognition').response.dict == responses[0]
+    assert clarifai.models.get_model_by_id('general-image-recognition').response.dict == responses[1]
+
+
+def test_replay_matches_the_request_body(tmp_path):
+    path = str(tmp_path / 'traffic.jsonl')
+    record(path)
+
+    clarifai = ClarifaiApi('token', app_id='fake-app', transport=ReplayTransport(Cassette.load(path)))
+
+    with pytest.raises(UserError):
+        clarifai.models.predict([{'image': {'url': 'https://example.com/other.jpg'}}], 'general-image-recognition')
+
+
+def test_identical_requests_are_played_in_order(tmp_path):
+    path = str(tmp_path / 'traffic.jsonl')
+    record(path)
+
+    clarifai = ClarifaiApi('token', app_id='fake-app', transport=ReplayTransport(Cassette.load(path), repeat=True))
+
+    first  = clarifai.models.get_model_by_id('general-image-recognition').response.dict
+    second = clarifai.models.get_model_by_id('general-image-recognition').response.dict
+
+    assert first == second
+
+    clarifai = ClarifaiApi('token', app_id='fake-app', transport=ReplayTransport(Cassette.load(path)))
+    clarifai.models.get_model_by_id('general-image-recognition')
+
+    with pytest.raises(UserError):
+        clarifai.models.get_model_by_id('general-image-recognition')
+
+
+def test_async_replay(tmp_path):
+    path      = str(tmp_path / 'traffic.jsonl.gz')
+    responses = record(path)
+
+    async def run():
+        async with AsyncClarifaiApi('token', app_id='fake-app', transport=AsyncReplayTransport(Cassette.load(path))) as clarifai:
+            return (await clarifai.models.predict(PREDICT_INPUTS, 'general-image-recognition')).response.dict
+
+    assert asyncio.run(run()) == responses[0]
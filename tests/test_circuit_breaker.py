@@ -0,0 +1,140 @@
+import time, asyncio
+
+import pytest
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from clarifai_python_sdk.errors import CircuitOpenError
+from clarifai_python_sdk.constants import DEFAULT_CIRCUIT_BREAKER_CONFIG
+
+
+UNAVAILABLE = (503, {'status': {'code': 10020, 'description': 'Unavailable'}}, {})
+
+
+def get_circuit_breaker(**config) -> CircuitBreaker:
+    return CircuitBreaker('models__get_model_by_id', {**DEFAULT_CIRCUIT_BREAKER_CONFIG, **config})
+
+
+def test_opens_after_consecutive_failures():
+    circuit_breaker = get_circuit_breaker(consecutive_failures=3)
+
+    for _ in range(3):
+        circuit_breaker.before_request()
+        circuit_breaker.record(http_status=503)
+
+    assert circuit_breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.before_request()
+
+
+def test_opens_on_error_rate():
+    circuit_breaker = get_circuit_breaker(consecutive_failures=100, min_calls=4, error_rate=0.5)
+
+    for http_status in (200, 503, 200, 503):
+        circuit_breaker.record(http_status=http_status)
+
+    assert circuit_breaker.state == CircuitBreaker.OPEN
+
+
+def test_half_open_probe_closes_the_circuit():
+    circuit_breaker = get_circuit_breaker(consecutive_failures=1, reset_timeout=0.05)
+
+    circuit_breaker.record(exception=ConnectionError())
+    time.sleep(0.06)
+
+    assert circuit_breaker.state == CircuitBreaker.HALF_OPEN
+
+    circuit_breaker.before_request()
+
+    with pytest.raises(CircuitOpenError): # a single probe at a time
+        circuit_breaker.before_request()
+
+    circuit_breaker.record(http_status=200)
+
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_released_probe_frees_the_half_open_slot():
+    circuit_breaker = get_circuit_breaker(consecutive_failures=1, reset_timeout=0.05)
+
+    circuit_breaker.record(exception=ConnectionError())
+    time.sleep(0.06)
+
+    circuit_breaker.before_request()
+    circuit_breaker.release()
+    circuit_breaker.before_request() # the slot is free again
+
+    assert circuit_breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_registry_has_one_circuit_breaker_per_endpoint():
+    registry = CircuitBreakerRegistry()
+
+    assert registry.get('apps') is registry.get('apps')
+    assert registry.get('apps') is not registry.get('inputs__list')
+
+
+def test_client_fails_fast_while_open(api_server):
+    api_server.responses.extend([UNAVAILABLE] * 2)
+
+    clarifai = ClarifaiApi(
+        'token', app_id='app', base_url=api_server.base_url,
+        retry_config={'max_attempts': 1},
+        circuit_breaker_config={'consecutive_failures': 2, 'reset_timeout': 0.05}
+    )
+
+    for _ in range(2):
+        assert clarifai.models.get_model_by_id('general-image-recognition').response.status_code == 10020
+
+    with pytest.raises(CircuitOpenError):
+        clarifai.models.get_model_by_id('general-image-recognition')
+
+    assert len(api_server.requests) == 2
+    assert clarifai.circuit_breaker_states()['models__get_model_by_id']['state'] == CircuitBreaker.OPEN
+
+    # other endpoints are not affected
+    clarifai.models.list()
+
+    time.sleep(0.06)
+
+    response = clarifai.models.get_model_by_id('general-image-recognition')
+
+    assert response.response.status_code == 10000
+    assert clarifai.circuit_breaker_states()['models__get_model_by_id']['state'] == CircuitBreaker.CLOSED
+
+    clarifai.close()
+
+
+def test_cancelled_half_open_probe_does_not_keep_the_circuit_open(async_transport, fake_server):
+    async_transport.fail = lambda attempt, data: attempt == 1
+
+    async def run():
+        async with AsyncClarifaiApi(
+            'token', app_id='fake-app', transport=async_transport,
+            retry_config={'max_attempts': 1},
+            circuit_breaker_config={'consecutive_failures': 1, 'reset_timeout': 0.05}
+        ) as clarifai:
+            with pytest.raises(ConnectionError):
+                await clarifai.models.get_model_by_id('general-image-recognition')
+
+            await asyncio.sleep(0.06)
+
+            fake_server.fake_server_config['latency'] = 5
+            probe = asyncio.ensure_future(clarifai.models.get_model_by_id('general-image-recognition'))
+            await asyncio.sleep(0.02)
+            probe.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+
+            fake_server.fake_server_config['latency'] = 0
+            response = await clarifai.models.get_model_by_id('general-image-recognition')
+
+            return response, clarifai.circuit_breaker_states()['models__get_model_by_id']['state']
+
+    response, state = asyncio.run(run())
+
+    assert response.response.status_code == 10000
+    assert state == CircuitBreaker.CLOSED
@@ -0,0 +1,39 @@
+from clarifai_python_sdk.client import ClarifaiApi
+
+
+def test_modules_share_one_http_client(api_server):
+    clarifai = ClarifaiApi('token', app_id='app', base_url=api_server.base_url)
+
+    for module in (clarifai.apps, clarifai.models, clarifai.inputs, clarifai.concepts, clarifai.usage, clarifai.transfer):
+        assert module.params['http_client'] is clarifai._http_client
+
+    clarifai.close()
+
+
+def test_connections_are_reused(api_server):
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url) as clarifai:
+        for _ in range(5):
+            clarifai.me()
+            clarifai.apps.list()
+
+    assert len(api_server.requests) == 10
+    assert api_server.connections == 1
+
+
+def test_pool_size_is_configurable():
+    clarifai = ClarifaiApi('token', http_config={'pool_maxsize': 32, 'read_timeout': 5})
+    adapter  = clarifai._http_client.transport.session.get_adapter('https://api.clarifai.com')
+
+    assert adapter._pool_maxsize == 32
+    assert clarifai._http_client.timeout == (10, 5)
+
+    clarifai.close()
+
+
+def test_token_is_sent_per_request(api_server):
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url) as clarifai:
+        clarifai.me()
+        clarifai.apps.list(auth_object={'token': 'other-token', 'user_app_id': {'user_id': 'me', 'app_id': 'other'}})
+
+    assert [request.headers['Authorization'] for request in api_server.requests] == ['Key token', 'Key other-token']
+    assert api_server.connections == 1
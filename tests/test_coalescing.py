@@ -0,0 +1,198 @@
+import time, asyncio, threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.coalescing import RequestCoalescer
+from clarifai_python_sdk.deadline import Deadline
+from clarifai_python_sdk.fake_server import FakeClarifaiServer
+from clarifai_python_sdk.errors import DeadlineExceededError
+
+
+KEY = ('models__get_model_by_id', 'token', '/v2/models/general-image-recognition')
+
+
+class SlowSend:
+    def __init__(self, seconds: float, error: Exception = None):
+        self.seconds = seconds
+        self.error   = error
+        self.calls   = 0
+
+    def __call__(self) -> dict:
+        self.calls += 1
+        time.sleep(self.seconds)
+
+        if self.error is not None:
+            raise self.error
+
+        return {'status': {'code': 10000}}
+
+
+def test_should_coalesce():
+    request_coalescer = RequestCoalescer({'enabled': True, 'excluded_endpoints': ('inputs__stream',)})
+
+    assert request_coalescer.should_coalesce('models__get_model_by_id', 'GET')
+    assert not request_coalescer.should_coalesce('models__predict', 'POST')
+    assert not request_coalescer.should_coalesce('inputs__stream', 'GET')
+    assert not RequestCoalescer().should_coalesce('models__get_model_by_id', 'GET') # opt-in
+
+
+def test_concurrent_calls_share_one_request():
+    request_coalescer = RequestCoalescer()
+    send              = SlowSend(0.1)
+
+    with ThreadPoolExecutor(5) as executor:
+        results = list(executor.map(lambda _: request_coalescer.run(KEY, send), range(5)))
+
+    assert send.calls == 1
+    assert sorted(coalesced for _, coalesced in results) == [False, True, True, True, True]
+    assert all(response == {'status': {'code': 10000}} for response, _ in results)
+    assert request_coalescer.number_of_coalesced == 4
+
+    # nothing is kept once the request is done
+    request_coalescer.run(KEY, send)
+
+    assert send.calls == 2
+
+
+def test_waiters_get_the_error_of_the_request():
+    request_coalescer = RequestCoalescer()
+    send              = SlowSend(0.1, ConnectionError('Injected connection error'))
+
+    def run(_) -> Exception:
+        with pytest.raises(ConnectionError) as e:
+            request_coalescer.run(KEY, send)
+
+        return e.value
+
+    with ThreadPoolExecutor(3) as executor:
+        errors = list(executor.map(run, range(3)))
+
+    assert send.calls == 1
+    assert all(error is errors[0] for error in errors)
+
+
+def test_waiters_are_bounded_by_their_deadline():
+    request_coalescer = RequestCoalescer()
+    leader            = threading.Thread(target=request_coalescer.run, args=(KEY, SlowSend(0.3)))
+
+    leader.start()
+    time.sleep(0.05)
+
+    with pytest.raises(DeadlineExceededError):
+        request_coalescer.run(KEY, SlowSend(0), Deadline(0.05))
+
+    leader.join()
+
+
+def test_interrupted_leader_hands_over_to_a_waiter():
+    request_coalescer = RequestCoalescer()
+    calls             = []
+
+    def send() -> dict:
+        calls.append(None)
+        time.sleep(0.1)
+
+        if len(calls) == 1:
+            raise KeyboardInterrupt
+
+        return {'status': {'code': 10000}}
+
+    def run(_) -> tuple:
+        try:
+            return request_coalescer.run(KEY, send)
+        except KeyboardInterrupt:
+            return None
+
+    with ThreadPoolExecutor(3) as executor:
+        results = list(executor.map(run, range(3)))
+
+    assert len(calls) == 2
+    assert results.count(None) == 1
+    assert sorted(coalesced for _, coalesced in filter(None, results)) == [False, True]
+
+
+def test_async_calls_share_one_request():
+    request_coalescer = RequestCoalescer()
+    calls             = []
+
+    async def send() -> dict:
+        calls.append(None)
+        await asyncio.sleep(0.05)
+
+        return {'status': {'code': 10000}}
+
+    async def run():
+        return await asyncio.gather(*(request_coalescer.run_async(KEY, send) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert [coalesced for _, coalesced in results] == [False, True, True, True, True]
+
+
+def test_cancelled_async_leader_hands_over_to_a_waiter():
+    request_coalescer = RequestCoalescer()
+    calls             = []
+
+    async def send() -> dict:
+        calls.append(None)
+        await asyncio.sleep(0.05)
+
+        return {'status': {'code': 10000}}
+
+    async def run():
+        leader  = asyncio.ensure_future(request_coalescer.run_async(KEY, send))
+        await asyncio.sleep(0)
+        waiters = [asyncio.ensure_future(request_coalescer.run_async(KEY, send)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        return await asyncio.gather(*waiters), leader.cancelled()
+
+    results, cancelled = asyncio.run(run())
+
+    assert cancelled
+    assert len(calls) == 2
+    assert all(response == {'status': {'code': 10000}} for response, _ in results)
+    assert sorted(coalesced for _, coalesced in results) == [False, True, True]
+
+
+def test_clients_do_not_coalesce_by_default(transport, fake_server):
+    fake_server.fake_server_config['latency'] = 0.05
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport) as clarifai:
+        with ThreadPoolExecutor(3) as executor:
+            list(executor.map(lambda _: clarifai.models.get_model_by_id('general-image-recognition'), range(3)))
+
+    assert fake_server.requests['models__get_model_by_id'] == 3
+
+
+def test_client_coalesces_identical_reads():
+    server = FakeClarifaiServer({'seed': 1, 'latency': 0.1})
+
+    with ClarifaiApi(
+        'token', app_id='fake-app', transport=server.transport(), coalesce_config={'enabled': True}
+    ) as clarifai:
+        with ThreadPoolExecutor(4) as executor:
+            responses = list(executor.map(lambda _: clarifai.models.get_model_by_id('general-image-recognition'), range(4)))
+
+    assert server.requests['models__get_model_by_id'] == 1
+    assert sum(bool(response.response.request_info.get('coalesced')) for response in responses) == 3
+    assert len({id(response.response.dict['model']) for response in responses}) == 1
+
+
+def test_async_client_coalesces_identical_reads():
+    server = FakeClarifaiServer({'seed': 1, 'latency': 0.05})
+
+    async def run():
+        async with AsyncClarifaiApi(
+            'token', app_id='fake-app', transport=server.async_transport(), coalesce_config={'enabled': True}
+        ) as clarifai:
+            await asyncio.gather(*(clarifai.models.get_model_by_id('general-image-recognition') for _ in range(4)))
+
+    asyncio.run(run())
+
+    assert server.requests['models__get_model_by_id'] == 1
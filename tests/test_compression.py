@@ -0,0 +1,87 @@
+import gzip, zlib, json, asyncio
+
+import pytest
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.utils.compression import compress_body, compression_ratio
+from clarifai_python_sdk.constants import DEFAULT_COMPRESSION_CONFIG
+
+
+DATA = json.dumps({'inputs': [{'data': {'image': {'url': f'https://example.com/{idx}.jpg'}}} for idx in range(100)]}).encode()
+
+LISTING = {
+    'status': {'code': 10000, 'description': 'Ok'},
+    'inputs': [{'id': str(idx), 'data': {'image': {'url': f'https://example.com/{idx}.jpg'}}} for idx in range(100)]
+}
+
+
+@pytest.mark.parametrize('encoding', ['gzip', 'deflate'])
+def test_compress_round_trip(encoding):
+    data, content_encoding = compress_body(DATA, {**DEFAULT_COMPRESSION_CONFIG, 'request_encoding': encoding})
+
+    assert content_encoding == encoding
+    assert len(data) < len(DATA)
+    assert (gzip.decompress(data) if encoding == 'gzip' else zlib.decompress(data)) == DATA
+
+
+def test_small_or_uncompressed_bodies_are_left_untouched():
+    assert compress_body(DATA, DEFAULT_COMPRESSION_CONFIG) == (DATA, None)
+    assert compress_body(b'{}', {**DEFAULT_COMPRESSION_CONFIG, 'request_encoding': 'gzip'}) == (b'{}', None)
+
+    with pytest.raises(ValueError):
+        compress_body(DATA, {**DEFAULT_COMPRESSION_CONFIG, 'request_encoding': 'br'})
+
+
+def test_compression_ratio():
+    assert compression_ratio(1000, 250) == 4
+    assert compression_ratio(1000, None) is None
+
+
+def test_request_bodies_are_compressed(api_server):
+    inputs = [{'image': {'url': f'https://example.com/{idx}.jpg'}} for idx in range(100)]
+
+    with ClarifaiApi(
+        'token', app_id='app', base_url=api_server.base_url, compression_config={'request_encoding': 'gzip'}
+    ) as clarifai:
+        response = clarifai.models.predict(inputs, 'general-image-recognition')
+        clarifai.models.predict(inputs[:1], 'general-image-recognition')
+
+    large, small = api_server.requests
+
+    assert large.headers['Content-Encoding'] == 'gzip'
+    assert [input['data'] for input in json.loads(gzip.decompress(large.body))['inputs']] == inputs
+    assert response.response.request_info['request_bytes_sent'] == len(large.body)
+    assert response.response.request_info['request_compression_ratio'] > 1
+
+    assert 'Content-Encoding' not in small.headers
+    assert json.loads(small.body)['inputs'] == [{'data': inputs[0]}]
+
+
+def test_listings_negotiate_compressed_responses(api_server):
+    api_server.responses.append((200, gzip.compress(json.dumps(LISTING).encode()), {'Content-Encoding': 'gzip'}))
+
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url) as clarifai:
+        response = clarifai.inputs.list()
+        clarifai.apps.list()
+
+    listing, apps = api_server.requests
+
+    assert 'gzip' in listing.headers['Accept-Encoding']
+    assert response.response.dict == LISTING
+    assert response.response.request_info['response_encoding'] == 'gzip'
+    assert response.response.request_info['response_compression_ratio'] > 1
+
+
+def test_async_request_bodies_are_compressed(api_server):
+    inputs = [{'image': {'url': f'https://example.com/{idx}.jpg'}} for idx in range(100)]
+
+    async def run():
+        async with AsyncClarifaiApi(
+            'token', app_id='app', base_url=api_server.base_url, compression_config={'request_encoding': 'deflate'}
+        ) as clarifai:
+            return await clarifai.models.predict(inputs, 'general-image-recognition')
+
+    assert asyncio.run(run()).response.status_code == 10000
+    assert api_server.requests[0].headers['Content-Encoding'] == 'deflate'
+    assert len(json.loads(zlib.decompress(api_server.requests[0].body))['inputs']) == 100
@@ -0,0 +1,103 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.concept_scores import ConceptScores
+from clarifai_python_sdk.batch_predict import PredictResult
+from clarifai_python_sdk.errors import UserError, PredictError
+
+
+def get_output(input_id: str, concepts: dict) -> dict:
+    return {
+        'status': {'code': 10000},
+        'input': {'id': input_id},
+        'data': {'concepts': [{'id': concept_id, 'value': value} for concept_id, value in concepts.items()]}
+    }
+
+
+OUTPUTS = [
+    get_output('a', {'dog': 0.9, 'cat': 0.2}),
+    get_output('b', {'cat': 0.8, 'car': 0.5}),
+    {'status': {'code': 10020, 'description': 'Failure'}}
+]
+
+
+def test_matrix_follows_the_concept_index():
+    scores = ConceptScores.from_outputs(OUTPUTS)
+
+    assert scores.concept_ids == ['dog', 'cat', 'car']
+    assert scores.scores.dtype == np.float32
+    np.testing.assert_allclose(scores.scores, [[0.9, 0.2, 0], [0, 0.8, 0.5], [0, 0, 0]])
+    assert scores.valid.tolist() == [True, True, False]
+    assert scores.input_ids == ['a', 'b', None]
+
+
+def test_given_concept_ids_keep_the_columns():
+    scores = ConceptScores.from_outputs(OUTPUTS, concept_ids=['car', 'dog'])
+
+    assert scores.concept_ids == ['car', 'dog']
+    np.testing.assert_allclose(scores.scores, [[0, 0.9], [0.5, 0], [0, 0]])
+
+
+def test_predict_results():
+    results = [
+        PredictResult(0, {}, output=OUTPUTS[0]),
+        PredictResult(1, {}, error=PredictError({'code': 10020}))
+    ]
+
+    scores = ConceptScores.from_outputs(results)
+
+    assert scores.valid.tolist() == [True, False]
+    np.testing.assert_allclose(scores.column('dog'), [0.9, 0])
+
+
+def test_threshold_argmax_and_top_k():
+    scores = ConceptScores.from_outputs(OUTPUTS[:2])
+
+    assert scores.threshold(0.5).tolist() == [[True, False, False], [False, True, True]]
+
+    indexes, values = scores.argmax()
+
+    assert indexes.tolist() == [0, 1]
+    np.testing.assert_allclose(values, [0.9, 0.8])
+
+    indexes, values = scores.top_k(2)
+
+    assert indexes.tolist() == [[0, 1], [1, 2]]
+    np.testing.assert_allclose(values, [[0.9, 0.2], [0.8, 0.5]])
+    assert scores.top_k_ids(5) == [['dog', 'cat', 'car'], ['cat', 'car', 'dog']]
+
+    with pytest.raises(UserError):
+        scores.top_k(0)
+
+
+def test_precision_at():
+    scores = ConceptScores.from_outputs(OUTPUTS)
+
+    precision = scores.precision_at([['dog'], ['car'], ['cat']], 0.5)
+
+    np.testing.assert_allclose(precision, [1.0, 0.0, 1.0])
+    np.testing.assert_allclose(
+        scores.precision_at(np.array([[1, 0, 0], [0, 1, 0], [0, 0, 0]]), 0.1), [1.0, 0.5, 0.0]
+    )
+
+    with pytest.raises(UserError):
+        scores.precision_at([['dog']], 0.5)
+
+
+def test_from_response(transport):
+    inputs = [{'image': {'url': f'https://example.com/{idx}.jpg'}} for idx in range(4)]
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport) as clarifai:
+        response = clarifai.models.predict(inputs, 'general-image-recognition')
+
+    scores  = ConceptScores.from_response(response)
+    outputs = response.response.dict['outputs']
+
+    assert scores.scores.shape[0] == 4
+    assert scores.valid.all()
+
+    for row, output in enumerate(outputs):
+        for concept in output['data']['concepts']:
+            assert scores.scores[row, scores.concept_index[concept['id']]] == pytest.approx(concept['value'])
@@ -0,0 +1,130 @@
+import time, asyncio
+
+import pytest
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.deadline import Deadline
+from clarifai_python_sdk.errors import UserError, DeadlineExceededError
+
+
+INPUTS = [{'image': {'url': f'https://example.com/{idx}.jpg'}} for idx in range(3)]
+
+PAGE = {
+    'status': {'code': 10000, 'description': 'Ok'},
+    'inputs': [{'id': str(idx), 'data': {'image': {'url': f'https://example.com/{idx}.jpg'}}} for idx in range(100)]
+}
+
+
+def test_deadline():
+    deadline = Deadline(0.05)
+
+    assert Deadline.from_timeout(None) is None
+    assert Deadline.from_timeout(deadline) is deadline
+    assert 0 < deadline.remaining() <= 0.05
+    assert deadline.cap(10) <= 0.05
+    assert deadline.cap(0.01) == 0.01
+
+    deadline.check('apps')
+    time.sleep(0.06)
+
+    assert deadline.expired
+    assert deadline.cap() == Deadline.MIN_SOCKET_TIMEOUT
+
+    with pytest.raises(DeadlineExceededError):
+        deadline.check('apps')
+
+
+def test_slow_request_exceeds_its_timeout(api_server):
+    api_server.delay = 0.5
+
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url) as clarifai:
+        started_at = time.monotonic()
+
+        with pytest.raises(DeadlineExceededError):
+            clarifai.apps.list(timeout=0.1)
+
+    assert time.monotonic() - started_at < 0.4
+
+
+def test_client_timeout_is_the_default(api_server):
+    api_server.delay = 0.5
+
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url, timeout=0.1) as clarifai:
+        with pytest.raises(DeadlineExceededError):
+            clarifai.models.get_model_by_id('general-image-recognition')
+
+
+def test_no_retry_past_the_deadline(api_server):
+    api_server.responses.extend([(503, {'status': {'code': 10020}}, {'Retry-After': '5'})] * 2)
+
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url) as clarifai:
+        started_at = time.monotonic()
+        response   = clarifai.apps.list(timeout=1)
+
+    assert time.monotonic() - started_at < 1
+    assert response.response.status_code == 10020
+    assert len(api_server.requests) == 1
+
+
+def test_listing_returns_what_was_read_before_the_deadline(api_server):
+    api_server.responses.append((200, PAGE, {}))
+    api_server.delay = 0.15
+
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url, timeout=0.25) as clarifai:
+        response = clarifai.inputs.list_all()
+
+    assert response.response.dict['deadline_exceeded'] is True
+    assert len(response.response.dict['inputs']) == 100
+
+
+def test_async_request_exceeds_its_timeout(api_server):
+    api_server.delay = 0.5
+
+    async def run():
+        async with AsyncClarifaiApi('token', app_id='app', base_url=api_server.base_url) as clarifai:
+            await clarifai.apps.list(timeout=0.1)
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(run())
+
+
+def test_reads_have_a_default_timeout():
+    assert ClarifaiApi('token')._http_client.timeout == (10, 60)
+
+
+def test_failed_upload_raises_without_a_deadline(transport):
+    transport.fail = lambda attempt, data: True
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, retry_config={'max_attempts': 1}) as clarifai:
+        with pytest.raises(UserError):
+            clarifai.transfer._upload_inputs(INPUTS)
+
+
+def test_failed_deletion_is_reported_without_a_deadline(transport):
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, retry_config={'max_attempts': 1}) as clarifai:
+        clarifai.inputs.add(INPUTS)
+
+        transport.fail = lambda attempt, data: attempt == 3 # the DELETE, after add and stream
+        response = clarifai.inputs.delete_all()
+
+    assert response.response.dict['status']['code'] == 10020
+    assert response.response.dict['number_of_delete_inputs'] == 0
+
+
+def test_async_failures_are_surfaced(async_transport):
+    async def run():
+        async with AsyncClarifaiApi(
+            'token', app_id='fake-app', transport=async_transport, retry_config={'max_attempts': 1}
+        ) as clarifai:
+            await clarifai.inputs.add(INPUTS)
+
+            async_transport.fail = lambda attempt, data: attempt >= 3
+            response = await clarifai.inputs.delete_all()
+
+            with pytest.raises(UserError):
+                await clarifai.transfer._upload_inputs(INPUTS)
+
+            return response
+
+    assert asyncio.run(run()).response.dict['status']['code'] == 10020
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.embeddings import EmbeddingStore
+from clarifai_python_sdk.errors import UserError
+
+
+MODEL_ID = 'general-image-embedding'
+
+
+@pytest.fixture(autouse=True)
+def embedding_size(fake_server):
+    fake_server.fake_server_config['embedding_size'] = 16
+
+
+def get_inputs(count: int) -> list:
+    return [(f'input-{idx}', {'image': {'url': f'https://example.com/{idx}.jpg'}}) for idx in range(count)]
+
+
+def interrupted(inputs: list, after: int) -> iter:
+    for idx, input in enumerate(inputs):
+        if idx == after:
+            raise KeyboardInterrupt
+
+        yield input
+
+
+def test_extract_embeddings(tmp_path, transport):
+    with ClarifaiApi('token', app_id='fake-app', transport=transport) as clarifai:
+        store = clarifai.models.extract_embeddings(get_inputs(25), MODEL_ID, str(tmp_path / 'vectors.npy'), batch_size=10)
+
+    assert store.complete
+    assert store.ids == [input_id for input_id, _ in get_inputs(25)]
+
+    vectors = np.load(tmp_path / 'vectors.npy')
+
+    assert vectors.shape == (25, 16)
+    assert not np.isnan(vectors).any()
+    assert np.array_equal(store.get('input-3'), vectors[3])
+
+
+def test_resume_after_an_interruption(tmp_path, transport, fake_server):
+    inputs = get_inputs(100)
+    path   = str(tmp_path / 'vectors.npy')
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport) as clarifai:
+        with pytest.raises(KeyboardInterrupt):
+            clarifai.models.extract_embeddings(
+                interrupted(inputs, 60), MODEL_ID, path, total=100, batch_size=10, max_workers=1
+            )
+
+        written = len(EmbeddingStore(path))
+
+        assert 0 < written < 100
+
+        fake_server.requests.clear()
+        store = clarifai.models.extract_embeddings(inputs, MODEL_ID, path, batch_size=10, max_workers=1)
+
+        assert store.complete
+        assert store.ids == [input_id for input_id, _ in inputs]
+        assert fake_server.requests['models__predict_without_version_id'] == (100 - written + 9) // 10
+
+        expected = clarifai.models.extract_embeddings(inputs, MODEL_ID, str(tmp_path / 'expected.npy'), batch_size=10)
+
+    assert np.array_equal(np.load(path), np.load(tmp_path / 'expected.npy'))
+    assert expected.complete
+
+
+def test_failed_inputs_are_nan(tmp_path, transport):
+    transport.fail = lambda attempt, data: b'fail' in (data or b'')
+
+    inputs     = get_inputs(30)
+    inputs[15] = ('input-15', {'image': {'url': 'https://example.com/fail.jpg'}})
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, retry_config={'max_attempts': 1}) as clarifai:
+        clarifai.models.extract_embeddings(inputs, MODEL_ID, str(tmp_path / 'vectors.npy'), batch_size=10)
+
+    nan_rows = np.isnan(np.load(tmp_path / 'vectors.npy')).all(axis=1)
+
+    assert nan_rows.tolist() == [False] * 10 + [True] * 10 + [False] * 10
+
+
+def test_store_refuses_another_total(tmp_path):
+    path  = str(tmp_path / 'vectors.npy')
+    store = EmbeddingStore(path, total=2)
+
+    store.write(['a'], [[0.1, 0.2]])
+    store.close()
+
+    with pytest.raises(UserError):
+        EmbeddingStore(path, total=3)
+
+
+def test_async_extract_embeddings(tmp_path, transport, async_transport):
+    async def run():
+        async with AsyncClarifaiApi('token', app_id='fake-app', transport=async_transport) as clarifai:
+            return await clarifai.models.extract_embeddings(
+                get_inputs(25), MODEL_ID, str(tmp_path / 'async.npy'), batch_size=10
+            )
+
+    store = asyncio.run(run())
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport) as clarifai:
+        clarifai.models.extract_embeddings(get_inputs(25), MODEL_ID, str(tmp_path / 'sync.npy'), batch_size=10)
+
+    assert store.complete
+    assert np.array_equal(np.load(tmp_path / 'async.npy'), np.load(tmp_path / 'sync.npy'))
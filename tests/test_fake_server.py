@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+import requests
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.fake_server import FakeClarifaiServer
+
+
+PREDICT_INPUTS = [{'image': {'url': f'https://samples.clarifai.com/{idx}.jpg'}} for idx in range(3)]
+
+
+def test_routes(transport, fake_server):
+    with ClarifaiApi('token', app_id='fake-app', transport=transport) as clarifai:
+        assert clarifai.me().response.dict['user']['id'] == 'fake-user'
+        assert clarifai.apps.get('fake-app').response.dict['app']['id'] == 'fake-app'
+        assert len(clarifai.inputs.list(per_page=30).response.dict['inputs']) == 30
+
+        outputs = clarifai.models.predict(PREDICT_INPUTS, 'general-image-recognition').response.dict['outputs']
+
+    assert [output['input']['data'] for output in outputs] == PREDICT_INPUTS
+    assert all(len(output['data']['concepts']) == 20 for output in outputs)
+    assert fake_server.stats()['requests'] == 4
+
+
+def test_outputs_only_depend_on_the_model_and_input():
+    def predict(seed: int) -> list:
+        server = FakeClarifaiServer({'seed': seed, 'embedding_size': 8})
+
+        with ClarifaiApi('token', app_id='fake-app', transport=server.transport()) as clarifai:
+            return [
+                clarifai.models.predict(PREDICT_INPUTS, model_id).response.dict['outputs'][0]['data']
+                for model_id in ('general-image-recognition', 'general-image-embedding')
+            ]
+
+    concepts, embeddings = predict(1)
+
+    assert predict(2) == [concepts, embeddings]
+    assert len(embeddings['embeddings'][0]['vector']) == 8
+
+
+def test_injected_http_errors_are_retried():
+    server = FakeClarifaiServer({'seed': 1, 'error_rate': 1})
+
+    with ClarifaiApi('token', app_id='fake-app', transport=server.transport(), retry_config={'backoff_factor': 0}) as clarifai:
+        response = clarifai.apps.list()
+
+    assert response.response.status_code == 10020
+    assert server.requests['apps'] == 3
+
+
+def test_injected_connection_errors_are_raised():
+    server = FakeClarifaiServer({'seed': 1, 'connection_error_rate': 1})
+
+    with ClarifaiApi('token', app_id='fake-app', transport=server.transport(), retry_config={'backoff_factor': 0}) as clarifai:
+        with pytest.raises(ConnectionError):
+            clarifai.apps.list()
+
+    assert server.requests['apps'] == 3
+
+
+def test_connection_errors_are_retried(transport):
+    transport.fail = lambda attempt, data: attempt <= 2
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, retry_config={'backoff_factor': 0}) as clarifai:
+        assert clarifai.models.get_model_by_id('general-image-recognition').response.status_code == 10000
+
+    assert transport.attempts == 3
+
+
+def test_latency_is_bounded_by_the_read_timeout():
+    server = FakeClarifaiServer({'seed': 1, 'endpoint_latency': {'apps': 1}})
+
+    with ClarifaiApi(
+        'token', app_id='fake-app', transport=server.transport(),
+        http_config={'read_timeout': 0.05}, retry_config={'max_attempts': 1}
+    ) as clarifai:
+        clarifai.me()
+
+        with pytest.raises(TimeoutError):
+            clarifai.apps.list()
+
+
+def test_async_transport(async_transport, fake_server):
+    async def run():
+        async with AsyncClarifaiApi('token', app_id='fake-app', transport=async_transport) as clarifai:
+            return await asyncio.gather(*(clarifai.models.predict(PREDICT_INPUTS, 'general-image-recognition') for _ in range(4)))
+
+    responses = asyncio.run(run())
+
+    assert len({str(response.response.dict['outputs'][0]['data']) for response in responses}) == 1
+    assert fake_server.requests['models__predict_without_version_id'] == 4
+    assert async_transport.attempts == 4
+
+
+def test_serve_over_http(fake_server):
+    base_url = fake_server.serve()
+
+    try:
+        response = requests.get(base_url + '/v2/users/me/apps/fake-app', headers={'Authorization': 'Key token'})
+
+        assert response.status_code == 200
+        assert response.json()['app']['id'] == 'fake-app'
+
+        with ClarifaiApi('token', app_id='fake-app', base_url=base_url) as clarifai:
+            assert clarifai.models.list().response.status_code == 10000
+    finally:
+        fake_server.shutdown()
@@ -0,0 +1,140 @@
+import time, asyncio, threading
+
+import pytest
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.hedging import LatencyTracker, RequestHedger
+
+
+ENDPOINT = 'models__predict'
+
+
+def get_hedger(**config) -> RequestHedger:
+    request_hedger = RequestHedger({'min_samples': 10, 'min_delay': 0.02, 'max_hedge_ratio': 1, **config})
+
+    for _ in range(10):
+        request_hedger.latency_tracker.record(ENDPOINT, 0.01)
+
+    return request_hedger
+
+
+def test_latency_percentile():
+    latency_tracker = LatencyTracker(window_size=100)
+
+    for idx in range(200): # only the last 100 are kept
+        latency_tracker.record(ENDPOINT, idx / 1000)
+
+    assert latency_tracker.count(ENDPOINT) == 100
+    assert latency_tracker.percentile(ENDPOINT, 50) == 0.15
+    assert latency_tracker.percentile(ENDPOINT, 100) == 0.199
+    assert latency_tracker.percentile('apps', 50) is None
+
+
+def test_no_hedging_before_min_samples():
+    request_hedger = RequestHedger({'min_samples': 10})
+    calls          = []
+
+    def send(request_info: dict) -> dict:
+        calls.append(request_info)
+        return {'status': {'code': 10000}}
+
+    assert request_hedger.get_delay(ENDPOINT) is None
+    assert request_hedger.run(send, ENDPOINT) == ({'status': {'code': 10000}}, {})
+    assert len(calls) == 1
+
+
+def test_slow_request_is_hedged():
+    request_hedger = get_hedger()
+    calls          = []
+
+    def send(request_info: dict) -> dict:
+        calls.append(request_info)
+
+        if not request_info.get('hedged'):
+            time.sleep(0.5)
+
+        return {'hedged': request_info.get('hedged', False)}
+
+    started_at             = time.monotonic()
+    response, request_info = request_hedger.run(send, ENDPOINT)
+
+    assert time.monotonic() - started_at < 0.4
+    assert response == {'hedged': True}
+    assert request_info == {'hedged': True}
+    assert len(calls) == 2
+    assert request_hedger.number_of_hedges == 1
+
+    request_hedger.close()
+
+
+def test_failed_request_falls_back_on_the_hedge():
+    request_hedger = get_hedger()
+
+    def send(request_info: dict) -> dict:
+        if not request_info.get('hedged'):
+            time.sleep(0.05)
+            raise ConnectionError('Injected connection error')
+
+        time.sleep(0.1)
+        return {'hedged': True}
+
+    assert request_hedger.run(send, ENDPOINT)[0] == {'hedged': True}
+
+    request_hedger.close()
+
+
+def test_hedges_are_bounded_by_max_hedge_ratio():
+    request_hedger = get_hedger(max_hedge_ratio=0.25)
+    calls          = []
+    lock           = threading.Lock()
+
+    def send(request_info: dict) -> dict:
+        with lock:
+            calls.append(request_info)
+
+        time.sleep(0.04)
+        return {}
+
+    for _ in range(8):
+        request_hedger.run(send, ENDPOINT)
+
+    assert request_hedger.number_of_hedges == 2
+    assert len(calls) == 10
+
+    request_hedger.close()
+
+
+def test_async_loser_is_cancelled():
+    request_hedger = get_hedger()
+    cancelled      = []
+
+    async def send(request_info: dict) -> dict:
+        if request_info.get('hedged'):
+            return {'hedged': True}
+
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(request_info)
+            raise
+
+        return {'hedged': False}
+
+    async def run():
+        response = await request_hedger.run_async(send, ENDPOINT)
+        await asyncio.sleep(0) # let the cancellation go through
+
+        return response
+
+    assert asyncio.run(run()) == ({'hedged': True}, {'hedged': True})
+    assert cancelled == [{}]
+
+
+def test_client_records_predict_latencies(api_server):
+    inputs = [{'image': {'url': 'https://samples.clarifai.com/metro-north.jpg'}}]
+
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url) as clarifai:
+        response = clarifai.models.predict(inputs, 'general-image-recognition', hedge=True)
+
+        assert response.response.status_code == 10000
+        assert clarifai._request_hedger.latency_tracker.count('models__predict_without_version_id') == 1
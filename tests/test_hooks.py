@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.fake_server import FakeClarifaiServer
+from clarifai_python_sdk.hooks import REQUEST_PHASES
+
+
+PREDICT_INPUTS = [{'image': {'url': 'https://samples.clarifai.com/metro-north.jpg'}}]
+
+
+def test_timing_breakdown():
+    server = FakeClarifaiServer({'seed': 1, 'latency': 0.05})
+    events = []
+
+    with ClarifaiApi('token', app_id='fake-app', transport=server.transport(), hooks=[events.append]) as clarifai:
+        clarifai.models.predict(PREDICT_INPUTS, 'general-image-recognition')
+
+    event, = events
+
+    assert event.endpoint_index_name == 'models__predict_without_version_id'
+    assert event.clarifai_status == 10000 and event.http_status == 200
+    assert list(event.timings) == [phase for phase in REQUEST_PHASES if phase not in ('rate_limit_wait', 'retry_wait')]
+    assert event.timings['network'] >= 0.05
+    assert sum(event.timings.values()) <= event.duration
+    assert event.bytes_sent > 0 and event.bytes_received > 0
+    assert event.as_dict()['retries'] == 0
+
+
+def test_retries_and_errors_are_reported(transport):
+    events = []
+
+    transport.fail = lambda attempt, data: attempt != 2
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, retry_config={'backoff_factor': 0.01, 'jitter': False}) as clarifai:
+        clarifai.add_hook(events.append)
+        clarifai.apps.list()
+
+        with pytest.raises(ConnectionError):
+            clarifai.apps.list()
+
+    succeeded, failed = events
+
+    assert succeeded.retries == 1
+    assert succeeded.timings['retry_wait'] == pytest.approx(0.01)
+    assert failed.error is not None and failed.clarifai_status is None
+
+
+def test_hooks_can_be_removed_and_do_not_fail_requests(transport):
+    events = []
+
+    def broken_hook(event):
+        raise ValueError('broken')
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, hooks=[broken_hook]) as clarifai:
+        with pytest.warns(RuntimeWarning):
+            assert clarifai.me().response.status_code == 10000
+
+        clarifai.remove_hook(broken_hook)
+
+        @clarifai.add_hook
+        def hook(event):
+            events.append(event.endpoint_index_name)
+
+        clarifai.me()
+
+    assert events == ['me']
+
+
+def test_async_hooks(async_transport):
+    events = []
+
+    async def run():
+        async with AsyncClarifaiApi('token', app_id='fake-app', transport=async_transport, hooks=[events.append]) as clarifai:
+            await asyncio.gather(clarifai.me(), clarifai.apps.list())
+
+    asyncio.run(run())
+
+    assert sorted(event.endpoint_index_name for event in events) == ['apps', 'me']
+    assert all(event.timings['network'] > 0 for event in events)
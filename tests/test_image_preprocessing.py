@@ -0,0 +1,121 @@
+import io, base64, asyncio
+
+import pytest
+
+Image = pytest.importorskip('PIL.Image')
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.image_preprocessing import ImagePreprocessor
+from clarifai_python_sdk.errors import UserError
+
+
+def get_image(size: tuple, mode: str = 'RGB', format: str = 'PNG', orientation: int = None) -> bytes:
+    image  = Image.effect_noise(size, 64).convert(mode) if mode != 'L' else Image.effect_noise(size, 64)
+    buffer = io.BytesIO()
+
+    if orientation is not None:
+        exif = Image.Exif()
+        exif[0x0112] = orientation
+        image.save(buffer, format=format, exif=exif)
+    else:
+        image.save(buffer, format=format)
+
+    return buffer.getvalue()
+
+
+def open_image(content: bytes) -> 'Image.Image':
+    return Image.open(io.BytesIO(content))
+
+
+def test_large_images_are_resized_and_reencoded():
+    preprocessor = ImagePreprocessor({'max_side': 256})
+    content      = get_image((1024, 512))
+
+    processed = open_image(preprocessor.process(content))
+
+    assert processed.format == 'JPEG'
+    assert processed.size == (256, 128)
+    assert preprocessor.stats()['images'] == 1
+    assert preprocessor.stats()['bytes_saved'] > 0
+
+
+def test_webp_format():
+    preprocessor = ImagePreprocessor({'max_side': 256, 'format': 'webp'})
+
+    assert open_image(preprocessor.process(get_image((512, 512)))).format == 'WEBP'
+
+    with pytest.raises(UserError):
+        ImagePreprocessor({'format': 'GIF'})
+
+
+@pytest.mark.parametrize('mode', ['RGBA', 'LA', 'P'])
+def test_transparent_pixels_become_white(mode):
+    image = Image.new('RGBA', (512, 512), (0, 0, 0, 0)).convert(mode)
+
+    if mode == 'P':
+        image.info['transparency'] = image.getpixel((0, 0))
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+
+    processed = open_image(ImagePreprocessor({'max_side': 256}).process(buffer.getvalue()))
+
+    assert processed.mode == 'RGB'
+    assert all(channel > 250 for channel in processed.getpixel((128, 128)))
+
+
+def test_exif_orientation_is_applied_then_stripped():
+    preprocessor = ImagePreprocessor({'max_side': 256})
+    content      = get_image((400, 200), format='JPEG', orientation=6) # rotated 90 degrees
+
+    processed = open_image(preprocessor.process(content))
+
+    assert processed.size == (128, 256)
+    assert not processed.getexif()
+
+
+def test_small_images_and_other_data_are_kept():
+    preprocessor = ImagePreprocessor({'max_side': 512})
+    small        = get_image((64, 64), format='JPEG')
+
+    assert preprocessor.process(small) is small
+    assert preprocessor.process(b'not an image') == b'not an image'
+    assert preprocessor.stats()['skipped'] == 2
+
+
+def test_inputs_are_not_modified():
+    preprocessor = ImagePreprocessor({'max_side': 128})
+    content      = base64.b64encode(get_image((512, 512))).decode('ascii')
+    inputs       = [{'image': {'base64': content}}, {'image': {'url': 'https://example.com/1.jpg'}}]
+
+    processed = preprocessor.process_inputs(inputs)
+
+    assert inputs[0]['image']['base64'] == content
+    assert processed[1] is inputs[1]
+    assert open_image(base64.b64decode(processed[0]['image']['base64'])).size == (128, 128)
+
+
+def test_predict_sends_the_processed_image(transport):
+    inputs = [{'image': {'base64': base64.b64encode(get_image((1024, 1024))).decode('ascii')}}]
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, preprocess_config={'max_side': 64}) as clarifai:
+        response = clarifai.models.predict(inputs, 'general-image-recognition')
+
+    sent = response.response.dict['outputs'][0]['input']['data']['image']['base64']
+
+    assert open_image(base64.b64decode(sent)).size == (64, 64)
+
+
+def test_async_predict_sends_the_processed_image(async_transport):
+    inputs = [{'image': {'base64': base64.b64encode(get_image((1024, 1024))).decode('ascii')}}]
+
+    async def run():
+        async with AsyncClarifaiApi(
+            'token', app_id='fake-app', transport=async_transport, preprocess_config={'max_side': 64}
+        ) as clarifai:
+            return await clarifai.models.predict(inputs, 'general-image-recognition')
+
+    sent = asyncio.run(run()).response.dict['outputs'][0]['input']['data']['image']['base64']
+
+    assert open_image(base64.b64decode(sent)).size == (64, 64)
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.errors import UserError
+from clarifai_python_sdk.utils.json_codec import JsonCodec, OrjsonCodec, get_json_codec, orjson
+
+
+BODY = {
+    'inputs': [{'data': {'image': {'base64': 'aGVsbG8=' * 100}, 'metadata': {'label': 'é', 'score': 0.25}}}],
+    'model': {'output_info': {'output_config': {'max_concepts': 3, 'select_concepts': None}}},
+    'flags': [True, False]
+}
+
+CODECS = [JsonCodec()] + ([OrjsonCodec()] if orjson is not None else [])
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=lambda codec: codec.name)
+def test_round_trip(codec):
+    data = codec.dumps(BODY)
+
+    assert isinstance(data, bytes)
+    assert codec.loads(data) == BODY
+    assert codec.loads(data.decode('utf-8')) == BODY
+    assert json.loads(codec.dumps_to_str(BODY, pretty=True)) == BODY
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=lambda codec: codec.name)
+def test_codecs_agree(codec):
+    assert codec.loads(JsonCodec().dumps(BODY)) == JsonCodec().loads(codec.dumps(BODY))
+
+
+def test_get_json_codec():
+    codec = JsonCodec()
+
+    assert get_json_codec(codec) is codec
+    assert get_json_codec('json').name == 'json'
+    assert get_json_codec('auto').name == ('orjson' if orjson is not None else 'json')
+
+    with pytest.raises(UserError):
+        get_json_codec('ujson')
+
+
+@pytest.mark.skipif(orjson is not None, reason='orjson is installed')
+def test_orjson_requires_the_package():
+    with pytest.raises(UserError):
+        get_json_codec('orjson')
+
+
+def test_client_encodes_bodies_with_its_codec(api_server):
+    inputs = [input['data'] for input in BODY['inputs']] # predict wraps each one into {'data': ...}
+
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url, json_codec='json') as clarifai:
+        response = clarifai.models.predict(inputs, 'general-image-recognition')
+
+    assert response.response.status_code == 10000
+    assert json.loads(api_server.requests[0].body)['inputs'] == BODY['inputs']
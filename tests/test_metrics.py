@@ -0,0 +1,106 @@
+import re
+
+import pytest
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.fake_server import FakeClarifaiServer
+from clarifai_python_sdk.hooks import RequestEvent
+from clarifai_python_sdk.metrics import build_latency_buckets, LatencyHistogram, MetricsRegistry
+from clarifai_python_sdk.constants import DEFAULT_METRICS_CONFIG
+
+
+def get_event(duration: float, app_id: str = 'app', **request_info) -> RequestEvent:
+    return RequestEvent(
+        endpoint_index_name='apps_with_app_id',
+        method='GET',
+        path_variables={'app_id': app_id},
+        duration=duration,
+        timings={},
+        request_info={'http_status': 200, 'attempts': 1, **request_info},
+        clarifai_status=10000
+    )
+
+
+def test_latency_buckets():
+    buckets = build_latency_buckets(DEFAULT_METRICS_CONFIG)
+
+    assert buckets[0] == 0.001
+    assert buckets[2] == 0.002
+    assert buckets[-2] < 120 <= buckets[-1]
+    assert all(upper / lower == pytest.approx(2 ** 0.5, rel=1e-3) for lower, upper in zip(buckets, buckets[1:]))
+
+
+def test_histogram_percentiles_stay_within_their_bucket():
+    histogram = LatencyHistogram(build_latency_buckets(DEFAULT_METRICS_CONFIG))
+
+    for idx in range(1, 101):
+        histogram.observe(idx / 100)
+
+    assert histogram.count == 100
+    assert histogram.sum == pytest.approx(50.5)
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.42)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.42)
+    assert histogram.percentile(100) == histogram.max == 1
+    assert sum(histogram.as_dict()['buckets'].values()) == 100
+    assert LatencyHistogram((1, 2)).percentile(50) is None
+
+
+def test_slow_requests_land_in_the_inf_bucket():
+    histogram = LatencyHistogram((0.1, 1))
+    histogram.observe(5)
+
+    assert histogram.counts == [0, 0, 1]
+    assert 1 < histogram.percentile(50) < 5 # interpolated between the last bound and the max
+    assert histogram.percentile(100) == 5
+
+
+def test_prometheus_exposition():
+    metrics = MetricsRegistry({'namespace': 'test', 'min_latency': 0.01, 'max_latency': 1})
+
+    metrics.record(get_event(0.02))
+    metrics.record(get_event(0.5, attempts=3, request_bytes_sent=100))
+    metrics.record(get_event(2, app_id='other "app"', http_status=503))
+
+    text  = metrics.to_prometheus()
+    lines = text.splitlines()
+
+    assert '# TYPE test_requests_total counter' in lines
+    assert '# TYPE test_request_duration_seconds histogram' in lines
+    assert 'test_requests_total{endpoint="apps_with_app_id",app_id="app"} 2' in lines
+    assert 'test_retries_total{endpoint="apps_with_app_id",app_id="app"} 2' in lines
+    assert 'test_sent_bytes_total{endpoint="apps_with_app_id",app_id="app"} 100' in lines
+    assert 'test_errors_total{endpoint="apps_with_app_id",app_id="other \\"app\\"",kind="http_503"} 1' in lines
+
+    buckets = [
+        int(line.rsplit(' ', 1)[1]) for line in lines
+        if line.startswith('test_request_duration_seconds_bucket{endpoint="apps_with_app_id",app_id="app"')
+    ]
+
+    assert buckets == sorted(buckets)
+    assert buckets[-1] == 2
+    assert 'test_request_duration_seconds_bucket{endpoint="apps_with_app_id",app_id="app",le="+Inf"} 2' in lines
+    assert 'test_request_duration_seconds_count{endpoint="apps_with_app_id",app_id="app"} 2' in lines
+    assert all(re.fullmatch(r'(# (HELP|TYPE) .+|test_\w+\{.*\} [\d.e+-]+)', line) for line in lines)
+
+
+def test_client_metrics():
+    server = FakeClarifaiServer({'seed': 1, 'error_rate': 1})
+
+    with ClarifaiApi(
+        'token', app_id='fake-app', transport=server.transport(), metrics_config={}, retry_config={'max_attempts': 1}
+    ) as clarifai:
+        clarifai.apps.get('fake-app')
+        server.fake_server_config['error_rate'] = 0
+
+        for _ in range(3):
+            clarifai.models.predict([{'image': {'url': 'https://samples.clarifai.com/metro-north.jpg'}}], 'general-image-recognition')
+
+        snapshot = clarifai.metrics.snapshot()
+
+    assert snapshot['apps_with_app_id']['fake-app']['errors'] == {'http_503': 1}
+    assert snapshot['models__predict_without_version_id']['fake-app']['requests'] == 3
+    assert snapshot['models__predict_without_version_id']['fake-app']['latency']['count'] == 3
+
+    clarifai.metrics.reset()
+
+    assert clarifai.metrics.snapshot() == {}
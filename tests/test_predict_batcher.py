@@ -0,0 +1,122 @@
+import time, asyncio
+
+import pytest
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.errors import DeadlineExceededError
+
+
+INPUT = {'image': {'url': 'https://samples.clarifai.com/metro-north.jpg'}}
+
+
+def get_input(idx: int) -> dict:
+    return {'image': {'url': f'https://example.com/{idx}.jpg'}}
+
+
+def get_url(output: dict) -> str:
+    return output['input']['data']['image']['url']
+
+
+def test_batches_concurrent_inputs(transport, fake_server):
+    with ClarifaiApi('token', transport=transport, predict_batcher_config={'max_batch_size': 8}) as clarifai:
+        futures = [clarifai.predict_batcher.submit(get_input(idx), 'general-image-recognition') for idx in range(20)]
+        outputs = [future.result(5) for future in futures]
+
+        assert clarifai.predict_batcher.stats()['inputs'] == 20
+
+    assert [get_url(output) for output in outputs] == [f'https://example.com/{idx}.jpg' for idx in range(20)]
+    assert fake_server.requests['models__predict_without_version_id'] == 3
+
+
+def test_groups_are_sent_after_max_wait(transport, fake_server):
+    with ClarifaiApi('token', transport=transport, predict_batcher_config={'max_wait': 0.01}) as clarifai:
+        output = clarifai.predict_batcher.predict(INPUT, 'general-image-recognition', timeout=5)
+
+    assert get_url(output) == INPUT['image']['url']
+    assert fake_server.requests['models__predict_without_version_id'] == 1
+
+
+def test_models_are_not_mixed(transport, fake_server):
+    with ClarifaiApi('token', transport=transport) as clarifai:
+        futures = [
+            clarifai.predict_batcher.submit(get_input(idx), model_id)
+            for idx in range(4) for model_id in ('general-image-recognition', 'my-model')
+        ]
+
+        for future in futures:
+            future.result(5)
+
+    assert fake_server.requests['models__predict_without_version_id'] == 2
+
+
+def test_sends_the_credentials_of_the_caller(transport):
+    with ClarifaiApi('default-token', transport=transport) as clarifai:
+        clarifai.predict_batcher.predict(INPUT, 'general-image-recognition', auth_object={'token': 'OTHER'}, timeout=5)
+        clarifai.predict_batcher.predict(INPUT, 'general-image-recognition', timeout=5)
+
+    assert [headers['Authorization'] for headers in transport.headers] == ['Key OTHER', 'Key default-token']
+
+
+def test_request_errors_reach_every_future(transport):
+    transport.fail = lambda attempt, data: True
+
+    with ClarifaiApi('token', transport=transport, retry_config={'max_attempts': 1}) as clarifai:
+        futures = [clarifai.predict_batcher.submit(get_input(idx), 'general-image-recognition') for idx in range(3)]
+
+        for future in futures:
+            with pytest.raises(ConnectionError):
+                future.result(5)
+
+
+def test_timeout_raises_deadline_exceeded(transport, fake_server):
+    fake_server.fake_server_config['latency'] = 0.5
+
+    with ClarifaiApi('token', transport=transport) as clarifai:
+        started = time.monotonic()
+
+        with pytest.raises(DeadlineExceededError):
+            clarifai.predict_batcher.predict(INPUT, 'general-image-recognition', timeout=0.05)
+
+        assert time.monotonic() - started < 0.4
+
+
+def test_async_batches_concurrent_inputs(async_transport, fake_server):
+    async def run():
+        async with AsyncClarifaiApi('token', transport=async_transport) as clarifai:
+            return await asyncio.gather(*(
+                clarifai.predict_batcher.predict(get_input(idx), 'general-image-recognition') for idx in range(10)
+            ))
+
+    outputs = asyncio.run(run())
+
+    assert [get_url(output) for output in outputs] == [f'https://example.com/{idx}.jpg' for idx in range(10)]
+    assert fake_server.requests['models__predict_without_version_id'] == 1
+
+
+def test_async_sends_the_credentials_of_the_caller(async_transport):
+    async def run():
+        async with AsyncClarifaiApi('default-token', transport=async_transport) as clarifai:
+            return await asyncio.gather(
+                clarifai.predict_batcher.predict(INPUT, 'general-image-recognition', auth_object={'token': 'OTHER'}),
+                clarifai.predict_batcher.predict(INPUT, 'general-image-recognition')
+            )
+
+    asyncio.run(run())
+
+    assert sorted(headers['Authorization'] for headers in async_transport.headers) == ['Key OTHER', 'Key default-token']
+
+
+def test_async_timeout_raises_deadline_exceeded(async_transport, fake_server):
+    fake_server.fake_server_config['latency'] = 0.5
+
+    async def run():
+        async with AsyncClarifaiApi('token', transport=async_transport) as clarifai:
+            started = time.monotonic()
+
+            with pytest.raises(DeadlineExceededError):
+                await clarifai.predict_batcher.predict(INPUT, 'general-image-recognition', timeout=0.05)
+
+            return time.monotonic() - started
+
+    assert asyncio.run(run()) < 0.4
@@ -0,0 +1,109 @@
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.fake_server import FakeClarifaiServer
+
+
+PREDICT_ENDPOINTS = ('models__predict', 'models__predict_without_version_id')
+
+
+def get_inputs(count: int, offset: int = 0) -> list:
+    return [{'image': {'url': f'https://example.com/{idx}.jpg'}} for idx in range(offset, offset + count)]
+
+
+def get_urls(response_wrapper) -> list:
+    return [output['input']['data']['image']['url'] for output in response_wrapper.response.dict['outputs']]
+
+
+def count_predicts(server: FakeClarifaiServer) -> int:
+    return sum(server.requests[endpoint] for endpoint in PREDICT_ENDPOINTS)
+
+
+def test_only_misses_are_sent(transport, fake_server):
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, predict_cache_config={}) as clarifai:
+        clarifai.models.predict(get_inputs(2), 'general-image-recognition', 'v1')
+        response = clarifai.models.predict(get_inputs(4), 'general-image-recognition', 'v1')
+
+        assert get_urls(response) == [input['image']['url'] for input in get_inputs(4)]
+        assert count_predicts(fake_server) == 2
+        assert clarifai.predict_cache.stats()['hits'] == 2
+        assert clarifai.predict_cache.stats()['misses'] == 4
+
+        clarifai.models.predict(get_inputs(4), 'general-image-recognition', 'v1')
+
+    assert count_predicts(fake_server) == 2
+
+
+def test_output_config_is_part_of_the_key(transport, fake_server):
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, predict_cache_config={}) as clarifai:
+        clarifai.models.predict(get_inputs(2), 'general-image-recognition', 'v1')
+        clarifai.models.predict(get_inputs(2), 'general-image-recognition', 'v1', output_config={'max_concepts': 5})
+        clarifai.models.predict(get_inputs(2), 'general-image-recognition', 'v1', output_config={'max_concepts': 5})
+
+    assert count_predicts(fake_server) == 2
+
+
+def test_predict_all_is_served_from_the_cache(transport, fake_server):
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, predict_cache_config={}) as clarifai:
+        clarifai.models.predict(get_inputs(10), 'general-image-recognition', 'v1')
+        results = clarifai.models.predict_all(get_inputs(20), 'general-image-recognition', 'v1', batch_size=10)
+
+    assert all(result.ok for result in results)
+    assert count_predicts(fake_server) == 2
+
+
+def test_unpinned_predicts_are_not_cached_by_default(transport, fake_server):
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, predict_cache_config={}) as clarifai:
+        clarifai.models.predict(get_inputs(2), 'general-image-recognition')
+        clarifai.models.predict(get_inputs(2), 'general-image-recognition')
+
+    assert count_predicts(fake_server) == 2
+
+
+def test_apps_do_not_share_entries(transport, fake_server):
+    other_app = {'token': 'token', 'user_app_id': {'user_id': 'me', 'app_id': 'other-app'}}
+
+    with ClarifaiApi(
+        'token', app_id='fake-app', transport=transport, predict_cache_config={'cache_unpinned': True}
+    ) as clarifai:
+        clarifai.models.predict(get_inputs(2), 'my-model')
+        clarifai.models.predict(get_inputs(2), 'my-model', None, other_app)
+        clarifai.models.predict(get_inputs(2), 'my-model', None, {'token': 'other-token'})
+
+        assert count_predicts(fake_server) == 3
+
+        clarifai.models.predict(get_inputs(2), 'my-model', None, other_app)
+
+    assert count_predicts(fake_server) == 3
+
+
+def test_positional_auth_object(transport):
+    with ClarifaiApi('token', app_id='fake-app', transport=transport) as clarifai:
+        response = clarifai.models.predict(get_inputs(1), 'general-image-recognition', None, {'token': 'other-token'})
+
+    assert response.response.dict['status']['code'] == 10000
+    assert transport.headers[-1]['Authorization'] == 'Key other-token'
+
+
+def test_train_invalidates_unpinned_outputs(transport, fake_server):
+    with ClarifaiApi(
+        'token', app_id='fake-app', transport=transport, predict_cache_config={'cache_unpinned': True}
+    ) as clarifai:
+        clarifai.models.predict(get_inputs(2), 'general-image-recognition')
+        clarifai.models.train('general-image-recognition')
+        clarifai.models.predict(get_inputs(2), 'general-image-recognition')
+
+    assert count_predicts(fake_server) == 2
+
+
+def test_disk_tier_is_shared_across_clients(tmp_path, transport, fake_server):
+    config = {'disk': True, 'directory': str(tmp_path)}
+
+    for _ in range(2):
+        with ClarifaiApi('token', app_id='fake-app', transport=transport, predict_cache_config=config) as clarifai:
+            clarifai.models.predict(get_inputs(3), 'general-image-recognition', 'v1')
+
+    assert count_predicts(fake_server) == 1
+
+    with ClarifaiApi('token', app_id='other-app', transport=transport, predict_cache_config=config) as clarifai:
+        clarifai.models.predict(get_inputs(3), 'general-image-recognition', 'v1')
+
+    assert count_predicts(fake_server) == 2
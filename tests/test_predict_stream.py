@@ -0,0 +1,92 @@
+import asyncio
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+
+
+class CountingInputs:
+    """
+    Generator of `count` inputs keeping track of how many were read
+    """
+
+    def __init__(self, count: int):
+        self.count = count
+        self.read  = 0
+
+    def __iter__(self):
+        for idx in range(self.count):
+            self.read += 1
+            yield {'image': {'url': f'https://example.com/{idx}.jpg'}}
+
+
+def get_url(result) -> str:
+    return result.output['input']['data']['image']['url']
+
+
+def test_inputs_are_read_as_results_are_consumed(transport, fake_server):
+    inputs = CountingInputs(1000)
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport) as clarifai:
+        stream = clarifai.models.predict_stream(inputs, 'general-image-recognition', batch_size=10, max_workers=2)
+
+        first = next(stream)
+
+        # the batches in flight and those held back by the reorder buffer (max_workers by default)
+        assert first.index == 0
+        assert inputs.read <= 4 * 10
+        assert fake_server.requests['models__predict_without_version_id'] <= 4
+
+        stream.close()
+
+
+def test_in_flight_batches_are_bounded(transport, fake_server):
+    fake_server.fake_server_config['latency_jitter'] = 0.01
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport) as clarifai:
+        results = list(
+            clarifai.models.predict_stream(CountingInputs(200), 'general-image-recognition', batch_size=10, max_workers=3)
+        )
+
+    assert [result.index for result in results] == list(range(200))
+    assert [get_url(result) for result in results] == [f'https://example.com/{idx}.jpg' for idx in range(200)]
+    assert 1 < transport.max_in_flight <= 3
+
+
+def test_unordered_stream_yields_every_input(transport, fake_server):
+    fake_server.fake_server_config['latency_jitter'] = 0.01
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport) as clarifai:
+        results = list(clarifai.models.predict_stream(
+            CountingInputs(100), 'general-image-recognition', batch_size=10, max_workers=4, ordered=False
+        ))
+
+    assert sorted(result.index for result in results) == list(range(100))
+    assert all(result.ok for result in results)
+
+
+def test_failed_batch_is_yielded_as_errors(transport):
+    transport.fail = lambda attempt, data: attempt == 1
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, retry_config={'max_attempts': 1}) as clarifai:
+        results = list(
+            clarifai.models.predict_stream(CountingInputs(20), 'general-image-recognition', batch_size=10, max_workers=1)
+        )
+
+    assert [result.ok for result in results] == [False] * 10 + [True] * 10
+
+
+def test_async_stream_is_bounded(async_transport, fake_server):
+    fake_server.fake_server_config['latency_jitter'] = 0.01
+
+    async def run():
+        async with AsyncClarifaiApi('token', app_id='fake-app', transport=async_transport) as clarifai:
+            return [
+                result async for result in clarifai.models.predict_stream(
+                    CountingInputs(100), 'general-image-recognition', batch_size=10, max_workers=3
+                )
+            ]
+
+    results = asyncio.run(run())
+
+    assert [result.index for result in results] == list(range(100))
+    assert 1 < async_transport.max_in_flight <= 3
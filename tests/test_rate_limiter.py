@@ -0,0 +1,163 @@
+import time, asyncio
+
+import pytest
+
+from clarifai_python_sdk import rate_limiter as rate_limiter_module
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.rate_limiter import TokenBucket, RateLimiter
+from clarifai_python_sdk.deadline import Deadline
+from clarifai_python_sdk.errors import UserError, DeadlineExceededError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter_module.time, 'monotonic', clock)
+
+    return clock
+
+
+def test_bucket_reserves_ahead(clock):
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2) # callers queue up behind the first one
+
+
+def test_bucket_refills_up_to_capacity(clock):
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    bucket.reserve(2)
+    clock.now += 0.1
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1)
+
+    clock.now += 60 # never more than a burst
+
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() > 0
+
+
+def test_one_bucket_per_token_and_endpoint_weights(clock):
+    rate_limiter = RateLimiter({'requests_per_second': 10, 'burst': 4, 'endpoint_weights': {'models__predict': 4}})
+
+    assert rate_limiter.reserve('token', 'models__predict') == 0.0
+    assert rate_limiter.reserve('token', 'apps') == pytest.approx(0.1)
+    assert rate_limiter.reserve('other-token', 'apps') == 0.0
+
+
+def test_acquire_fails_fast_past_the_deadline(clock):
+    rate_limiter = RateLimiter({'requests_per_second': 1, 'burst': 1})
+
+    assert rate_limiter.acquire('token') == 0.0
+
+    with pytest.raises(DeadlineExceededError):
+        rate_limiter.acquire('token', deadline=Deadline(0.5)) # would have to wait 1s
+
+    # the reservation was given back, the next caller waits for one token only
+    assert rate_limiter.reserve('token', 'apps') == pytest.approx(1.0)
+
+
+def test_client_requests_are_paced(api_server):
+    rate_limit_config = {'requests_per_second': 20, 'burst': 2}
+
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url, rate_limit_config=rate_limit_config) as clarifai:
+        started_at = time.monotonic()
+
+        for _ in range(6):
+            clarifai.apps.list()
+
+    assert time.monotonic() - started_at >= 0.2 - 0.01
+    assert len(api_server.requests) == 6
+
+
+def test_empty_config_enables_the_defaults():
+    assert ClarifaiApi('token', rate_limit_config={})._http_client.rate_limiter is not None
+    assert ClarifaiApi('token')._http_client.rate_limiter is None
+
+
+@pytest.mark.parametrize('rate_limit_config', [
+    {'requests_per_second': 0},
+    {'burst': 0},
+    {'requests_per_second': -1},
+    {'endpoint_weights': {'models__predict': -1}}
+])
+def test_invalid_config_is_rejected(rate_limit_config):
+    with pytest.raises(UserError):
+        RateLimiter(rate_limit_config)
+
+
+def test_every_attempt_takes_a_token(transport):
+    transport.fail = lambda attempt, data: attempt == 1
+    events         = []
+
+    # refills too slowly to matter during the test
+    rate_limit_config = {'requests_per_second': 0.001, 'burst': 10, 'endpoint_weights': {'apps': 2}}
+
+    with ClarifaiApi(
+        'token', app_id='fake-app', transport=transport, hooks=[events.append],
+        rate_limit_config=rate_limit_config, retry_config={'backoff_factor': 0}
+    ) as clarifai:
+        clarifai.apps.list()
+
+        assert clarifai._http_client.rate_limiter._buckets['token'].tokens == pytest.approx(10 - 2 * 2, abs=0.01)
+
+    assert transport.attempts == 2
+    assert 'rate_limit_wait' in events[0].timings
+
+
+def test_async_attempts_take_tokens(async_transport):
+    async_transport.fail = lambda attempt, data: attempt == 1
+
+    async def run():
+        async with AsyncClarifaiApi(
+            'token', app_id='fake-app', transport=async_transport,
+            rate_limit_config={'requests_per_second': 0.001, 'burst': 10}, retry_config={'backoff_factor': 0}
+        ) as clarifai:
+            await clarifai.apps.list()
+
+            return clarifai._http_client.rate_limiter._buckets['token'].tokens
+
+    assert asyncio.run(run()) == pytest.approx(8, abs=0.01)
+
+
+def test_requests_do_not_wait_past_their_timeout(transport):
+    with ClarifaiApi(
+        'token', app_id='fake-app', transport=transport, rate_limit_config={'requests_per_second': 1, 'burst': 1}
+    ) as clarifai:
+        clarifai.apps.list()
+        started_at = time.monotonic()
+
+        with pytest.raises(DeadlineExceededError):
+            clarifai.apps.list(timeout=0.5)
+
+        assert time.monotonic() - started_at < 0.1
+
+    assert transport.attempts == 1
+
+
+def test_async_requests_do_not_wait_past_their_timeout(async_transport):
+    async def run():
+        async with AsyncClarifaiApi(
+            'token', app_id='fake-app', transport=async_transport, rate_limit_config={'requests_per_second': 1, 'burst': 1}
+        ) as clarifai:
+            await clarifai.apps.list()
+            await clarifai.apps.list(timeout=0.5)
+
+    started_at = time.monotonic()
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(run())
+
+    assert time.monotonic() - started_at < 0.5
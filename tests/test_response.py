@@ -0,0 +1,53 @@
+import json
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.response import ResponseWrapper
+
+
+RESPONSE = {
+    'status': {'code': 10000, 'description': 'Ok'},
+    'inputs': [{'id': str(idx), 'data': {'image': {'url': f'https://example.com/{idx}.jpg'}}} for idx in range(3)]
+}
+
+
+def test_views_are_not_deep_copies():
+    response = ResponseWrapper({}, response_dict=RESPONSE).response
+
+    assert response.status_code == 10000
+    assert response.description == 'Ok'
+    assert response.dict == RESPONSE
+    assert response.dict['inputs'] is RESPONSE['inputs']
+    assert response.data == {'inputs': RESPONSE['inputs']}
+    assert response.data['inputs'] is RESPONSE['inputs']
+
+
+def test_views_are_built_once():
+    response = ResponseWrapper({}, response_dict=RESPONSE).response
+
+    assert 'json' not in response.__dict__
+    assert response.json is response.json
+    assert response.dict is response.dict
+
+
+def test_json_rendering():
+    assert json.loads(ResponseWrapper({}, response_dict=RESPONSE).response.json) == RESPONSE
+
+    params = {'response_config': {'pretty_print_if_json': False}}
+
+    assert '\n' not in ResponseWrapper(params, response_dict=RESPONSE).response.json
+
+    params = {'response_config': {'render_json': False}}
+
+    assert ResponseWrapper(params, response_dict=RESPONSE).response.json is None
+
+
+def test_client_responses(api_server):
+    api_server.responses.append((200, RESPONSE, {}))
+
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url, response_config={'render_json': False}) as clarifai:
+        response = clarifai.inputs.list().response
+
+    assert response.status_code == 10000
+    assert response.data == {'inputs': RESPONSE['inputs']}
+    assert response.json is None
+    assert response.endpoint_index_name == 'inputs__list' # looked up on the request object
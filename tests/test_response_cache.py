@@ -0,0 +1,159 @@
+import threading
+
+import pytest
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.cache import ResponseCache
+from clarifai_python_sdk.errors import UserError
+
+
+KEY = ('models__get_model_by_id', 'token', 'https://api.clarifai.com/v2/models/general-image-recognition')
+
+
+def get_key(model_id: str) -> tuple:
+    return ('models__get_model_by_id', 'token', f'https://api.clarifai.com/v2/models/{model_id}')
+
+
+def test_get_is_served_from_the_cache(transport, fake_server):
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, cache_config={}) as clarifai:
+        first  = clarifai.models.get_model_by_id('general-image-recognition')
+        second = clarifai.models.get_model_by_id('general-image-recognition')
+
+        assert second.response.dict == first.response.dict
+        assert second.response.request_info['cached'] is True
+        assert fake_server.requests['models__get_model_by_id'] == 1
+        assert clarifai.cache.stats()['hits'] == 1
+        assert clarifai.cache.stats()['misses'] == 1
+
+
+def test_only_listed_endpoints_are_cached(transport, fake_server):
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, cache_config={'ttls': {'apps_with_app_id': 60}}) as clarifai:
+        for _ in range(2):
+            clarifai.apps.get('fake-app')
+            clarifai.models.get_model_by_id('general-image-recognition')
+
+    assert fake_server.requests['apps_with_app_id'] == 1
+    assert fake_server.requests['models__get_model_by_id'] == 2
+
+
+def test_train_invalidates_the_model(transport, fake_server):
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, cache_config={}) as clarifai:
+        clarifai.models.get_model_by_id('general-image-recognition')
+        clarifai.models.train('general-image-recognition')
+        clarifai.models.get_model_by_id('general-image-recognition')
+
+        assert clarifai.cache.stats()['invalidations'] == 1
+
+    assert fake_server.requests['models__get_model_by_id'] == 2
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ResponseCache({'max_entries': 2})
+
+    for model_id in ('a', 'b'):
+        cache.set(get_key(model_id), 'models__get_model_by_id', 'fake-app', {'status': {'code': 10000}})
+
+    cache.get(get_key('a'))
+    cache.set(get_key('c'), 'models__get_model_by_id', 'fake-app', {'status': {'code': 10000}})
+
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['size'] == 2
+
+    for model_id in ('a', 'c', 'b'):
+        cache.get(get_key(model_id))
+
+    assert cache.stats()['hits'] == 3
+    assert cache.stats()['misses'] == 1
+
+
+def test_cached_responses_are_copies():
+    cache    = ResponseCache()
+    response = {'status': {'code': 10000}, 'model': {'id': 'a'}}
+
+    cache.set(KEY, 'models__get_model_by_id', 'fake-app', response)
+    response['model']['id'] = 'changed'
+
+    cached, _ = cache.get(KEY)
+    cached['model']['id'] = 'changed'
+
+    assert cache.get(KEY)[0] == {'status': {'code': 10000}, 'model': {'id': 'a'}}
+
+
+def test_expired_entries_are_dropped():
+    cache = ResponseCache({'ttls': {'models__get_model_by_id': 0}})
+
+    cache.set(KEY, 'models__get_model_by_id', 'fake-app', {'status': {'code': 10000}})
+    cache.get(KEY)
+
+    assert cache.stats()['expirations'] == 1
+    assert cache.stats()['size'] == 0
+
+
+def test_expired_entries_are_revalidated(transport, fake_server):
+    with ClarifaiApi(
+        'token', app_id='fake-app', transport=transport, cache_config={'ttls': {'models__get_model_by_id': 0}}
+    ) as clarifai:
+        first  = clarifai.models.get_model_by_id('general-image-recognition')
+        second = clarifai.models.get_model_by_id('general-image-recognition')
+
+        stats = clarifai.cache.stats()
+
+    assert second.response.dict == first.response.dict
+    assert stats['revalidations'] == 1
+    assert stats['not_modified'] == 1
+    assert fake_server.requests['models__get_model_by_id'] == 2
+    assert 'If-None-Match' not in transport.headers[0]
+    assert 'If-None-Match' in transport.headers[1]
+
+
+def test_sqlite_cache_is_shared_between_clients(tmp_path, transport, fake_server):
+    cache_config = {'backend': 'sqlite', 'directory': str(tmp_path)}
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, cache_config=cache_config) as clarifai:
+        first = clarifai.models.get_model_by_id('general-image-recognition')
+
+    with ClarifaiApi('token', app_id='fake-app', transport=transport, cache_config=cache_config) as clarifai:
+        second = clarifai.models.get_model_by_id('general-image-recognition')
+
+        assert clarifai.cache.stats()['backend'] == 'sqlite'
+        assert clarifai.cache.stats()['hits'] == 1
+
+    assert second.response.dict == first.response.dict
+    assert fake_server.requests['models__get_model_by_id'] == 1
+
+
+def test_sqlite_cache_does_not_store_tokens(tmp_path):
+    cache = ResponseCache({'backend': 'sqlite', 'directory': str(tmp_path)})
+
+    cache.set(KEY, 'models__get_model_by_id', 'fake-app', {'status': {'code': 10000}})
+    cache.close()
+
+    with open(tmp_path / 'responses.sqlite3', 'rb') as f:
+        assert b'token' not in f.read()
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(UserError):
+        ResponseCache({'backend': 'redis'})
+
+
+def test_counters_are_thread_safe():
+    cache = ResponseCache()
+
+    cache.set(KEY, 'models__get_model_by_id', 'fake-app', {'status': {'code': 10000}})
+
+    def lookup():
+        for _ in range(2000):
+            cache.get(KEY)
+            cache.get(get_key('missing'))
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert cache.stats()['hits'] == 16000
+    assert cache.stats()['misses'] == 16000
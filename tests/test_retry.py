@@ -0,0 +1,98 @@
+import time, asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+from clarifai_python_sdk.client import ClarifaiApi
+from clarifai_python_sdk.async_client import AsyncClarifaiApi
+from clarifai_python_sdk.retry import RetryPolicy
+
+
+UNAVAILABLE    = (503, {'status': {'code': 10020, 'description': 'Unavailable'}}, {})
+PREDICT_INPUTS = [{'data': {'image': {'url': 'https://samples.clarifai.com/metro-north.jpg'}}}]
+
+
+def test_should_retry():
+    policy = RetryPolicy({'max_attempts': 3})
+
+    assert policy.should_retry(1, 'GET', http_status=503)
+    assert policy.should_retry(1, 'GET', clarifai_status=10030)
+    assert policy.should_retry(1, 'GET', exception=ConnectionError())
+    assert not policy.should_retry(3, 'GET', http_status=503)
+    assert not policy.should_retry(1, 'GET', http_status=400)
+    assert not policy.should_retry(1, 'POST', http_status=503)
+    assert policy.should_retry(1, 'POST', idempotent=True, http_status=503)
+
+
+def test_backoff_is_bounded():
+    policy = RetryPolicy({'backoff_factor': 1, 'max_backoff': 4, 'jitter': False})
+
+    assert [policy.get_backoff(attempt) for attempt in range(1, 6)] == [1, 2, 4, 4, 4]
+
+    policy = RetryPolicy({'backoff_factor': 1, 'max_backoff': 4, 'jitter': True})
+
+    assert all(0 <= policy.get_backoff(attempt) <= 4 for attempt in range(1, 20))
+
+
+def test_retry_after_header():
+    policy = RetryPolicy({'backoff_factor': 1, 'jitter': False, 'max_retry_after': 10})
+
+    assert policy.get_backoff(1, '7') == 7
+    assert policy.get_backoff(1, '600') == 10
+    assert 3 < policy.get_backoff(1, format_datetime(datetime.now(timezone.utc) + timedelta(seconds=5), usegmt=True)) <= 5
+    assert policy.get_backoff(1, 'not a date') == 1
+
+
+def test_unavailable_responses_are_retried(api_server):
+    api_server.responses.extend([UNAVAILABLE, UNAVAILABLE])
+
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url, retry_config={'backoff_factor': 0}) as clarifai:
+        response = clarifai.apps.list()
+
+    assert response.response.status_code == 10000
+    assert len(api_server.requests) == 3
+
+
+def test_retry_after_is_respected(api_server):
+    api_server.responses.append((429, {'status': {'code': 11005}}, {'Retry-After': '0.2'}))
+
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url, retry_config={'backoff_factor': 0}) as clarifai:
+        started_at = time.monotonic()
+        clarifai.apps.list()
+
+    assert time.monotonic() - started_at >= 0.2
+    assert len(api_server.requests) == 2
+
+
+def test_gives_up_after_max_attempts(api_server):
+    api_server.responses.extend([UNAVAILABLE] * 3)
+
+    with ClarifaiApi(
+        'token', app_id='app', base_url=api_server.base_url, retry_config={'backoff_factor': 0, 'max_attempts': 2}
+    ) as clarifai:
+        response = clarifai.apps.list()
+
+    assert response.response.status_code == 10020
+    assert len(api_server.requests) == 2
+
+
+def test_only_idempotent_requests_are_retried(api_server):
+    api_server.responses.extend([UNAVAILABLE, UNAVAILABLE])
+
+    with ClarifaiApi('token', app_id='app', base_url=api_server.base_url, retry_config={'backoff_factor': 0}) as clarifai:
+        assert clarifai.apps.create('new-app').response.status_code == 10020
+        assert clarifai.models.predict(PREDICT_INPUTS, 'general-image-recognition').response.status_code == 10000
+
+    assert [request.method for request in api_server.requests] == ['POST', 'POST', 'POST']
+
+
+def test_async_client_retries(api_server):
+    api_server.responses.append(UNAVAILABLE)
+
+    async def run():
+        async with AsyncClarifaiApi(
+            'token', app_id='app', base_url=api_server.base_url, retry_config={'backoff_factor': 0}
+        ) as clarifai:
+            return await clarifai.apps.list()
+
+    assert asyncio.run(run()).response.status_code == 10000
+    assert len(api_server.requests) == 2
@@ -0,0 +1,37 @@
+import pytest
+
+from clarifai_python_sdk.utils.url_handler import UrlHandler, encode_url_value
+
+
+def test_encode_url_value():
+    assert encode_url_value('general-image-recognition') == 'general-image-recognition'
+    assert encode_url_value('a b/c?d') == 'a%20b%2Fc%3Fd'
+    assert encode_url_value('é') == '%C3%A9'
+    assert encode_url_value(3) == '3'
+
+
+def test_build_encodes_path_variables():
+    url = UrlHandler.build('models__get_model_by_id', {'app_id': 'my app', 'model_id': 'a/b'})
+
+    assert url == '/v2/users/me/apps/my%20app/models/a%2Fb'
+
+
+def test_build_query_params():
+    url = UrlHandler.build(
+        'inputs__list', {'user_id': 'me', 'app_id': 'app'}, {'page': 2, 'per_page': 100, 'status': None, 'q': 'x&y'}
+    )
+
+    assert url == '/v2/users/me/apps/app/inputs?page=2&per_page=100&q=x%26y'
+
+
+def test_build_is_not_cached_across_values():
+    assert UrlHandler.build('apps_with_app_id', {'user_id': 'me', 'app_id': 'a'}).endswith('/apps/a')
+    assert UrlHandler.build('apps_with_app_id', {'user_id': 'me', 'app_id': 'b'}).endswith('/apps/b')
+
+
+def test_build_requires_every_path_variable():
+    with pytest.raises(KeyError):
+        UrlHandler.build('apps_with_app_id', {'user_id': 'me'})
+
+    with pytest.raises(KeyError):
+        UrlHandler.build('apps_with_app_id', {'user_id': 'me', 'app_id': None})